@@ -11,12 +11,32 @@ a = Analysis(
     hiddenimports=[
         "matplotlib.backends.backend_qtagg",
         "matplotlib.backends.backend_agg",
+        # 그래프 backend는 설정에 따라 지연 import
+        "src.ui.widgets.mpl_graph_panel",
+        "src.ui.widgets.native_graph_panel",
+        # 시작 시간 단축을 위해 처음 사용할 때 import하는 모듈
+        "src.config.mpl_config",
+        "src.utils.data_processor_tuning",
+        "src.utils.tuning_cache",
         "numpy",
         "PyQt6",
     ],
     hookspath=[],
     runtime_hooks=[],
-    excludes=[],
+    # 사용하지 않는 GUI 툴킷 / 개발 도구 제외 → 배포 크기와 시작 시 압축 해제 / import 시간 감소
+    excludes=[
+        "tkinter",
+        "matplotlib.backends.backend_tkagg",
+        "matplotlib.backends.backend_tkcairo",
+        "matplotlib.backends._backend_tk",
+        "PyQt5",
+        "PySide2",
+        "PySide6",
+        "IPython",
+        "pytest",
+        "pandas",
+        "scipy",
+    ],
     win_no_prefer_redirects=False,
     win_private_assemblies=False,
     cipher=block_cipher,
@@ -1,19 +1,32 @@
 import sys
-from PyQt6.QtWidgets import QApplication
-from src.ui.main_window import PLCMonitoringApp
-from src.config.mpl_config import setup_korean_font
+from src.utils.startup_profiler import get_startup_profiler
+
+profiler = get_startup_profiler()
+
+with profiler.phase("import PyQt6"):
+    from PyQt6.QtWidgets import QApplication
+    from PyQt6.QtCore import QTimer
+with profiler.phase("import main_window"):
+    from src.ui.main_window import PLCMonitoringApp
 
 def main():
-    app = QApplication(sys.argv)
-    
+    # 창을 먼저 표시 → 그래프 backend(matplotlib) import / 그래프 생성은 표시 후 (TemperatureGraphWidget.ensure_panels)
+    # PLC 연결 / 로그 파일은 사용할 때 처음 연결 / 생성
+    with profiler.phase("QApplication"):
+        app = QApplication(sys.argv)
+
     # 스타일시트 적용 (UTF-8 인코딩 지정)
-    with open('src/ui/styles/style.css', 'r', encoding='utf-8') as f:
-        app.setStyleSheet(f.read())
-    
-    window = PLCMonitoringApp()
-    window.show()
+    with profiler.phase("stylesheet"):
+        with open('src/ui/styles/style.css', 'r', encoding='utf-8') as f:
+            app.setStyleSheet(f.read())
+
+    with profiler.phase("main window"):
+        window = PLCMonitoringApp()
+        profiler.watch_first_paint(window)
+        window.show()
+    # 그래프 생성(showEvent에서 예약)이 끝난 뒤 결과 출력
+    QTimer.singleShot(0, lambda: (profiler.mark("ready"), profiler.report()))
     sys.exit(app.exec())
 
 if __name__ == '__main__':
-    setup_korean_font()
-    main()
\ No newline at end of file
+    main()
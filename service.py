@@ -0,0 +1,123 @@
+# service.py
+"""
+GUI 없이 트리거 감시 / 온도 CSV 로깅 / 튜닝만 실행 (무인 설비 PC 24시간 운전용)
+
+사용 예:
+    python service.py
+    python service.py --ip 172.22.80.1 --interval 1.0
+
+- PyQt6 / matplotlib을 import하지 않음 (디스플레이 서버 / Qt event loop 불필요)
+- AcquisitionEngine.run(): 고정 주기 poll, Ctrl+C / SIGTERM으로 종료 (로깅 중인 CSV는 닫고 종료)
+- 연결 실패 / 연속 통신 오류(MAX_COMM_ERRORS) 시 RECONNECT_INTERVAL마다 재연결
+- SIGUSR1 (Linux): 최근 FINS 프레임 trace 파일 저장 (통신 오류 시에는 자동 저장)
+"""
+import argparse
+import signal
+import sys
+import threading
+import time
+
+from src.communication.comm_stats import format_percentiles, format_summary
+from src.communication.plc_connector import PLCConnector
+from src.config.settings import ACQUISITION_SETTINGS, COMM_STATS_SETTINGS, PLC_SETTINGS
+from src.utils.acquisition_engine import AcquisitionEngine
+from src.utils.logger_config import setup_logger
+
+logger = setup_logger('service')
+
+
+class ServiceListener:
+    """GUI 대신 주요 이벤트를 로그로 남김"""
+    def on_new_params(self, temp_area, values):
+        logger.info(f"{temp_area} 새 파라미터: {values}")
+
+    def on_run_started(self, temp_area, zones, run_buffer):
+        logger.info(f"{temp_area} 온도 로깅 시작: {run_buffer.file_path}")
+
+    def on_run_completed(self, tube_id, job_id, normal_rows, high_rows):
+        logger.info(f"T{tube_id} job {job_id} 완료: normal {sample_count(normal_rows)}행, high {sample_count(high_rows)}행")
+
+
+def sample_count(run):
+    """RunBuffer 또는 CSV rows(0번: 헤더)의 샘플 수"""
+    if hasattr(run, "length"):
+        return run.length
+    return max(len(run) - 1, 0)
+
+
+def connect_until(connector, args, stop_event):
+    """연결될 때까지 재시도 (종료 요청 시 False)"""
+    while not stop_event.is_set():
+        if connector.connect(ip_address=args.ip, plc_port=args.port, plc_node=args.plc_node, pc_node=args.pc_node):
+            return True
+        connector.disconnect()  # 실패한 연결의 소켓 정리
+        logger.warning(f"PLC 연결 실패 → {ACQUISITION_SETTINGS['RECONNECT_INTERVAL']}s 후 재시도")
+        stop_event.wait(ACQUISITION_SETTINGS['RECONNECT_INTERVAL'])
+    return False
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="온도 로깅 / 튜닝 서비스 (GUI 없음)")
+    parser.add_argument("--ip", default=PLC_SETTINGS['DEFAULT_IP'])
+    parser.add_argument("--port", type=int, default=PLC_SETTINGS['DEFAULT_PORT'])
+    parser.add_argument("--plc-node", type=int, default=PLC_SETTINGS['DEFAULT_PLC_NODE'])
+    parser.add_argument("--pc-node", type=int, default=PLC_SETTINGS['DEFAULT_PC_NODE'])
+    parser.add_argument("--interval", type=float, default=ACQUISITION_SETTINGS['POLL_INTERVAL'], help="poll 주기 (초)")
+    args = parser.parse_args(argv)
+
+    stop_event = threading.Event()
+
+    def request_stop(signum, frame):
+        logger.info(f"종료 요청 (signal {signum})")
+        stop_event.set()
+
+    connector = PLCConnector()
+
+    def dump_trace(signum, frame):
+        if connector.fins_client is not None:
+            connector.fins_client.tracer.dump(reason=f"signal {signum}")
+
+    signal.signal(signal.SIGINT, request_stop)
+    if hasattr(signal, "SIGTERM"):
+        signal.signal(signal.SIGTERM, request_stop)
+    if hasattr(signal, "SIGUSR1"):
+        # kill -USR1 <pid>: 최근 FINS 프레임을 logs/frame_trace_*.txt로 저장
+        signal.signal(signal.SIGUSR1, dump_trace)
+
+    engine = AcquisitionEngine(connector)
+    engine.add_listener(ServiceListener())
+
+    next_stats_log = [time.monotonic() + COMM_STATS_SETTINGS['LOG_INTERVAL']]
+
+    def log_stats(engine):
+        """LOG_INTERVAL마다 통신 / poll 주기 통계 로그"""
+        now = time.monotonic()
+        if now < next_stats_log[0] or connector.fins_client is None:
+            return
+        next_stats_log[0] = now + COMM_STATS_SETTINGS['LOG_INTERVAL']
+        logger.info(f"통신 통계: {format_summary(connector.fins_client.stats.snapshot())}")
+        logger.info(
+            f"poll 주기: {format_percentiles(engine.cycle_stats.percentiles())}, 지터 {engine.cycle_stats.jitter():.1f} ms, "
+            f"소요 {format_percentiles(engine.poll_stats.percentiles())}, 주기 초과 {engine.overruns}"
+        )
+
+    def on_tick(engine):
+        log_stats(engine)
+        if engine.comm_errors < ACQUISITION_SETTINGS['MAX_COMM_ERRORS']:
+            return
+        logger.warning(f"연속 통신 오류 {engine.comm_errors}회 → 재연결")
+        connector.disconnect()
+        if connect_until(connector, args, stop_event):
+            engine.comm_errors = 0
+
+    if not connect_until(connector, args, stop_event):
+        return 0
+    try:
+        engine.run(stop_event, interval=args.interval, on_tick=on_tick)
+    finally:
+        connector.disconnect()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,152 @@
+# src/communication/comm_stats.py
+"""
+FINS 통신 통계 (FinsUDPClient 연결마다 1개)
+- 명령 코드별 RTT: 최근 WINDOW개 percentile(p50/p95/p99) + 전체 누적 log 히스토그램
+- 송수신 프레임 / byte 수 → rates()로 초당 값 계산
+- timeout / retry / 소켓 오류 / 오류 end code 횟수
+- poll 주기 / 소요 시간(LatencyStats)과 같이 보면
+  RTT가 큼 → PLC / 네트워크, RTT는 정상인데 주기 지터가 큼 → PC (event loop / CPU)
+"""
+import threading
+import time
+from bisect import bisect_right
+from collections import Counter, deque
+
+import numpy as np
+from src.config.settings import COMM_STATS_SETTINGS
+
+# RTT 히스토그램 구간 경계 (ms): 0.05ms ~ 10s log 간격, 앞뒤로 underflow / overflow 칸
+RTT_BIN_EDGES_MS = np.geomspace(0.05, 10000.0, 71).tolist()
+
+COMMAND_NAMES = {"0101": "read", "0102": "write"}
+
+
+class LatencyStats:
+    """ms 단위 지연 통계: 최근 window개 percentile + 전체 누적 히스토그램"""
+    def __init__(self, window=None):
+        self.recent = deque(maxlen=window or COMM_STATS_SETTINGS['WINDOW'])
+        self.histogram = [0] * (len(RTT_BIN_EDGES_MS) + 1)
+        self.count = 0
+        self.max = 0.0
+
+    def add(self, ms):
+        self.recent.append(ms)
+        self.histogram[bisect_right(RTT_BIN_EDGES_MS, ms)] += 1
+        self.count += 1
+        if ms > self.max:
+            self.max = ms
+
+    def percentiles(self, qs=(50, 95, 99)):
+        """최근 window 기준 percentile 목록 (값이 없으면 None)"""
+        if not self.recent:
+            return None
+        return np.percentile(np.fromiter(self.recent, dtype=np.float64), qs).tolist()
+
+    def jitter(self):
+        """최근 window 표준편차 (값 2개 미만이면 0)"""
+        if len(self.recent) < 2:
+            return 0.0
+        return float(np.std(np.fromiter(self.recent, dtype=np.float64)))
+
+    def reset_window(self):
+        self.recent.clear()
+
+
+class CommStats:
+    """
+    FinsUDPClient.send_command에서 기록
+    - UI / service 스레드에서 snapshot()으로 읽으므로 lock 사용 (기록 1회 수 us)
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.started = time.monotonic()
+        self.rtt = {}   # 명령 코드("0101" 등) → LatencyStats
+        self.frames_sent = 0
+        self.frames_received = 0
+        self.bytes_sent = 0
+        self.bytes_received = 0
+        self.timeouts = 0
+        self.retries = 0
+        self.errors = 0
+        self.end_codes = Counter()   # 오류 end code(hex) → 횟수
+
+    def record_response(self, command_code, rtt_ms, sent, received, end_code):
+        with self._lock:
+            stats = self.rtt.get(command_code)
+            if stats is None:
+                stats = self.rtt[command_code] = LatencyStats()
+            stats.add(rtt_ms)
+            self.frames_sent += 1
+            self.frames_received += 1
+            self.bytes_sent += sent
+            self.bytes_received += received
+            if end_code != "0000":
+                self.end_codes[end_code] += 1
+
+    def record_timeout(self, sent):
+        with self._lock:
+            self.frames_sent += 1
+            self.bytes_sent += sent
+            self.timeouts += 1
+
+    def record_retry(self):
+        with self._lock:
+            self.retries += 1
+
+    def record_error(self):
+        with self._lock:
+            self.errors += 1
+
+    def snapshot(self):
+        """현재 누적값 + 명령별 RTT percentile (dict)"""
+        with self._lock:
+            return {
+                "t": time.monotonic(),
+                "uptime": time.monotonic() - self.started,
+                "frames_sent": self.frames_sent,
+                "frames_received": self.frames_received,
+                "bytes_sent": self.bytes_sent,
+                "bytes_received": self.bytes_received,
+                "timeouts": self.timeouts,
+                "retries": self.retries,
+                "errors": self.errors,
+                "end_codes": dict(self.end_codes),
+                "rtt": {
+                    COMMAND_NAMES.get(code, code): {
+                        "count": stats.count,
+                        "max": stats.max,
+                        "percentiles": stats.percentiles(),
+                        "histogram": list(stats.histogram),
+                    }
+                    for code, stats in self.rtt.items()
+                },
+            }
+
+
+def rates(previous, current):
+    """snapshot 2개 사이의 초당 (송신 프레임, 수신 프레임, 송신 byte, 수신 byte)"""
+    dt = current["t"] - previous["t"]
+    if dt <= 0:
+        return 0.0, 0.0, 0.0, 0.0
+    return tuple(
+        (current[key] - previous[key]) / dt
+        for key in ("frames_sent", "frames_received", "bytes_sent", "bytes_received")
+    )
+
+
+def format_percentiles(values):
+    """[p50, p95, p99] → 'p50 1.2 / p95 3.4 / p99 5.6 ms'"""
+    if not values:
+        return "-"
+    p50, p95, p99 = values
+    return f"p50 {p50:.2f} / p95 {p95:.2f} / p99 {p99:.2f} ms"
+
+
+def format_summary(snapshot):
+    """로그 1줄 요약"""
+    rtt = ", ".join(f"{name} {format_percentiles(s['percentiles'])}" for name, s in snapshot["rtt"].items())
+    return (
+        f"RTT [{rtt or '-'}], 프레임 {snapshot['frames_sent']}/{snapshot['frames_received']}, "
+        f"timeout {snapshot['timeouts']}, retry {snapshot['retries']}, 오류 {snapshot['errors']}, "
+        f"end code {snapshot['end_codes'] or '-'}"
+    )
@@ -1,8 +1,17 @@
 import socket
+import time
+from src.communication.comm_stats import CommStats
+from src.communication.frame_trace import FRAME_OK, FrameTracer
+from src.config.settings import FRAME_TRACE_SETTINGS, PLC_SETTINGS
 from src.utils.logger_config import setup_logger
+from src.utils.plc_codec import bytes_to_words, words_to_bytes
 
 logger = setup_logger('fins_comm')
 
+# FINS/UDP 1프레임 최대 2012 bytes 기준 명령 1회 최대 word 수
+MAX_READ_WORDS = 999
+MAX_WRITE_WORDS = 996
+
 class FinsUDPClient:
     def __init__(self, plc_ip, plc_port=9600, plc_node=1, pc_node=3):
         self.plc_ip = plc_ip
@@ -11,6 +20,11 @@ class FinsUDPClient:
         self.pc_node = pc_node
         self.sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
         self.sock.settimeout(5)
+        self.retries = PLC_SETTINGS.get('RETRIES', 0)
+        self.stats = CommStats()  # 연결별 RTT / 처리량 / 오류 통계
+        self.tracer = FrameTracer(f"{plc_ip}_{plc_port}")  # 최근 프레임 원본 (오류 시 파일로 저장)
+        self.log_frames = FRAME_TRACE_SETTINGS['LOG_FRAMES']
+        self.sid = 0
         logger.info(f"FINS UDP 클라이언트 초기화: IP={plc_ip}, Port={plc_port}, PLC Node={plc_node}, PC Node={pc_node}")
 
     def close(self):
@@ -20,11 +34,13 @@ class FinsUDPClient:
             logger.info(f"소켓 연결 종료 (IP: {self.plc_ip})")
 
     def build_fins_header(self):
+        # SID는 명령마다 1씩 증가 → 응답의 SID로 timeout 후 늦게 도착한 이전 응답을 구분
+        self.sid = (self.sid + 1) & 255
         return bytearray([
             128, 0, 2, 0,
             self.plc_node, 0,
             0, self.pc_node, 0,
-            0
+            self.sid
         ])
 
     def build_read_command(self, mem_area, word_addr, bit_offset, word_count=1):
@@ -51,59 +67,161 @@ class FinsUDPClient:
             data_hi, data_lo
         ])
 
+    def build_write_block_command(self, mem_area, word_addr, words):
+        addr_hi = (word_addr >> 8) & 255
+        addr_lo = word_addr & 255
+        count = len(words)
+
+        return bytearray([
+            1, 2,
+            mem_area,
+            addr_hi, addr_lo, 0,
+            (count >> 8) & 255, count & 255
+        ]) + words_to_bytes(words)
+
     def send_command(self, command):
         fins_frame = self.build_fins_header() + command
+        sid = self.sid
+        command_code = bytes(command[:2]).hex()
+        for attempt in range(self.retries + 1):
+            start = time.perf_counter()
+            try:
+                if self.log_frames:
+                    logger.debug(f"명령 전송: {fins_frame.hex()}")
+                self.sock.sendto(fins_frame, (self.plc_ip, self.plc_port))
+                data = self._receive(sid, start)
+                received = time.perf_counter()
+                end_code = data[12:14].hex() if len(data) >= 14 else "short"
+                self.tracer.record(sid, fins_frame, data, start, received, end_code)
+                self.stats.record_response(command_code, (received - start) * 1000, len(fins_frame), len(data), end_code)
+                if self.log_frames:
+                    logger.debug(f"응답 수신: {data.hex()} ({(received - start) * 1000:.2f}ms)")
+                if end_code != FRAME_OK:
+                    self.tracer.auto_dump(f"end code {end_code}")
+                return data
+            except socket.timeout:
+                self.tracer.record(sid, fins_frame, None, start, None, "timeout")
+                self.stats.record_timeout(len(fins_frame))
+                logger.error(f"통신 타임아웃: {self.plc_ip}:{self.plc_port}")
+                self.tracer.auto_dump("timeout")
+                if attempt < self.retries:
+                    self.stats.record_retry()
+                    logger.warning(f"재전송 {attempt + 1}/{self.retries}: {command_code}")
+            except Exception as e:
+                self.tracer.record(sid, fins_frame, None, start, None, "error")
+                self.stats.record_error()
+                logger.exception(f"통신 중 오류 발생: {str(e)}")
+                self.tracer.auto_dump(f"error {type(e).__name__}")
+                return None
+        return None
+
+    def _receive(self, sid, start):
+        """
+        SID가 같은 응답이 올 때까지 수신 (이전 명령의 늦은 응답은 trace에만 남기고 버림)
+        - 전체 대기는 start부터 소켓 timeout 1번 분량 → 늦은 / 중복 응답이 계속 와도 timeout으로 처리
+        """
+        timeout = self.sock.gettimeout()
+        deadline = None if timeout is None else start + timeout
         try:
-            logger.debug(f"명령 전송: {fins_frame.hex()}")
-            self.sock.sendto(fins_frame, (self.plc_ip, self.plc_port))
-            data, addr = self.sock.recvfrom(1024)
-            logger.debug(f"응답 수신: {data.hex()} from {addr}")
-            return data
-        except socket.timeout:
-            logger.error(f"통신 타임아웃: {self.plc_ip}:{self.plc_port}")
-            return None
-        except Exception as e:
-            logger.exception(f"통신 중 오류 발생: {str(e)}")
-            return None
+            while True:
+                if deadline is not None:
+                    remaining = deadline - time.perf_counter()
+                    if remaining <= 0:
+                        raise socket.timeout(f"SID {sid} 응답 대기 시간 초과")
+                    self.sock.settimeout(remaining)
+                data, addr = self.sock.recvfrom(4096)
+                if len(data) < 10 or data[9] == sid:
+                    return data
+                self.tracer.record(data[9], None, data, start, time.perf_counter(), "stale")
+                logger.warning(f"SID 불일치 응답 무시: 기대 {sid}, 수신 {data[9]} from {addr}")
+        finally:
+            self.sock.settimeout(timeout)
 
     def read_word(self, word_addr, mem_area, word_count=1):
         cmd = self.build_read_command(mem_area, word_addr, 0, word_count)
-        logger.info(f"command format merge completed: {cmd.hex()}")
         response = self.send_command(cmd)
-        logger.info(f"response: {response.hex()}")
+        if self.log_frames:
+            logger.info(f"command format merge completed: {cmd.hex()}")
+            logger.info(f"response: {response.hex() if response is not None else None}")
 
         # if response is None or response[12:14] != b'\x00\x00':
         #     return None
+        if response is None:
+            return None
 
         if word_count == 1:
             return int.from_bytes(response[-2:], byteorder='big')
         else:
             data_start = 14
             data_bytes = response[data_start:]
-            word_list = [
-                int.from_bytes(data_bytes[i:i + 2], byteorder='big')
-                for i in range(0, len(data_bytes), 2)
-            ]
-            return word_list
+            return bytes_to_words(data_bytes).tolist()
+
+    def read_block(self, mem_area, word_addr, word_count):
+        """
+        word_count개 연속 읽기 (MAX_READ_WORDS 단위로 나눠서 요청)
+        return: uint16 배열, 실패 시 None
+        """
+        chunks = []
+        for start in range(0, word_count, MAX_READ_WORDS):
+            count = min(MAX_READ_WORDS, word_count - start)
+            cmd = self.build_read_command(mem_area, word_addr + start, 0, count)
+            response = self.send_command(cmd)
+            if response is None:
+                return None
+            if response[12:14] != b'\x00\x00':
+                logger.error(f"블록 읽기 실패: {mem_area:#X} {word_addr + start} x{count}, ENDCODE {response[12:14].hex()}")
+                return None
+            data = response[14:]
+            if len(data) != count * 2:
+                # 짧은 / 긴 응답을 그대로 붙이면 이후 chunk의 주소가 모두 밀림
+                logger.error(
+                    f"블록 읽기 응답 길이 불일치: {mem_area:#X} {word_addr + start} x{count}, "
+                    f"data {len(data)} bytes (예상 {count * 2})"
+                )
+                return None
+            chunks.append(data)
+
+        return bytes_to_words(b"".join(chunks))
+
+    def write_block(self, mem_area, word_addr, words):
+        """words를 word_addr부터 연속 쓰기 (MAX_WRITE_WORDS 단위로 나눠서 요청)"""
+        words = list(words)
+        for start in range(0, len(words), MAX_WRITE_WORDS):
+            chunk = words[start:start + MAX_WRITE_WORDS]
+            cmd = self.build_write_block_command(mem_area, word_addr + start, chunk)
+            response = self.send_command(cmd)
+            if response is None:
+                logger.error(f"블록 쓰기 응답 없음: {mem_area:#X} {word_addr + start} x{len(chunk)}")
+                return False
+            if response[12:14] != b'\x00\x00':
+                logger.error(f"블록 쓰기 실패: {mem_area:#X} {word_addr + start} x{len(chunk)}, ENDCODE {response[12:14].hex()}")
+                return False
+
+        logger.debug(f"Block write success: {mem_area:#X} {word_addr} x{len(words)}")
+        return True
 
     def read_word_bit(self, mem_area, word_addr, bit_offset):
         cmd = self.build_read_command(mem_area, word_addr, bit_offset)
-        logger.info(f"command format merge completed: {cmd.hex()}")
         response = self.send_command(cmd)
-        logger.info(f"response: {response.hex()}")
+        if self.log_frames:
+            logger.info(f"command format merge completed: {cmd.hex()}")
+            logger.info(f"response: {response.hex() if response is not None else None}")
 
+        # timeout / 오류는 send_command에서 기록, end code 오류 프레임은 trace 파일로 저장됨
         if response is None:
-            print("응답 없음 timeout")
+            if self.log_frames:
+                logger.debug(f"비트 읽기 응답 없음: {mem_area:#X} {word_addr}.{bit_offset}")
             return None
-        if response[12:14] != b'\x00\x00':
-            print("Response code exist", response[12:14].hex())
+        if response[12:14] != b'\x00\x00' and self.log_frames:
+            logger.debug(f"비트 읽기 ENDCODE {response[12:14].hex()}: {mem_area:#X} {word_addr}.{bit_offset}")
             # return None
 
         value = int.from_bytes(response[-2:], byteorder='big')
         bit = (value >> bit_offset) & 1
 
-        logger.info(f"Read {mem_area} {word_addr} {bit_offset} = {bit}")
-        logger.info(f"Response: ENDCODE {response[12:14].hex()}")
+        if self.log_frames:
+            logger.info(f"Read {mem_area} {word_addr} {bit_offset} = {bit}")
+            logger.info(f"Response: ENDCODE {response[12:14].hex()}")
 
         return bit
 
@@ -111,16 +229,18 @@ class FinsUDPClient:
         cmd = self.build_write_command(mem_area, word_addr, 0, word_value)
         response = self.send_command(cmd)
         if response is None:
-            print("응답 없음 timeout")
+            if self.log_frames:
+                logger.debug(f"워드 쓰기 응답 없음: {mem_area:#X} {word_addr}")
             return False
 
-        logger.debug(f"Word write success: {word_value}")
+        if self.log_frames:
+            logger.debug(f"Word write success: {word_value}")
         return True
 
     def write_word_bit(self, mem_area, word_addr, bit_offset, turn_on=True):
         current_value = self.read_word(word_addr, mem_area)
         if current_value is None:
-            print("현재 값을 읽을 수 없습니다.")
+            logger.error(f"비트 쓰기 실패 (현재 값 읽기 실패): {mem_area:#X} {word_addr}.{bit_offset}")
             return False
 
         if turn_on:
@@ -131,10 +251,11 @@ class FinsUDPClient:
         cmd = self.build_write_command(mem_area, word_addr, 0, new_value)
         response = self.send_command(cmd)
         if response is None:
-            print("응답 없음 timeout")
+            if self.log_frames:
+                logger.debug(f"워드 쓰기 응답 없음: {mem_area:#X} {word_addr}")
             return False
         if response[12:14] != b'\x00\x00':
-            print("쓰기 실패", response[12:14].hex())
+            logger.error(f"쓰기 실패: {mem_area:#X} {word_addr}, ENDCODE {response[12:14].hex()}")
             return False
         logger.info(f"Write {mem_area} {word_addr} {bit_offset} = {turn_on}")
         return True
@@ -155,13 +276,15 @@ class FinsUDPClient:
 
         response = self.send_command(cmd)
         if response is None:
-            print("응답 없음 (timeout)")
+            if self.log_frames:
+                logger.debug(f"비트 쓰기 응답 없음: {mem_area:#X} {word_addr}.{bit_offset}")
             return False
         if response[12:14] != b'\x00\x00':
-            print("비트 쓰기 실패", response[12:14].hex())
+            logger.error(f"비트 쓰기 실패: {mem_area:#X}_{word_addr}.{bit_offset:02}, ENDCODE {response[12:14].hex()}")
             return False
 
-        print(f"Bit Write: {mem_area:#X}_{word_addr}.{bit_offset:02} = {'ON' if turn_on else 'OFF'}")
+        if self.log_frames:
+            logger.debug(f"Bit Write: {mem_area:#X}_{word_addr}.{bit_offset:02} = {'ON' if turn_on else 'OFF'}")
         return True
 
 
@@ -0,0 +1,86 @@
+# src/communication/frame_trace.py
+"""
+FINS 프레임 trace (FinsUDPClient 연결마다 1개)
+- 최근 CAPACITY개 요청 / 응답 원본 bytes + SID + 상태(end code / timeout 등) + 시각을 메모리 ring buffer에 보관
+  (기록 1번 = tuple 1개 생성 + list 칸 교체 → 프레임마다 로그 문자열을 만들지 않음)
+- dump(): 파일로 저장 (수동 / 통신 오류 시 자동, 자동 저장은 AUTO_DUMP_MIN_INTERVAL 간격 제한)
+- 프레임 단위 로그(LOG_FRAMES)는 기본 꺼짐 → 문제 분석은 dump 파일 사용
+"""
+import os
+import time
+from datetime import datetime
+
+from src.config.settings import FRAME_TRACE_SETTINGS
+from src.utils.logger_config import setup_logger
+
+logger = setup_logger('frame_trace')
+
+# status: end code(hex 4자리) / "timeout" / "error" / "stale"(SID가 다른 지난 응답)
+FRAME_OK = "0000"
+
+
+class FrameTracer:
+    def __init__(self, name="fins", capacity=None):
+        self.name = name
+        self.capacity = capacity or FRAME_TRACE_SETTINGS['CAPACITY']
+        self._frames = [None] * self.capacity
+        self._count = 0   # 누적 기록 수 (다음에 쓸 칸 = _count % capacity)
+        # perf_counter → 벽시계 시각 변환용 (dump할 때만 사용)
+        self._wall_offset = time.time() - time.perf_counter()
+        self._last_auto_dump = None
+
+    def record(self, sid, request, response, t_send, t_recv, status):
+        """
+        request / response: 원본 bytes (response 없으면 None)
+        t_send / t_recv: time.perf_counter() 값
+        같은 FinsUDPClient(단일 스레드)에서만 호출
+        """
+        self._frames[self._count % self.capacity] = (t_send, t_recv, sid, request, response, status)
+        self._count += 1
+
+    def __len__(self):
+        return min(self._count, self.capacity)
+
+    def frames(self):
+        """보관 중인 프레임 (오래된 것 → 최신)"""
+        if self._count <= self.capacity:
+            return [f for f in self._frames[:self._count]]
+        start = self._count % self.capacity
+        return self._frames[start:] + self._frames[:start]
+
+    def dump(self, path=None, reason="manual"):
+        """보관 중인 프레임을 텍스트 파일로 저장. return: 파일 경로 (실패 시 None)"""
+        frames = self.frames()
+        if path is None:
+            dump_dir = FRAME_TRACE_SETTINGS['DUMP_DIR']
+            os.makedirs(dump_dir, exist_ok=True)
+            stamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            path = os.path.join(dump_dir, f"frame_trace_{self.name}_{stamp}.txt")
+
+        try:
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(f"# frame trace: {self.name}, 사유: {reason}, 프레임 {len(frames)}개 (누적 {self._count})\n")
+                f.write("# 송신 시각 | RTT ms | SID | 상태 | 요청 hex | 응답 hex\n")
+                for t_send, t_recv, sid, request, response, status in frames:
+                    sent_at = datetime.fromtimestamp(t_send + self._wall_offset).strftime("%H:%M:%S.%f")[:-3]
+                    rtt = f"{(t_recv - t_send) * 1000:8.2f}" if t_recv is not None else "       -"
+                    f.write(
+                        f"{sent_at} | {rtt} | {sid:3d} | {status:>7} | "
+                        f"{request.hex() if request is not None else '-'} | "
+                        f"{response.hex() if response is not None else '-'}\n"
+                    )
+            logger.info(f"frame trace 저장 ({reason}): {path}, {len(frames)}개")
+            return path
+        except OSError as e:
+            logger.error(f"frame trace 저장 실패: {path}, {e}")
+            return None
+
+    def auto_dump(self, reason):
+        """통신 오류 시 자동 저장 (AUTO_DUMP 설정, 최소 간격 제한 → 연결이 끊겨도 파일이 쌓이지 않음)"""
+        if not FRAME_TRACE_SETTINGS['AUTO_DUMP']:
+            return None
+        now = time.monotonic()
+        if self._last_auto_dump is not None and now - self._last_auto_dump < FRAME_TRACE_SETTINGS['AUTO_DUMP_MIN_INTERVAL']:
+            return None
+        self._last_auto_dump = now
+        return self.dump(reason=reason)
@@ -89,6 +89,22 @@ class PLCConnector:
         except Exception as e:
             logger.error(f"PLC write data 실패: {str(e)}")
 
+    def read_block(self, mem_area, word_addr, word_count):
+        """연속 word 읽기 (uint16 배열, 실패 시 None)"""
+        try:
+            return self.fins_client.read_block(mem_area, word_addr, word_count)
+        except Exception as e:
+            logger.error(f"PLC block 읽기 실패: {str(e)}")
+            return None
+
+    def write_block(self, mem_area, word_addr, words):
+        """연속 word 쓰기 (성공 여부)"""
+        try:
+            return self.fins_client.write_block(mem_area, word_addr, words)
+        except Exception as e:
+            logger.error(f"PLC block 쓰기 실패: {str(e)}")
+            return False
+
     def get_latest_log_file(self):
         """지정된 경로에서 가장 최신 로그 파일을 찾아서 내용을 반환"""
         try:
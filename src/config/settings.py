@@ -4,6 +4,10 @@ import os
 UI_SETTINGS = {
     'WINDOW_WIDTH': 1920,
     'WINDOW_HEIGHT': 1050,
+    'LIVE_WINDOW_SAMPLES': 600,  # 실시간 그래프에 표시할 최근 샘플 수
+    'LIVE_MAX_FPS': 4,           # 실시간 그래프 최대 갱신 횟수 (초당)
+    'GRAPH_BACKEND': 'matplotlib',  # 'matplotlib' 또는 'native' (QPainter, 저사양 PC용)
+    'INDICATOR_MAX_FPS': 10,     # 상태 램프 / 라벨 최대 갱신 횟수 (초당)
 }
 
 PLC_SETTINGS = {
@@ -14,12 +18,73 @@ PLC_SETTINGS = {
     'HEARTBEAT_INTERVAL': 1000,  # milliseconds
     'HEARTBEAT_MEMORY_AREA': 0xAF,  # EM 영역
     'HEARTBEAT_WORD_ADDR': 0,
+    'HEARTBEAT_BIT': 0,             # PLC가 주기적으로 토글하는 비트
+    'HEARTBEAT_STALE_SAMPLES': 5,   # 이 횟수 연속으로 비트가 안 바뀌면 PLC 정지 의심
+    'RETRIES': 0,                   # 응답 timeout 시 재전송 횟수 (0 = 재전송 안 함)
     'LOG_DIRECTORY': '',
 }
 
+# PLC 온도/파라미터 tag 구성 (zone 수는 여기서 결정 → 수집, 저장, 튜닝, 화면 전체에 적용)
+TEMPERATURE_TAG_SETTINGS = {
+    'ZONE_COUNT': 8,
+    'MEMORY_AREA': 0xA0,
+    'BASE_ADDR': 17550,        # tube 1 PTC1 주소
+    'TUBE_STRIDE': 800,        # tube 간 주소 간격
+    'SIGNAL_STRIDE': 10,       # PTC/CTC/SP/MV 블록 간격 (ZONE_COUNT 이상이어야 함)
+    'PARAM_MEMORY_AREA': 0xA0,
+    'PARAM_BASE_ADDR': 840,    # Z1 Normal P1 주소 (Normal P1, P2, High P1, P2 순)
+    'PARAM_ZONE_STRIDE': 5,    # zone 간 파라미터 주소 간격
+}
+
 LOGGING_SETTINGS = {
     'LOG_DIR': os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), 'logs'),
     'MAX_LOG_SIZE': 10 * 1024 * 1024,  # 10MB
     'BACKUP_COUNT': 30,
     'DEBUG_BACKUP_COUNT': 5,
-}
\ No newline at end of file
+    'QUEUE_SIZE': 10000,           # logger_config queue 최대 record 수 (가득 차면 버리고 건수 경고)
+    'RATE_LIMITS': {'DEBUG': 20},  # 레벨별: 호출 위치마다 RATE_LIMIT_INTERVAL 동안 최대 기록 수 (없는 레벨은 제한 없음)
+    'RATE_LIMIT_INTERVAL': 1.0,    # 초
+}
+
+TUNING_SETTINGS = {
+    'CACHE_FILE': os.path.join('temperature_logs', 'tuning_cache.sqlite3'),  # 실행 경로 기준
+    'CACHE_MEMORY_ENTRIES': 256,  # 메모리 LRU 최대 run 개수
+}
+
+RUN_MONITOR_SETTINGS = {
+    'EWMA_ALPHA': 0.1,            # zone별 지수이동평균 가중치
+    # (하한, 상한) PTC - SP / CTC - SP 경보 기준 (℃), None이면 감시 안 함
+    # 승온 중에는 PTC가 SP보다 크게 낮으므로 기본은 overshoot(상한)만 감시
+    'PTC_DEVIATION_LIMITS': (None, 10.0),
+    'CTC_DEVIATION_LIMITS': (None, 30.0),
+    'HYSTERESIS': 1.0,            # 경보 해제는 기준 - HYSTERESIS 미만일 때
+}
+
+# 트리거 감시 / 온도 로깅 엔진 (GUI, service.py 공통)
+ACQUISITION_SETTINGS = {
+    'POLL_INTERVAL': 1.0,        # 트리거 확인 / 온도 로깅 주기 (초)
+    'MAX_COMM_ERRORS': 5,        # service: 연속 통신 오류가 이 횟수 이상이면 재연결
+    'RECONNECT_INTERVAL': 5.0,   # service: 재연결 재시도 간격 (초)
+}
+
+# FINS 통신 통계 (comm_stats)
+COMM_STATS_SETTINGS = {
+    'WINDOW': 500,           # percentile / 지터 계산에 쓰는 최근 샘플 수
+    'REFRESH_MS': 1000,      # 통신 상태 패널 갱신 주기
+    'LOG_INTERVAL': 600,     # service: 통신 통계 로그 간격 (초)
+}
+
+# FINS 프레임 trace (frame_trace): 프레임 단위 로그 대신 메모리 ring buffer
+FRAME_TRACE_SETTINGS = {
+    'CAPACITY': 2048,              # 보관할 최근 프레임 수
+    'LOG_FRAMES': False,           # True면 프레임마다 요청 / 응답 hex 로그 (디버깅용)
+    'DUMP_DIR': 'logs',            # trace 파일 저장 폴더
+    'AUTO_DUMP': True,             # 통신 오류(timeout / 오류 end code) 시 자동 저장
+    'AUTO_DUMP_MIN_INTERVAL': 60,  # 자동 저장 최소 간격 (초)
+}
+
+COMPARE_SETTINGS = {
+    'RUN_COUNT': 10,         # 비교 모드 기본 run(job) 수
+    'LOADER_WORKERS': 2,     # 백그라운드 run 로딩 스레드 수 (파싱은 GIL을 쓰므로 많으면 UI가 느려짐)
+    'CACHE_MB': 256,         # 로드한 run 배열 메모리 캐시 상한
+}
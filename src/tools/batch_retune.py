@@ -0,0 +1,144 @@
+# src/tools/batch_retune.py
+"""
+과거 온도 로그 전체에 튜닝 계산(p_calculation) 일괄 재실행
+
+사용 예:
+    python -m src.tools.batch_retune --workers 8 -o retune_results.csv
+    python -m src.tools.batch_retune --tube 1 --no-resume
+
+- tube/job별 최신 normal / high run을 찾아 프로세스 풀에서 병렬 계산
+- 결과는 tube, job, area, zone 단위 1행으로 CSV에 누적 기록
+- 기존 결과 파일이 있으면 이미 계산된 tube/job은 건너뜀 (--no-resume 으로 끄기)
+- 진행 상황은 logger로 (콘솔 + logs/batch_retune.log), worker 프로세스 로그도 같은 listener로 모임
+"""
+import argparse
+import csv
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+from src.utils.data_processor_tuning import tuning_summary
+from src.utils.logger_config import setup_logger, logging_initializer, worker_log_queue
+from src.utils.run_catalog import scan_runs, latest_run_pairs, load_run_rows
+from src.utils.tuning_cache import cached_tuning_summary
+
+logger = setup_logger('batch_retune')
+
+RESULT_HEADER = ["tube", "job", "area", "zone", "p1", "init_p2", "p2", "retain_point", "ptc_max", "file"]
+
+
+def retune_pair(tube_id, job_id, paths, zones=None, use_cache=True):
+    """
+    tube/job 1개의 normal/high run 계산 (프로세스 풀 worker에서 실행)
+    paths: {"normal": 경로 | None, "high": 경로 | None}
+    zones: None이면 run별로 로그 헤더에서 자동 검출
+    return: 결과 행 리스트
+    """
+    result_rows = []
+    for temp_area in ("normal", "high"):
+        path = paths.get(temp_area)
+        if not path:
+            continue
+
+        if use_cache:
+            summary = cached_tuning_summary(path, zone_count=zones)
+        else:
+            summary = tuning_summary(load_run_rows(path) or [], zones)
+
+        for z in range(len(summary["p1"])):
+            result_rows.append([
+                tube_id, job_id, temp_area, z + 1,
+                summary["p1"][z], summary["init_p2"][z], summary["p2"][z],
+                summary["retain_point"], f"{summary['ptc_max'][z]:.3f}",
+                Path(path).name,
+            ])
+    return result_rows
+
+
+def _load_done_keys(output):
+    """이미 결과 파일에 기록된 (tube, job) 목록"""
+    done = set()
+    if not os.path.exists(output):
+        return done
+    with open(output, "r", encoding="utf-8", newline="") as f:
+        reader = csv.reader(f)
+        next(reader, None)
+        for row in reader:
+            if len(row) >= 2:
+                done.add((row[0], row[1]))
+    return done
+
+
+def run_batch(log_dir, output, workers=None, zones=None, tube_id=None, resume=True, use_cache=True):
+    pairs = latest_run_pairs(scan_runs(log_dir, tube_id))
+
+    done = _load_done_keys(output) if resume else set()
+    todo = [
+        (key, {area: str(run.path) if run else None for area, run in entry.items()})
+        for key, entry in sorted(pairs.items())
+        if (str(key[0]), str(key[1])) not in done
+    ]
+
+    total = len(todo)
+    logger.info(f"run 묶음 {len(pairs)}개 중 {total}개 계산 (건너뜀 {len(pairs) - total}개)")
+    if not todo:
+        return 0
+
+    write_header = not resume or not os.path.exists(output)
+    failed = 0
+    t0 = time.perf_counter()
+
+    with open(output, "w" if not resume else "a", encoding="utf-8", newline="") as f, \
+            ProcessPoolExecutor(
+                max_workers=workers, initializer=logging_initializer, initargs=(worker_log_queue(),)
+            ) as pool:
+        writer = csv.writer(f)
+        if write_header:
+            writer.writerow(RESULT_HEADER)
+
+        futures = {
+            pool.submit(retune_pair, key[0], key[1], paths, zones, use_cache): key
+            for key, paths in todo
+        }
+        for count, future in enumerate(as_completed(futures), start=1):
+            tube, job = futures[future]
+            try:
+                writer.writerows(future.result())
+                f.flush()
+            except Exception as e:
+                failed += 1
+                logger.exception(f"T{tube}_{job} 계산 실패: {e}")
+
+            elapsed = time.perf_counter() - t0
+            logger.info(f"[{count}/{total}] T{tube}_{job}  ({count / elapsed:.1f} job/s)")
+
+    logger.info(f"완료: {output} (실패 {failed}개, {time.perf_counter() - t0:.1f}s)")
+    return failed
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="과거 온도 로그 튜닝 일괄 재계산")
+    parser.add_argument("--log-dir", default=None, help="온도 로그 폴더 (기본: ./temperature_logs)")
+    parser.add_argument("-o", "--output", default="retune_results.csv")
+    parser.add_argument("--workers", type=int, default=None, help="프로세스 수 (기본: CPU 수)")
+    parser.add_argument("--zones", type=int, default=None, help="zone 수 (기본: 로그 헤더에서 자동 검출)")
+    parser.add_argument("--tube", type=int, default=None, help="특정 tube만 계산")
+    parser.add_argument("--no-resume", action="store_true", help="결과 파일을 새로 작성")
+    parser.add_argument("--no-cache", action="store_true", help="튜닝 결과 캐시 사용 안 함")
+    args = parser.parse_args(argv)
+
+    failed = run_batch(
+        args.log_dir, args.output,
+        workers=args.workers,
+        zones=args.zones,
+        tube_id=args.tube,
+        resume=not args.no_resume,
+        use_cache=not args.no_cache,
+    )
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,229 @@
+# src/tools/plc_snapshot.py
+"""
+PLC 메모리 스냅샷 / 비교 / 복원 도구
+
+사용 예:
+    python -m src.tools.plc_snapshot dump -r 0xAF:0:32768 -r 0xA0:17550:6400 -o before.snap
+    python -m src.tools.plc_snapshot diff before.snap after.snap --bits
+    python -m src.tools.plc_snapshot restore before.snap -r 0xA0:840:40 --dry-run
+
+range 형식: AREA:START:COUNT  (AREA = 0xA0 같은 메모리 영역 코드 또는 DM/CIO/WR/HR/AR/EM)
+"""
+import argparse
+import struct
+import sys
+import time
+
+import numpy as np
+
+from src.communication.fins_comm import FinsUDPClient
+from src.config.settings import PLC_SETTINGS
+from src.utils.logger_config import setup_logger
+
+logger = setup_logger('plc_snapshot')
+
+MAGIC = b"DFHTSNAP"
+VERSION = 1
+FILE_HEADER = struct.Struct(">8sHHd")   # magic, version, range 수, 생성 시각(unix)
+RANGE_HEADER = struct.Struct(">BxII")   # mem_area, (pad), start, count
+
+AREA_NAMES = {
+    "CIO": 0xB0,
+    "WR": 0xB1,
+    "HR": 0xB2,
+    "AR": 0xB3,
+    "DM": 0x82,
+    "EM": 0xAF,   # heartbeat(EM0.0) / 트리거 비트 영역 (PLC_SETTINGS['HEARTBEAT_MEMORY_AREA'])
+}
+
+
+def parse_range(spec: str):
+    """'0xA0:17550:6400' → (0xA0, 17550, 6400)"""
+    try:
+        area, start, count = spec.split(":")
+        mem_area = AREA_NAMES.get(area.upper())
+        if mem_area is None:
+            mem_area = int(area, 0)
+        return mem_area, int(start, 0), int(count, 0)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"range 형식 오류: {spec} (AREA:START:COUNT)")
+
+
+# ----------------- 스냅샷 파일 -----------------
+def write_snapshot(path, ranges, created=None):
+    """ranges: [(mem_area, start, uint16 배열), ...]"""
+    with open(path, "wb") as f:
+        f.write(FILE_HEADER.pack(MAGIC, VERSION, len(ranges), created or time.time()))
+        for mem_area, start, words in ranges:
+            f.write(RANGE_HEADER.pack(mem_area, start, len(words)))
+            f.write(np.asarray(words, dtype=np.uint16).astype(">u2").tobytes())
+
+
+def read_snapshot(path):
+    """return: (created, [(mem_area, start, uint16 배열), ...])"""
+    with open(path, "rb") as f:
+        data = f.read()
+
+    magic, version, n_ranges, created = FILE_HEADER.unpack_from(data, 0)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError(f"스냅샷 파일 형식이 아님: {path}")
+
+    pos = FILE_HEADER.size
+    ranges = []
+    for _ in range(n_ranges):
+        mem_area, start, count = RANGE_HEADER.unpack_from(data, pos)
+        pos += RANGE_HEADER.size
+        words = np.frombuffer(data, dtype=">u2", count=count, offset=pos).astype(np.uint16)
+        pos += count * 2
+        ranges.append((mem_area, start, words))
+
+    return created, ranges
+
+
+# ----------------- 명령 -----------------
+def dump(client, specs, output):
+    ranges = []
+    t0 = time.perf_counter()
+    for mem_area, start, count in specs:
+        words = client.read_block(mem_area, start, count)
+        if words is None:
+            logger.error(f"스냅샷 읽기 실패: {mem_area:#X} {start} x{count}")
+            return False
+        ranges.append((mem_area, start, words))
+        print(f"{mem_area:#X} {start}~{start + count - 1}: {count} words")
+
+    write_snapshot(output, ranges)
+    total = sum(len(w) for _, _, w in ranges)
+    print(f"저장 완료: {output} ({total} words, {time.perf_counter() - t0:.2f}s)")
+    return True
+
+
+def _to_area_map(ranges):
+    """같은 영역의 range들을 (주소 배열, 값 배열)로 합침"""
+    result = {}
+    for mem_area, start, words in ranges:
+        addrs = np.arange(start, start + len(words))
+        prev = result.get(mem_area)
+        if prev is None:
+            result[mem_area] = (addrs, words)
+        else:
+            result[mem_area] = (np.concatenate([prev[0], addrs]), np.concatenate([prev[1], words]))
+    return result
+
+
+def diff(ranges_a, ranges_b, bits=False, out=sys.stdout):
+    """두 스냅샷의 공통 주소만 비교. return: 변경된 word 수"""
+    map_a = _to_area_map(ranges_a)
+    map_b = _to_area_map(ranges_b)
+    changed_total = 0
+
+    for mem_area in sorted(set(map_a) & set(map_b)):
+        addrs_a, words_a = map_a[mem_area]
+        addrs_b, words_b = map_b[mem_area]
+        common, idx_a, idx_b = np.intersect1d(addrs_a, addrs_b, return_indices=True)
+        old = words_a[idx_a]
+        new = words_b[idx_b]
+
+        changed = np.nonzero(old != new)[0]
+        changed_total += len(changed)
+
+        for i in changed:
+            addr, before, after = int(common[i]), int(old[i]), int(new[i])
+            if bits:
+                flipped = before ^ after
+                for bit in range(16):
+                    if flipped >> bit & 1:
+                        print(f"{mem_area:#X} {addr}.{bit:02}: {before >> bit & 1} -> {after >> bit & 1}", file=out)
+            else:
+                print(f"{mem_area:#X} {addr}: {before} -> {after} ({before:#06x} -> {after:#06x})", file=out)
+
+    print(f"변경된 word: {changed_total}", file=out)
+    return changed_total
+
+
+def restore(client, ranges, specs=None, dry_run=False):
+    """
+    스냅샷 값을 PLC에 다시 씀
+    specs가 주어지면 스냅샷 안에서 해당 범위만 골라서 씀
+    """
+    targets = []
+    for mem_area, start, words in ranges:
+        if not specs:
+            targets.append((mem_area, start, words))
+            continue
+        for s_area, s_start, s_count in specs:
+            if s_area != mem_area:
+                continue
+            lo = max(start, s_start)
+            hi = min(start + len(words), s_start + s_count)
+            if hi > lo:
+                targets.append((mem_area, lo, words[lo - start:hi - start]))
+
+    if not targets:
+        print("복원할 범위가 스냅샷에 없습니다.")
+        return False
+
+    for mem_area, start, words in targets:
+        print(f"{'[dry-run] ' if dry_run else ''}write {mem_area:#X} {start}~{start + len(words) - 1}: {len(words)} words")
+        if dry_run:
+            continue
+        if not client.write_block(mem_area, start, words.tolist()):
+            logger.error(f"복원 실패: {mem_area:#X} {start} x{len(words)}")
+            return False
+
+    return True
+
+
+def _make_client(args):
+    return FinsUDPClient(args.ip, args.port, args.plc_node, args.pc_node)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="PLC 메모리 스냅샷 / 비교 / 복원")
+    parser.add_argument("--ip", default=PLC_SETTINGS['DEFAULT_IP'])
+    parser.add_argument("--port", type=int, default=PLC_SETTINGS['DEFAULT_PORT'])
+    parser.add_argument("--plc-node", type=int, default=PLC_SETTINGS['DEFAULT_PLC_NODE'])
+    parser.add_argument("--pc-node", type=int, default=PLC_SETTINGS['DEFAULT_PC_NODE'])
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p_dump = sub.add_parser("dump", help="PLC 영역을 스냅샷 파일로 저장")
+    p_dump.add_argument("-r", "--range", dest="ranges", type=parse_range, action="append", required=True)
+    p_dump.add_argument("-o", "--output", required=True)
+
+    p_diff = sub.add_parser("diff", help="두 스냅샷 비교")
+    p_diff.add_argument("before")
+    p_diff.add_argument("after")
+    p_diff.add_argument("--bits", action="store_true", help="bit 단위로 표시")
+
+    p_restore = sub.add_parser("restore", help="스냅샷 값을 PLC에 쓰기")
+    p_restore.add_argument("snapshot")
+    p_restore.add_argument("-r", "--range", dest="ranges", type=parse_range, action="append")
+    p_restore.add_argument("--dry-run", action="store_true")
+
+    args = parser.parse_args(argv)
+
+    if args.command == "diff":
+        _, ranges_a = read_snapshot(args.before)
+        _, ranges_b = read_snapshot(args.after)
+        diff(ranges_a, ranges_b, bits=args.bits)
+        return 0
+
+    if args.command == "restore":
+        _, ranges = read_snapshot(args.snapshot)
+        if args.dry_run:
+            return 0 if restore(None, ranges, args.ranges, dry_run=True) else 1
+        client = _make_client(args)
+        try:
+            return 0 if restore(client, ranges, args.ranges) else 1
+        finally:
+            client.close()
+
+    client = _make_client(args)
+    try:
+        return 0 if dump(client, args.ranges, args.output) else 1
+    finally:
+        client.close()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,237 @@
+# src/tools/render_reports.py
+"""
+온도 로그 run별 SP / PTC / CTC 그래프 + 튜닝 결과 리포트 일괄 생성 (Qt 창 없이 Agg backend)
+
+사용 예:
+    python -m src.tools.render_reports --since 20251114_060000 --until 20251114_180000
+    python -m src.tools.render_reports --tube 1 --format png --workers 4 -o reports
+
+- tube/job별 최신 normal / high run을 찾아 프로세스 풀에서 병렬 렌더링
+- PDF: job 1개당 파일 1개 (1페이지: 튜닝 결과 요약, 이후 area/zone별 그래프)
+- PNG: job별 폴더에 summary.png + {area}_Z{n}.png
+- 그래프 모양은 TemperatureGraphWidget과 동일 (SP / PTC / CTC, 점선 grid, PTC max 표시)
+"""
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from functools import lru_cache
+from pathlib import Path
+
+import matplotlib
+matplotlib.use("Agg")
+from matplotlib.backends.backend_pdf import PdfPages
+from matplotlib.figure import Figure
+
+from src.config.mpl_config import setup_korean_font
+from src.utils.logger_config import setup_logger, logging_initializer, worker_log_queue
+from src.utils.run_catalog import scan_runs, latest_run_pairs, load_run_rows
+from src.utils.tuning_engine import parse_run, analyse_run
+
+logger = setup_logger('render_reports')
+
+AREAS = ("normal", "high")
+SUMMARY_COLUMNS = ["Zone", "P1", "Init P2", "P2", "PTC max"]
+
+
+def _init_worker(log_queue):
+    # worker 로그는 부모 프로세스 listener로 보냄
+    logging_initializer(log_queue)
+    # worker 프로세스마다 폰트 설정 (spawn 방식에서는 부모 설정이 전달되지 않음)
+    setup_korean_font()
+
+
+@lru_cache(maxsize=8)
+def load_run(path):
+    """
+    run 1개 파싱 + 튜닝 계산 (worker 프로세스별로 캐시 → zone / 페이지마다 다시 파싱하지 않음)
+    return: (RunMatrix, 튜닝 결과 dict) 또는 None
+    """
+    rows = load_run_rows(path)
+    if not rows or len(rows) < 2:
+        return None
+    run = parse_run(rows, signals=("PTC", "CTC", "SP"))
+    return run, analyse_run(run)
+
+
+def draw_zone(ax, run, zone, title):
+    """
+    TemperatureGraphWidget.update_*_graph와 같은 모양으로 zone 1개 그리기
+    CSV에 없는 signal(run.missing, 0.0으로 채워짐)은 그리지 않고 그래프에 표시
+    """
+    z = zone - 1
+    x = range(run.n_samples)
+    plotted = [name for name in ("SP", "PTC", "CTC") if name not in run.missing]
+    for name in plotted:
+        ax.plot(x, getattr(run, name.lower())[:, z], label=name)
+
+    ax.grid(True, which="both", linestyle="--", alpha=0.4)
+    ax.set_title(f"{title} - Z{zone}")
+    ax.set_xlabel("Index")
+    ax.set_ylabel("Temperature")
+    if plotted:
+        ax.legend()
+
+    if run.n_samples and "PTC" not in run.missing:
+        ax.text(
+            0.02, 0.95,
+            f"PTC max: {run.ptc[:, z].max():.1f}",
+            transform=ax.transAxes,
+            va="top"
+        )
+    if run.missing:
+        ax.text(
+            0.02, 0.05,
+            f"로그에 없는 컬럼: {', '.join(run.missing)}",
+            transform=ax.transAxes,
+            va="bottom",
+            color="red"
+        )
+
+
+def summary_figure(tube_id, job_id, loaded):
+    """
+    튜닝 결과 요약 페이지
+    loaded: {area: (RunMatrix, summary) | None}
+    """
+    fig = Figure(figsize=(11.7, 8.3))
+    fig.suptitle(f"T{tube_id} / Job {job_id} 튜닝 결과")
+
+    axes = fig.subplots(len(AREAS), 1)
+    for ax, area in zip(axes, AREAS):
+        ax.axis("off")
+        entry = loaded.get(area)
+        if entry is None:
+            ax.set_title(f"{area.capitalize()} (로그 없음)")
+            continue
+
+        run, summary = entry
+        missing = f", 없는 컬럼: {'/'.join(run.missing)} (0으로 계산)" if run.missing else ""
+        ax.set_title(f"{area.capitalize()} - {run.n_samples}행, retain point {summary['retain_point']}{missing}")
+        cells = [
+            [f"Z{z + 1}", summary["p1"][z], summary["init_p2"][z], summary["p2"][z], f"{summary['ptc_max'][z]:.1f}"]
+            for z in range(len(summary["p1"]))
+        ]
+        # 표를 axes 영역에 맞춤 → zone 수가 많아도 제목과 겹치지 않음
+        ax.table(cellText=cells, colLabels=SUMMARY_COLUMNS, cellLoc="center", bbox=[0, 0, 1, 1])
+    return fig
+
+
+def zone_figure(run, zone, title, dpi=100):
+    fig = Figure(figsize=(8, 4.5), dpi=dpi)
+    draw_zone(fig.add_subplot(111), run, zone, title)
+    fig.tight_layout()
+    return fig
+
+
+def report_pages(tube_id, job_id, loaded, dpi=100):
+    """(이름, Figure)를 1페이지씩 생성 (전체 페이지를 메모리에 동시에 들고 있지 않음)"""
+    yield "summary", summary_figure(tube_id, job_id, loaded)
+    for area in AREAS:
+        if loaded[area] is None:
+            continue
+        run, _ = loaded[area]
+        for z in range(run.zones):
+            yield f"{area}_Z{z + 1}", zone_figure(run, z + 1, f"{area.capitalize()} 온도 그래프", dpi)
+
+
+def render_job(tube_id, job_id, paths, out_dir, fmt="pdf", dpi=100):
+    """
+    tube/job 1개 리포트 생성 (프로세스 풀 worker에서 실행)
+    paths: {"normal": 경로 | None, "high": 경로 | None}
+    return: 생성한 파일 경로 리스트
+    """
+    out_dir = Path(out_dir)
+    loaded = {area: load_run(paths[area]) if paths.get(area) else None for area in AREAS}
+    if all(entry is None for entry in loaded.values()):
+        logger.warning(f"T{tube_id}_{job_id}: 읽을 수 있는 run 없음")
+        return []
+
+    pages = report_pages(tube_id, job_id, loaded, dpi)
+    written = []
+    if fmt == "pdf":
+        out_dir.mkdir(parents=True, exist_ok=True)
+        path = out_dir / f"report_T{tube_id}_{job_id}.pdf"
+        with PdfPages(path) as pdf:
+            for _, fig in pages:
+                pdf.savefig(fig)
+        written.append(str(path))
+    else:
+        job_dir = out_dir / f"T{tube_id}_{job_id}"
+        job_dir.mkdir(parents=True, exist_ok=True)
+        for name, fig in pages:
+            path = job_dir / f"{name}.png"
+            fig.savefig(path, dpi=dpi)
+            written.append(str(path))
+    return written
+
+
+def select_pairs(log_dir=None, tube_id=None, job_id=None, since=None, until=None):
+    """조건에 맞는 (tube, job) → {area: 경로} 목록 (run 시각: YYYYMMDD_HHMMSS)"""
+    runs = [
+        r for r in scan_runs(log_dir, tube_id)
+        if (job_id is None or r.job_id == job_id)
+        and (since is None or r.timestamp >= since)
+        and (until is None or r.timestamp <= until)
+    ]
+    pairs = latest_run_pairs(runs)
+    return [
+        (key, {area: str(run.path) if run else None for area, run in entry.items()})
+        for key, entry in sorted(pairs.items())
+    ]
+
+
+def render_reports(pairs, out_dir, fmt="pdf", workers=None, dpi=100):
+    total = len(pairs)
+    failed = 0
+    t0 = time.perf_counter()
+
+    with ProcessPoolExecutor(
+            max_workers=workers, initializer=_init_worker, initargs=(worker_log_queue(),)
+    ) as pool:
+        futures = {
+            pool.submit(render_job, key[0], key[1], paths, out_dir, fmt, dpi): key
+            for key, paths in pairs
+        }
+        for count, future in enumerate(as_completed(futures), start=1):
+            tube, job = futures[future]
+            try:
+                written = future.result()
+            except Exception as e:
+                failed += 1
+                logger.exception(f"T{tube}_{job} 리포트 생성 실패: {e}")
+                continue
+
+            elapsed = time.perf_counter() - t0
+            print(f"[{count}/{total}] T{tube}_{job}: 파일 {len(written)}개 ({count / elapsed:.1f} job/s)", flush=True)
+
+    print(f"완료: {out_dir} (실패 {failed}개, {time.perf_counter() - t0:.1f}s)")
+    return failed
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="온도 로그 그래프 / 튜닝 결과 리포트 생성")
+    parser.add_argument("--log-dir", default=None, help="온도 로그 폴더 (기본: ./temperature_logs)")
+    parser.add_argument("-o", "--output", default="reports", help="리포트 저장 폴더")
+    parser.add_argument("--format", choices=["pdf", "png"], default="pdf")
+    parser.add_argument("--workers", type=int, default=None, help="프로세스 수 (기본: CPU 수)")
+    parser.add_argument("--dpi", type=int, default=100)
+    parser.add_argument("--tube", type=int, default=None)
+    parser.add_argument("--job", type=int, default=None)
+    parser.add_argument("--since", default=None, help="이 시각 이후 run만 (YYYYMMDD_HHMMSS)")
+    parser.add_argument("--until", default=None, help="이 시각 이전 run만 (YYYYMMDD_HHMMSS)")
+    args = parser.parse_args(argv)
+
+    pairs = select_pairs(args.log_dir, args.tube, args.job, args.since, args.until)
+    if not pairs:
+        print("대상 run이 없습니다.")
+        return 1
+
+    print(f"job {len(pairs)}개 리포트 생성 → {os.path.abspath(args.output)}")
+    failed = render_reports(pairs, args.output, args.format, args.workers, args.dpi)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,80 @@
+# src/tools/sweep_tuning.py
+"""
+튜닝 규칙 파라미터 what-if 시뮬레이션
+
+사용 예:
+    python -m src.tools.sweep_tuning --plateau 60 80 100 120 --avg-window 30 60 --deadband 0 1 2
+    python -m src.tools.sweep_tuning --tube 1 --area high --p2-offset 2 3 4 -o sweep.csv
+
+지정하지 않은 파라미터는 현재 규칙(기본값) 1개만 사용
+결과: 조합별로 현재 규칙 대비 P1 / Initial P2 / P2가 바뀐 zone 비율과 평균 변화량
+"""
+import argparse
+import csv
+import sys
+import time
+
+from src.utils.run_catalog import scan_runs, load_run_rows
+from src.utils.tuning_sweep import sweep_runs, PARAMETERS
+
+STAT_COLUMNS = ["p1_changed", "p1_mean_delta", "init_p2_changed", "init_p2_mean_delta", "p2_changed", "p2_mean_delta"]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="튜닝 규칙 파라미터 sweep")
+    parser.add_argument("--log-dir", default=None, help="온도 로그 폴더 (기본: ./temperature_logs)")
+    parser.add_argument("--tube", type=int, default=None)
+    parser.add_argument("--area", choices=["normal", "high"], default=None)
+    parser.add_argument("--zones", type=int, default=None, help="zone 수 (기본: 로그 헤더에서 자동 검출)")
+    parser.add_argument("--last", type=int, default=None, help="최근 run N개만 사용")
+    parser.add_argument("--deadband", type=float, nargs="+")
+    parser.add_argument("--p2-offset", type=float, nargs="+")
+    parser.add_argument("--plateau", type=int, nargs="+")
+    parser.add_argument("--avg-window", type=int, nargs="+")
+    parser.add_argument("--max-window", type=int, nargs="+")
+    parser.add_argument("--top", type=int, default=20, help="화면에 표시할 조합 수")
+    parser.add_argument("-o", "--output", default=None, help="전체 결과 CSV 저장")
+    args = parser.parse_args(argv)
+
+    runs = scan_runs(args.log_dir, args.tube)
+    if args.area:
+        runs = [r for r in runs if r.temp_area == args.area]
+    if args.last:
+        runs = runs[-args.last:]
+    if not runs:
+        print("대상 run이 없습니다.")
+        return 1
+
+    t0 = time.perf_counter()
+    all_rows = [rows for rows in (load_run_rows(r.path) for r in runs) if rows]
+    t1 = time.perf_counter()
+
+    table = sweep_runs(
+        all_rows, args.zones,
+        deadband=args.deadband,
+        p2_offset=args.p2_offset,
+        plateau=args.plateau,
+        avg_window=args.avg_window,
+        max_window=args.max_window,
+    )
+    t2 = time.perf_counter()
+    print(f"run {len(all_rows)}개 로드 {t1 - t0:.2f}s, 조합 {len(table)}개 계산 {t2 - t1:.3f}s")
+
+    columns = list(PARAMETERS) + STAT_COLUMNS
+    if args.output:
+        with open(args.output, "w", encoding="utf-8", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=columns)
+            writer.writeheader()
+            writer.writerows(table)
+        print(f"저장 완료: {args.output}")
+
+    # 현재 규칙 대비 변화가 큰 조합부터 표시
+    table.sort(key=lambda r: (r["p1_changed"] + r["init_p2_changed"] + r["p2_changed"]), reverse=True)
+    print(" ".join(f"{c:>18}" for c in columns))
+    for row in table[:args.top]:
+        print(" ".join(f"{row[c]:>18.3f}" if isinstance(row[c], float) else f"{row[c]:>18}" for c in columns))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
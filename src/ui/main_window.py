@@ -3,6 +3,7 @@ from PyQt6.QtWidgets import QMainWindow, QWidget, QHBoxLayout, QVBoxLayout
 from PyQt6.QtCore import Qt  # Qt 추가
 from PyQt6.QtGui import QGuiApplication
 from src.communication.plc_connector import PLCConnector
+from src.ui.widgets.comm_stats_widget import CommStatsWidget
 from src.ui.widgets.connection_widget import ConnectionWidget
 from src.ui.widgets.heartbeat_widget import HeartbeatWidget
 from src.ui.widgets.trigger_monitor_widget import TriggerMonitorWidget
@@ -57,13 +58,15 @@ class PLCMonitoringApp(QMainWindow):
 
         # 상단 위젯 추가
         self.connection_widget = ConnectionWidget()
-        self.heartbeat_widget = HeartbeatWidget()
+        self.heartbeat_widget = HeartbeatWidget(self.connection_widget.plc_connector)
         self.trigger_monitor = TriggerMonitorWidget(self.connection_widget.plc_connector)
+        self.comm_stats_widget = CommStatsWidget(self.connection_widget.plc_connector, self.trigger_monitor.engine)
 
         # 각 위젯의 크기 정책 설정
         top_layout.addWidget(self.connection_widget, stretch=1)
         top_layout.addWidget(self.heartbeat_widget, stretch=1)
         top_layout.addWidget(self.trigger_monitor.status_container, stretch=1)
+        top_layout.addWidget(self.comm_stats_widget, stretch=1)
 
         # 메인 레이아웃에 상단 컨테이너 추가
         main_layout.addWidget(top_container)
@@ -77,6 +80,9 @@ class PLCMonitoringApp(QMainWindow):
         self.trigger_monitor.temperature_log_updated.connect(
             self.on_temperature_log_updated
         )
+        # 로깅 중 실시간 그래프
+        self.trigger_monitor.live_run_started.connect(self.graph_widget.start_live)
+        self.trigger_monitor.live_sample.connect(self.graph_widget.append_live_sample)
 
         # 연결 상태에 따른 트리거 모니터링 제어
         self.connection_widget.connection_status_changed.connect(self.handle_connection_status)
@@ -85,6 +91,9 @@ class PLCMonitoringApp(QMainWindow):
         self.connection_widget.connection_status_changed.connect(
             self.heartbeat_widget.handle_connection_status
         )
+        self.connection_widget.connection_status_changed.connect(
+            self.comm_stats_widget.handle_connection_status
+        )
         
         # 윈도우를 표시
         self.show()
@@ -110,6 +119,10 @@ class PLCMonitoringApp(QMainWindow):
         self.raise_()
         self.activateWindow()
 
+    def closeEvent(self, event):
+        self.graph_widget.shutdown()
+        super().closeEvent(event)
+
     def handle_connection_status(self, is_connected):
         if is_connected:
             self.trigger_monitor.start_monitoring()
@@ -119,5 +132,6 @@ class PLCMonitoringApp(QMainWindow):
             logger.info("모니터링 중지")
 
     def on_temperature_log_updated(self, normal_rows, high_rows):
+        self.graph_widget.set_tube(self.trigger_monitor.tube_id)
         self.graph_widget.set_normal_rows(normal_rows)
         self.graph_widget.set_high_rows(high_rows)
\ No newline at end of file
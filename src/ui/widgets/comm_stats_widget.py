@@ -0,0 +1,105 @@
+# src/ui/widgets/comm_stats_widget.py
+from PyQt6.QtWidgets import QGroupBox, QVBoxLayout, QPushButton
+from PyQt6.QtCore import QTimer
+
+from src.communication.comm_stats import format_percentiles, rates
+from src.config.settings import COMM_STATS_SETTINGS
+from src.ui.widgets.status_indicator import StatusLabel
+from src.utils.logger_config import setup_logger
+
+logger = setup_logger('comm_stats_widget')
+
+
+class CommStatsWidget(QGroupBox):
+    """
+    통신 상태 패널 (REFRESH_MS마다 갱신, 연결 중에만)
+    - RTT: 명령(read / write)별 p50 / p95 / p99 → 크면 PLC 또는 네트워크 지연
+    - 처리량: 초당 프레임 / KB, timeout / retry / 오류 / 오류 end code 횟수
+    - poll 주기: 시작 간격 p50 / p95 / p99 + 지터, poll 소요 시간
+      → RTT는 정상인데 주기 지터만 크면 PC 쪽 지연 (event loop / CPU)
+    - "frame trace 저장": 최근 FINS 프레임 원본을 파일로 저장 (frame_trace)
+    """
+    def __init__(self, plc_connector, engine=None):
+        super().__init__("통신 상태")
+        self.plc_connector = plc_connector
+        self.engine = engine
+        self._previous = None
+        self.init_ui()
+
+        self.refresh_timer = QTimer(self)
+        self.refresh_timer.setInterval(COMM_STATS_SETTINGS['REFRESH_MS'])
+        self.refresh_timer.timeout.connect(self.refresh)
+
+    def init_ui(self):
+        layout = QVBoxLayout(self)
+        self.rtt_read_label = StatusLabel("RTT read: -")
+        self.rtt_write_label = StatusLabel("RTT write: -")
+        self.throughput_label = StatusLabel("처리량: -")
+        self.error_label = StatusLabel("timeout 0 / retry 0 / 오류 0")
+        self.cycle_label = StatusLabel("poll 주기: -")
+        self.poll_label = StatusLabel("poll 소요: -")
+        for label in (
+            self.rtt_read_label, self.rtt_write_label, self.throughput_label,
+            self.error_label, self.cycle_label, self.poll_label,
+        ):
+            layout.addWidget(label)
+
+        self.dump_button = QPushButton("frame trace 저장")
+        self.dump_button.clicked.connect(self.dump_trace)
+        layout.addWidget(self.dump_button)
+
+    def handle_connection_status(self, is_connected):
+        self._previous = None
+        if is_connected:
+            self.refresh_timer.start()
+        else:
+            self.refresh_timer.stop()
+
+    def refresh(self):
+        client = self.plc_connector.fins_client
+        if client is None:
+            return
+        snapshot = client.stats.snapshot()
+
+        for name, label in (("read", self.rtt_read_label), ("write", self.rtt_write_label)):
+            rtt = snapshot["rtt"].get(name)
+            if rtt is None:
+                continue
+            label.set_state((f"RTT {name}: {format_percentiles(rtt['percentiles'])} (max {rtt['max']:.1f})", None))
+
+        if self._previous is not None:
+            sent, received, tx, rx = rates(self._previous, snapshot)
+            self.throughput_label.set_state((
+                f"처리량: {sent:.1f} / {received:.1f} 프레임/s, "
+                f"송신 {tx / 1024:.1f} / 수신 {rx / 1024:.1f} KB/s",
+                None,
+            ))
+        self._previous = snapshot
+
+        failures = snapshot["timeouts"] + snapshot["errors"] + sum(snapshot["end_codes"].values())
+        end_codes = ", ".join(f"{code}:{count}" for code, count in sorted(snapshot["end_codes"].items()))
+        self.error_label.set_state((
+            f"timeout {snapshot['timeouts']} / retry {snapshot['retries']} / 오류 {snapshot['errors']}"
+            + (f" / end code {end_codes}" if end_codes else ""),
+            "red" if failures else "black",
+        ))
+
+        if self.engine is not None:
+            cycle = self.engine.cycle_stats
+            self.cycle_label.set_state((
+                f"poll 주기: {format_percentiles(cycle.percentiles())}, 지터 {cycle.jitter():.1f} ms",
+                None,
+            ))
+            self.poll_label.set_state((
+                f"poll 소요: {format_percentiles(self.engine.poll_stats.percentiles())}",
+                None,
+            ))
+
+    def dump_trace(self):
+        client = self.plc_connector.fins_client
+        if client is None:
+            logger.warning("frame trace 저장: PLC 연결 없음")
+            return
+        path = client.tracer.dump(reason="manual")
+        if path:
+            self.dump_button.setToolTip(path)
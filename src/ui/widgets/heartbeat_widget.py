@@ -1,14 +1,24 @@
 # src/ui/widgets/heartbeat_widget.py
-from PyQt6.QtWidgets import QGroupBox, QVBoxLayout, QLabel, QFrame
+from PyQt6.QtWidgets import QGroupBox, QVBoxLayout, QLabel
 from PyQt6.QtCore import Qt, QTimer
 from src.config.settings import PLC_SETTINGS
+from src.ui.widgets.status_indicator import IndicatorLamp, StatusLabel, get_ui_scheduler
 from src.utils.logger_config import setup_logger
 
 logger = setup_logger('heartbeat_monitor')
 
 class HeartbeatWidget(QGroupBox):
-    def __init__(self):
+    """
+    PLC heartbeat 비트(HEARTBEAT_MEMORY_AREA / WORD_ADDR / BIT)를 주기적으로 읽어서 표시
+    - 램프: 비트 1 = green, 0 = gray, 통신 오류 = red,
+      HEARTBEAT_STALE_SAMPLES번 연속으로 비트가 안 바뀜 = orange (통신은 되는데 PLC 프로그램 정지 의심)
+    - 카운트: 비트가 바뀐 횟수
+    """
+    def __init__(self, plc_connector=None):
         super().__init__("PLC Heartbeat 모니터링")
+        self.plc_connector = plc_connector
+        self.last_bit = None
+        self.unchanged_samples = 0
         self.init_ui()
         
     def init_ui(self):
@@ -18,20 +28,19 @@ class HeartbeatWidget(QGroupBox):
         self.connection_status = QLabel("연결 상태: 미연결")
         self.connection_status.setStyleSheet("color: red; font-weight: bold;")
         
-        # Heartbeat 표시기
-        self.heartbeat_indicator = QFrame()
-        self.heartbeat_indicator.setFixedSize(50, 50)
-        self.heartbeat_indicator.setStyleSheet(
-            "background-color: red; border-radius: 25px;"
-        )
+        # Heartbeat 표시기 (상태가 바뀔 때만 다시 그림, 반영은 ui_scheduler 프레임 단위)
+        self.ui_scheduler = get_ui_scheduler()
+        self.heartbeat_indicator = IndicatorLamp(50, "red")
         
         # Heartbeat 카운터
-        self.heartbeat_count = QLabel("Heartbeat 카운트: 0")
+        self.heartbeat_count = StatusLabel("Heartbeat 카운트: 0")
         self.heartbeat_count_value = 0
         
         # Memory Area 표시
         self.memory_area = QLabel(f"메모리 영역: {PLC_SETTINGS['HEARTBEAT_MEMORY_AREA']:#X}")
-        self.word_address = QLabel(f"워드 주소: {PLC_SETTINGS['HEARTBEAT_WORD_ADDR']}")
+        self.word_address = QLabel(
+            f"워드 주소: {PLC_SETTINGS['HEARTBEAT_WORD_ADDR']}.{PLC_SETTINGS['HEARTBEAT_BIT']:02}"
+        )
         
         layout.addWidget(self.connection_status)
         layout.addWidget(self.memory_area)
@@ -59,17 +68,38 @@ class HeartbeatWidget(QGroupBox):
             self.connection_status.setStyleSheet("color: red; font-weight: bold;")
             self.heartbeat_timer.stop()
             self.heartbeat_count_value = 0
-            self.heartbeat_count.setText(f"Heartbeat 카운트: {self.heartbeat_count_value}")
-            self.heartbeat_indicator.setStyleSheet(
-                "background-color: red; border-radius: 25px;"
-            )
+            self.last_bit = None
+            self.unchanged_samples = 0
+            self.ui_scheduler.post(self.heartbeat_count, (f"Heartbeat 카운트: {self.heartbeat_count_value}", None))
+            self.ui_scheduler.post(self.heartbeat_indicator, "red")
     
     def update_heartbeat(self):
-        self.heartbeat_count_value += 1
-        self.heartbeat_count.setText(f"Heartbeat 카운트: {self.heartbeat_count_value}")
-        logger.debug(f"Heart beat 상태제어 진행중..카운터: {self.heartbeat_count_value}")
-        
-        current_color = "green" if self.heartbeat_count_value % 2 == 0 else "Gray"
-        self.heartbeat_indicator.setStyleSheet(
-            f"background-color: {current_color}; border-radius: 25px;"
-        )
\ No newline at end of file
+        if self.plc_connector is None:
+            return
+        bit = self.plc_connector.read_heartbeat(
+            mem_area=PLC_SETTINGS['HEARTBEAT_MEMORY_AREA'],
+            word_addr=PLC_SETTINGS['HEARTBEAT_WORD_ADDR'],
+            bit_offset=PLC_SETTINGS['HEARTBEAT_BIT'],
+        )
+        if bit is None:
+            self.ui_scheduler.post(self.heartbeat_indicator, "red")
+            return
+
+        if bit != self.last_bit:
+            if self.last_bit is not None:
+                self.heartbeat_count_value += 1
+            self.last_bit = bit
+            self.unchanged_samples = 0
+        else:
+            self.unchanged_samples += 1
+        self.ui_scheduler.post(self.heartbeat_count, (f"Heartbeat 카운트: {self.heartbeat_count_value}", None))
+        logger.debug("Heartbeat 비트: %s, 변경 횟수: %s", bit, self.heartbeat_count_value)
+
+        stale_limit = PLC_SETTINGS['HEARTBEAT_STALE_SAMPLES']
+        if self.unchanged_samples >= stale_limit:
+            if self.unchanged_samples == stale_limit:
+                logger.warning(f"Heartbeat 비트가 {self.unchanged_samples}회 연속 변화 없음 (PLC 정지 의심)")
+            current_color = "orange"
+        else:
+            current_color = "green" if bit else "gray"
+        self.ui_scheduler.post(self.heartbeat_indicator, current_color)
\ No newline at end of file
@@ -0,0 +1,317 @@
+# src/ui/widgets/mpl_graph_panel.py
+"""
+matplotlib backend 온도 그래프 패널 / zone overview (UI_SETTINGS['GRAPH_BACKEND'] == "matplotlib")
+"""
+import numpy as np
+from PyQt6.QtWidgets import QLabel, QSizePolicy
+from PyQt6.QtCore import Qt, QTimer, pyqtSignal
+from PyQt6.QtGui import QImage, QPixmap
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
+from matplotlib.figure import Figure
+
+from src.utils.decimation import minmax_decimate
+from src.utils.graph_axes import SERIES_NAMES, axis_limits, clamp_view, data_range
+from src.utils.logger_config import setup_logger
+
+logger = setup_logger('mpl_graph_panel')
+
+
+class GraphPanel:
+    """
+    Normal / High 그래프 1개
+    - 선(SP/PTC/CTC), 제목, PTC max 텍스트는 처음 1번만 만들고 set_data / set_text로 갱신
+      (run 비교처럼 선 구성이 바뀔 때만 선 / legend 다시 생성)
+    - 축, grid, legend(정적 배경)는 draw_event 때 캡처 → 데이터 갱신은 배경 복원 + 변경 artist만 blit
+    - 축 범위가 바뀔 때만 draw_idle()로 전체 다시 그리기 (여러 번 요청돼도 1번으로 합쳐짐)
+    - blit도 QTimer.singleShot(0)으로 이벤트 루프 1회당 1번만 수행
+    - 선에는 화면 가로 픽셀 수 기준 min/max 다운샘플링한 점만 전달 (피크 보존)
+      보이는 x 범위 / 캔버스 크기가 바뀌면 다음 draw 때 다시 다운샘플링
+    - 마우스 휠: x축 확대/축소, 드래그: 이동, 더블클릭: 전체 보기
+    """
+    def __init__(self, title):
+        self.title = title
+        self.fig = Figure(figsize=(4, 3))
+        self.canvas = FigureCanvas(self.fig)
+        self.widget = self.canvas  # 레이아웃에 넣을 위젯
+        self.ax = self.fig.add_subplot(111)
+
+        self.ax.set_xlabel("Index")
+        self.ax.set_ylabel("Temperature")
+        self.ax.grid(True, which="both", linestyle="--", alpha=0.4)
+
+        # 좌측 상단 PTC 최대값
+        self.max_text = self.ax.text(0.02, 0.95, "", transform=self.ax.transAxes, va="top", animated=True)
+        self.ax.title.set_animated(True)
+        self.ax.set_title(f"{title} (데이터 없음)")
+
+        self.lines = []
+        self._line_key = None
+        self._animated = []
+        self._background = None
+        self._limits = None
+        self._blit_pending = False
+        self._series = None          # 원본 [(이름, x, y)]
+        self._decimated_for = None   # 현재 선 데이터의 (xlim, 구간 수)
+        self._pan_start = None
+        self._set_lines(SERIES_NAMES)
+
+        self.canvas.mpl_connect("draw_event", self._on_draw)
+        self.canvas.mpl_connect("scroll_event", self._on_scroll)
+        self.canvas.mpl_connect("button_press_event", self._on_press)
+        self.canvas.mpl_connect("motion_notify_event", self._on_motion)
+        self.canvas.mpl_connect("button_release_event", self._on_release)
+        self.ax.callbacks.connect("xlim_changed", self._on_xlim_changed)
+
+    def _set_lines(self, names, colors=None):
+        """
+        선 구성(이름 / 색)이 바뀔 때만 선 + legend 다시 생성
+        return: 다시 만들었으면 True (legend가 배경에 있으므로 전체 다시 그려야 함)
+        """
+        key = (tuple(names), tuple(colors) if colors else None)
+        if key == self._line_key:
+            return False
+        for line in self.lines:
+            line.remove()
+        self.lines = []
+        for i, name in enumerate(names):
+            (line,) = self.ax.plot([], [], label=name, color=colors[i] if colors else f"C{i}", animated=True)
+            self.lines.append(line)
+        if names:
+            self.ax.legend(loc="lower right", fontsize="small" if len(names) > len(SERIES_NAMES) else None)
+        elif self.ax.get_legend() is not None:
+            self.ax.get_legend().remove()
+
+        self._animated = self.lines + [self.max_text, self.ax.title]
+        self._line_key = key
+        self._background = None
+        return True
+
+    def set_empty(self, message="데이터 없음"):
+        self._series = None
+        self._decimated_for = None
+        for line in self.lines:
+            line.set_data([], [])
+        self.max_text.set_text("")
+        self.ax.set_title(f"{self.title} ({message})")
+        self._request_blit()
+
+    def set_series(self, zone, x, sp, ptc, ctc, max_ptc=None, y_range=None, x_range=None):
+        """
+        x, sp, ptc, ctc: 같은 길이의 배열 (로그에 없는 signal은 None → 선을 만들지 않음)
+        y_range: (min, max) 축 범위 기준. run 전체 zone 범위를 주면 zone 전환 시 축이 바뀌지 않음
+        x_range: (min, max) x축 범위 (None이면 x 전체, 실시간 모드에서는 스크롤 창)
+        """
+        present = [(i, name, y) for i, (name, y) in enumerate(zip(SERIES_NAMES, (sp, ptc, ctc))) if y is not None]
+        self.set_traces(
+            f"{self.title} - Z{zone}",
+            [(name, x, y) for _, name, y in present],
+            f"PTC max: {max_ptc:.1f}" if max_ptc is not None else "",
+            y_range, x_range,
+            # 빠진 signal이 있어도 SP / PTC / CTC 색은 그대로
+            [f"C{i}" for i, _, _ in present],
+        )
+
+    def set_traces(self, title, traces, text="", y_range=None, x_range=None, colors=None):
+        """
+        선 여러 개 표시 (run 비교 등)
+        traces: [(이름, x, y)], 이름은 legend 표시용 (중복 없이)
+        colors: 선 색 목록 (None이면 matplotlib 기본 순서)
+        """
+        rebuilt = self._set_lines([name for name, _, _ in traces], colors)
+        self._series = traces
+
+        self.max_text.set_text(text)
+        self.ax.set_title(title)
+
+        filled = [(x, y) for _, x, y in traces if len(x)]
+        if y_range is None:
+            y_range = data_range([y for _, y in filled])
+        if x_range is None:
+            x_range = (min(x[0] for x, _ in filled), max(x[-1] for x, _ in filled)) if filled else (0, 1)
+        limits = axis_limits(x_range, y_range)
+        if limits != self._limits or rebuilt:
+            # 축 눈금 / legend가 바뀌므로 배경까지 다시 그림 (draw_event에서 배경 재캡처 + 다운샘플링 + artist 그리기)
+            # 새 run이면 확대 상태도 초기화
+            if limits != self._limits:
+                self._limits = limits
+                self.ax.set_xlim(limits[0], limits[1])
+                self.ax.set_ylim(limits[2], limits[3])
+            self._background = None
+            self._decimated_for = None
+            self.canvas.draw_idle()
+        else:
+            # 같은 범위에서 zone만 바뀜 → 현재 보기 기준으로 다운샘플링 후 blit
+            self._decimate()
+            self._request_blit()
+
+    # ----------------- 다운샘플링 -----------------
+    def _view_key(self):
+        return tuple(self.ax.get_xlim()), max(int(self.ax.bbox.width), 1)
+
+    def _decimate(self):
+        """보이는 x 범위를 캔버스 픽셀 수만큼의 구간으로 나눠 구간별 min/max만 선에 전달"""
+        key = self._view_key()
+        self._decimated_for = key
+        if self._series is None:
+            return
+        xlim, buckets = key
+        for line, (_, x, y) in zip(self.lines, self._series):
+            line.set_data(*minmax_decimate(x, y, buckets, xlim))
+
+    def _on_xlim_changed(self, ax):
+        # 확대/이동 → 눈금이 바뀌므로 전체 다시 그리기 (draw_idle로 합쳐짐, 다운샘플링은 draw 때)
+        self._background = None
+        self.canvas.draw_idle()
+
+    # ----------------- 확대 / 이동 -----------------
+    def _set_view(self, x0, x1):
+        if self._limits is None:
+            return
+        self.ax.set_xlim(*clamp_view(x0, x1, self._limits[0], self._limits[1]))
+
+    def _on_scroll(self, event):
+        if self._series is None or event.inaxes is not self.ax or event.xdata is None:
+            return
+        x0, x1 = self.ax.get_xlim()
+        scale = 0.8 if event.button == "up" else 1.25
+        self._set_view(event.xdata - (event.xdata - x0) * scale, event.xdata + (x1 - event.xdata) * scale)
+
+    def _on_press(self, event):
+        if self._series is None or event.inaxes is not self.ax:
+            return
+        if event.dblclick:
+            self._set_view(self._limits[0], self._limits[1])
+        elif event.button == 1:
+            self._pan_start = (event.x, self.ax.get_xlim())
+
+    def _on_motion(self, event):
+        if self._pan_start is None:
+            return
+        start_px, (x0, x1) = self._pan_start
+        shift = (event.x - start_px) * (x1 - x0) / max(self.ax.bbox.width, 1)
+        self._set_view(x0 - shift, x1 - shift)
+
+    def _on_release(self, event):
+        self._pan_start = None
+
+    # ----------------- blit -----------------
+    def _on_draw(self, event):
+        self._background = self.canvas.copy_from_bbox(self.fig.bbox)
+        if self._decimated_for != self._view_key():
+            self._decimate()
+        self._draw_animated()
+
+    def _draw_animated(self):
+        for artist in self._animated:
+            self.fig.draw_artist(artist)
+
+    def _request_blit(self):
+        if self._blit_pending:
+            return
+        self._blit_pending = True
+        QTimer.singleShot(0, self._blit)
+
+    def _blit(self):
+        self._blit_pending = False
+        if self._background is None:
+            # 아직 한 번도 그려지지 않음 (창 표시 전 등) → 전체 그리기 예약
+            self.canvas.draw_idle()
+            return
+        self.canvas.restore_region(self._background)
+        self._draw_animated()
+        self.canvas.blit(self.fig.bbox)
+
+
+class ZoneOverview(QLabel):
+    """
+    zone 전체 small multiples (행: Normal / High, 열: zone)
+    - Agg로 1번 렌더링한 결과를 QPixmap으로 보관 → 표시/크기 변경 시 다시 그리지 않음
+    - 데이터가 바뀌었을 때만 무효화, 화면에 보일 때 다시 렌더링
+    - 작은 그래프를 클릭하면 zone_clicked(zone) 발생
+    """
+    zone_clicked = pyqtSignal(int)
+    COLUMNS = 8  # 한 줄에 표시할 zone 수 (넘으면 줄바꿈)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.series = {"normal": None, "high": None}
+        self._pixmap = None
+        self._cells = []   # [(x0, y0, x1, y1) 픽스맵 비율 좌표, zone]
+        self._dirty = True
+        self.setMinimumHeight(160)
+        self.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Preferred)
+        self.setAlignment(Qt.AlignmentFlag.AlignCenter)
+
+    def set_series(self, area, series):
+        self.series[area] = series
+        self._dirty = True
+        if self.isVisible():
+            self.render()
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        if self._dirty:
+            self.render()
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        if self._pixmap is not None:
+            self.setPixmap(self._pixmap.scaled(
+                self.size(), Qt.AspectRatioMode.IgnoreAspectRatio, Qt.TransformationMode.SmoothTransformation
+            ))
+
+    def render(self):
+        self._dirty = False
+        areas = [(area, s) for area, s in self.series.items() if s is not None]
+        if not areas:
+            self._pixmap = None
+            self._cells = []
+            self.clear()
+            self.setText("데이터 없음")
+            return
+
+        zones = max(s.zones for _, s in areas)
+        cols = min(zones, self.COLUMNS)
+        area_rows = [-(-s.zones // cols) for _, s in areas]
+        width, height = max(self.width(), 400), max(self.height(), 160)
+
+        fig = Figure(figsize=(width / 100, height / 100), dpi=100)
+        canvas = FigureCanvasAgg(fig)
+        grid = fig.add_gridspec(sum(area_rows), cols, hspace=0.5, wspace=0.15,
+                                left=0.01, right=0.99, top=0.92, bottom=0.03)
+
+        self._cells = []
+        first_row = 0
+        for (area, s), n_rows in zip(areas, area_rows):
+            for z in range(s.zones):
+                ax = fig.add_subplot(grid[first_row + z // cols, z % cols])
+                for i, values in enumerate(s.zone(z + 1)[:3]):
+                    if values is not None:
+                        ax.plot(s.x, values, linewidth=0.8, color=f"C{i}")
+                ax.set_xticks([])
+                ax.set_yticks([])
+                ax.set_title(f"{area[0].upper()} Z{z + 1}", fontsize=7, pad=2)
+
+                box = ax.get_position()
+                self._cells.append(((box.x0, 1 - box.y1, box.x1, 1 - box.y0), z + 1))
+            first_row += n_rows
+
+        canvas.draw()
+        w, h = canvas.get_width_height()
+        image = QImage(canvas.buffer_rgba(), w, h, QImage.Format.Format_RGBA8888).copy()
+        self._pixmap = QPixmap.fromImage(image)
+        self.setPixmap(self._pixmap.scaled(
+            self.size(), Qt.AspectRatioMode.IgnoreAspectRatio, Qt.TransformationMode.SmoothTransformation
+        ))
+        logger.debug(f"zone overview 렌더링: {len(areas)}개 run, zone {zones}개")
+
+    def mousePressEvent(self, event):
+        if self.width() <= 0 or self.height() <= 0:
+            return
+        fx = event.position().x() / self.width()
+        fy = event.position().y() / self.height()
+        for (x0, y0, x1, y1), zone in self._cells:
+            if x0 <= fx <= x1 and y0 <= fy <= y1:
+                self.zone_clicked.emit(zone)
+                return
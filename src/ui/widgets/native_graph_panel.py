@@ -0,0 +1,355 @@
+# src/ui/widgets/native_graph_panel.py
+"""
+QPainter backend 온도 그래프 패널 / zone overview (UI_SETTINGS['GRAPH_BACKEND'] == "native")
+- matplotlib 없이 배열 → QPolygonF 로 직접 그림 (시작 시간 / 메모리 / 갱신 지연 감소)
+- 모양, 확대/이동 조작, 다운샘플링은 matplotlib backend(mpl_graph_panel)와 동일
+"""
+import numpy as np
+from PyQt6.QtWidgets import QWidget, QSizePolicy
+from PyQt6.QtCore import Qt, QPointF, QRectF, pyqtSignal
+from PyQt6.QtGui import QColor, QPainter, QPen, QPixmap, QPolygonF
+
+from src.utils.decimation import minmax_decimate
+from src.utils.graph_axes import SERIES_NAMES, axis_limits, clamp_view, data_range, nice_ticks
+from src.utils.logger_config import setup_logger
+
+logger = setup_logger('native_graph_panel')
+
+# matplotlib 기본 색상 순서 (SP / PTC / CTC) → backend를 바꿔도 색이 같음
+SERIES_COLORS = {"SP": QColor("#1f77b4"), "PTC": QColor("#ff7f0e"), "CTC": QColor("#2ca02c")}
+GRID_COLOR = QColor(176, 176, 176)
+MARGINS = (56, 28, 12, 40)  # 그래프 영역 바깥 여백 (left, top, right, bottom)
+
+
+def _polylines(x, y, xlim, ylim, rect, buckets):
+    """
+    (x, y) 배열을 보이는 범위 기준으로 다운샘플링한 뒤 rect 안의 픽셀 좌표 QPolygonF 목록으로 변환
+    NaN(빈 샘플)에서 선을 끊음 (matplotlib과 같음)
+    """
+    xs, ys = minmax_decimate(x, y, buckets, xlim)
+    px = rect.left() + (xs - xlim[0]) * (rect.width() / (xlim[1] - xlim[0]))
+    py = rect.bottom() - (ys - ylim[0]) * (rect.height() / (ylim[1] - ylim[0]))
+    finite = np.isfinite(py)
+    if finite.all():
+        bounds = [(0, len(py))]
+    else:
+        edges = np.flatnonzero(np.diff(np.concatenate(([0], finite.astype(np.int8), [0]))))
+        bounds = zip(edges[::2], edges[1::2])
+    return [
+        QPolygonF([QPointF(a, b) for a, b in zip(px[i0:i1].tolist(), py[i0:i1].tolist())])
+        for i0, i1 in bounds
+    ]
+
+
+def _tick_label(value):
+    return f"{value:g}"
+
+
+class NativeGraphPanel(QWidget):
+    """
+    Normal / High 그래프 1개 (GraphPanel과 같은 API: set_series / set_empty / widget)
+    - 축 / grid / 눈금 / legend는 QPixmap 1장에 캐시 → 축 범위 / 크기 / 선 구성이 바뀔 때만 다시 그림
+    - 선은 보이는 x 범위 / 가로 픽셀 수 기준 min/max 다운샘플링 결과를 캐시
+      (zone 전환 / 새 샘플이 오면 선만 다시 계산, 그리기는 update()로 Qt가 합쳐서 1번)
+    - 마우스 휠: x축 확대/축소, 드래그: 이동, 더블클릭: 전체 보기
+    """
+    def __init__(self, title, parent=None):
+        super().__init__(parent)
+        self.title = title
+        self.widget = self  # 레이아웃에 넣을 위젯
+
+        self._title_text = f"{title} (데이터 없음)"
+        self._max_text = ""
+        self._series = None        # 원본 [(이름, x, y)]
+        self._legend = tuple((name, SERIES_COLORS[name].name()) for name in SERIES_NAMES)
+        self._limits = None        # 전체 보기 (xmin, xmax, ymin, ymax)
+        self._view = None          # 현재 보이는 x 범위
+        self._background = None
+        self._background_key = None
+        self._polylines = []
+        self._polylines_key = None
+        self._pan_start = None
+
+        self.setMinimumSize(200, 150)
+        self.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
+
+    def sizeHint(self):
+        return self.minimumSize() * 2
+
+    def set_empty(self, message="데이터 없음"):
+        self._series = None
+        self._polylines = []
+        self._polylines_key = None
+        self._max_text = ""
+        self._title_text = f"{self.title} ({message})"
+        self.update()
+
+    def set_series(self, zone, x, sp, ptc, ctc, max_ptc=None, y_range=None, x_range=None):
+        """
+        x, sp, ptc, ctc: 같은 길이의 배열 (로그에 없는 signal은 None → 선 / legend 없음)
+        y_range: (min, max) 축 범위 기준. run 전체 zone 범위를 주면 zone 전환 시 축이 바뀌지 않음
+        x_range: (min, max) x축 범위 (None이면 x 전체, 실시간 모드에서는 스크롤 창)
+        """
+        present = [(name, y) for name, y in zip(SERIES_NAMES, (sp, ptc, ctc)) if y is not None]
+        self.set_traces(
+            f"{self.title} - Z{zone}",
+            [(name, x, y) for name, y in present],
+            f"PTC max: {max_ptc:.1f}" if max_ptc is not None else "",
+            y_range, x_range,
+            [SERIES_COLORS[name].name() for name, _ in present],
+        )
+
+    def set_traces(self, title, traces, text="", y_range=None, x_range=None, colors=None):
+        """
+        선 여러 개 표시 (run 비교 등)
+        traces: [(이름, x, y)], 이름은 legend 표시용
+        colors: 선 색 목록 (hex 문자열, None이면 SP / PTC / CTC 기본 색 순서)
+        """
+        if colors is None:
+            palette = list(SERIES_COLORS.values())
+            colors = [palette[i % len(palette)].name() for i in range(len(traces))]
+        self._series = traces
+        self._legend = tuple((name, color) for (name, _, _), color in zip(traces, colors))
+        self._polylines_key = None
+        self._max_text = text
+        self._title_text = title
+
+        filled = [(x, y) for _, x, y in traces if len(x)]
+        if y_range is None:
+            y_range = data_range([y for _, y in filled])
+        if x_range is None:
+            x_range = (min(x[0] for x, _ in filled), max(x[-1] for x, _ in filled)) if filled else (0, 1)
+        limits = axis_limits(x_range, y_range)
+        if limits != self._limits:
+            # 새 run / 스크롤 → 확대 상태 초기화
+            self._limits = limits
+            self._view = (limits[0], limits[1])
+        self.update()
+
+    # ----------------- 좌표 -----------------
+    def _plot_rect(self):
+        left, top, right, bottom = MARGINS
+        return QRectF(left, top, max(self.width() - left - right, 1), max(self.height() - top - bottom, 1))
+
+    def _ylim(self):
+        return (self._limits[2], self._limits[3]) if self._limits else (0.0, 1.0)
+
+    # ----------------- 그리기 -----------------
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        rect = self._plot_rect()
+        xlim = self._view or (0.0, 1.0)
+        ylim = self._ylim()
+
+        key = (xlim, ylim, self.width(), self.height())
+        if self._background_key != key + (self._legend,):
+            self._background = self._render_background(rect, xlim, ylim)
+            self._background_key = key + (self._legend,)
+        painter.drawPixmap(0, 0, self._background)
+
+        if self._series is not None:
+            if self._polylines_key != key:
+                buckets = max(int(rect.width()), 1)
+                self._polylines = [_polylines(x, y, xlim, ylim, rect, buckets) for _, x, y in self._series]
+                self._polylines_key = key
+
+            painter.save()
+            painter.setClipRect(rect)
+            painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+            for (_, color), polylines in zip(self._legend, self._polylines):
+                painter.setPen(QPen(QColor(color), 1.5))
+                for polyline in polylines:
+                    painter.drawPolyline(polyline)
+            painter.restore()
+
+        # 제목 / 좌측 상단 PTC 최대값
+        painter.setPen(Qt.GlobalColor.black)
+        painter.drawText(QRectF(0, 0, self.width(), rect.top()), Qt.AlignmentFlag.AlignCenter, self._title_text)
+        if self._max_text:
+            painter.drawText(rect.adjusted(6, 4, 0, 0), Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignTop, self._max_text)
+        painter.end()
+
+    def _render_background(self, rect, xlim, ylim):
+        """흰 배경 + 테두리 + 점선 grid + 눈금 라벨 + 축 이름 + legend"""
+        pixmap = QPixmap(self.size())
+        pixmap.fill(Qt.GlobalColor.white)
+        painter = QPainter(pixmap)
+        metrics = painter.fontMetrics()
+        text_h = metrics.height()
+
+        grid_pen = QPen(GRID_COLOR, 1, Qt.PenStyle.DashLine)
+        x_scale = rect.width() / (xlim[1] - xlim[0])
+        y_scale = rect.height() / (ylim[1] - ylim[0])
+
+        for value in nice_ticks(xlim[0], xlim[1], max(int(rect.width() // 80), 2)):
+            px = rect.left() + (value - xlim[0]) * x_scale
+            painter.setPen(grid_pen)
+            painter.drawLine(QPointF(px, rect.top()), QPointF(px, rect.bottom()))
+            painter.setPen(Qt.GlobalColor.black)
+            painter.drawText(QRectF(px - 40, rect.bottom() + 2, 80, text_h), Qt.AlignmentFlag.AlignHCenter, _tick_label(value))
+
+        for value in nice_ticks(ylim[0], ylim[1], max(int(rect.height() // 40), 2)):
+            py = rect.bottom() - (value - ylim[0]) * y_scale
+            painter.setPen(grid_pen)
+            painter.drawLine(QPointF(rect.left(), py), QPointF(rect.right(), py))
+            painter.setPen(Qt.GlobalColor.black)
+            painter.drawText(
+                QRectF(0, py - text_h / 2, rect.left() - 4, text_h),
+                Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter, _tick_label(value)
+            )
+
+        painter.setPen(Qt.GlobalColor.black)
+        painter.drawRect(rect)
+        painter.drawText(
+            QRectF(rect.left(), self.height() - text_h - 2, rect.width(), text_h),
+            Qt.AlignmentFlag.AlignHCenter, "Index"
+        )
+        painter.save()
+        painter.translate(2, rect.center().y())
+        painter.rotate(-90)
+        painter.drawText(QRectF(-rect.height() / 2, 0, rect.height(), text_h), Qt.AlignmentFlag.AlignHCenter, "Temperature")
+        painter.restore()
+
+        # legend (우측 하단, 그릴 선이 없으면 생략)
+        if self._legend:
+            label_w = max((metrics.horizontalAdvance(name) for name, _ in self._legend), default=0)
+            box = QRectF(0, 0, label_w + 36, text_h * len(self._legend) + 8)
+            box.moveBottomRight(rect.bottomRight() - QPointF(6, 6))
+            painter.setPen(GRID_COLOR)
+            painter.setBrush(Qt.GlobalColor.white)
+            painter.drawRect(box)
+            for i, (name, color) in enumerate(self._legend):
+                y = box.top() + 4 + text_h * (i + 0.5)
+                painter.setPen(QPen(QColor(color), 2))
+                painter.drawLine(QPointF(box.left() + 4, y), QPointF(box.left() + 24, y))
+                painter.setPen(Qt.GlobalColor.black)
+                painter.drawText(QRectF(box.left() + 28, y - text_h / 2, label_w + 4, text_h), Qt.AlignmentFlag.AlignVCenter, name)
+
+        painter.end()
+        return pixmap
+
+    # ----------------- 확대 / 이동 -----------------
+    def _set_view(self, x0, x1):
+        if self._limits is None:
+            return
+        self._view = clamp_view(x0, x1, self._limits[0], self._limits[1])
+        self.update()
+
+    def _data_x(self, px):
+        rect = self._plot_rect()
+        x0, x1 = self._view
+        return x0 + (px - rect.left()) * (x1 - x0) / rect.width()
+
+    def wheelEvent(self, event):
+        if self._series is None or not self._plot_rect().contains(event.position()):
+            return
+        center = self._data_x(event.position().x())
+        x0, x1 = self._view
+        scale = 0.8 if event.angleDelta().y() > 0 else 1.25
+        self._set_view(center - (center - x0) * scale, center + (x1 - center) * scale)
+
+    def mousePressEvent(self, event):
+        if self._series is None or event.button() != Qt.MouseButton.LeftButton:
+            return
+        if self._plot_rect().contains(event.position()):
+            self._pan_start = (event.position().x(), self._view)
+
+    def mouseDoubleClickEvent(self, event):
+        if self._series is not None and self._plot_rect().contains(event.position()):
+            self._set_view(self._limits[0], self._limits[1])
+
+    def mouseMoveEvent(self, event):
+        if self._pan_start is None:
+            return
+        start_px, (x0, x1) = self._pan_start
+        shift = (event.position().x() - start_px) * (x1 - x0) / self._plot_rect().width()
+        self._set_view(x0 - shift, x1 - shift)
+
+    def mouseReleaseEvent(self, event):
+        self._pan_start = None
+
+
+class NativeZoneOverview(QWidget):
+    """
+    zone 전체 small multiples (ZoneOverview와 같은 API: set_series / zone_clicked)
+    - QPixmap 1장에 렌더링해서 보관 → 데이터 / 크기가 바뀔 때만 다시 그림
+    - 칸마다 가로 픽셀 수 기준 min/max 다운샘플링
+    """
+    zone_clicked = pyqtSignal(int)
+    COLUMNS = 8  # 한 줄에 표시할 zone 수 (넘으면 줄바꿈)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.series = {"normal": None, "high": None}
+        self._pixmap = None
+        self._cells = []   # [(QRectF 위젯 좌표, zone)]
+        self.setMinimumHeight(160)
+        self.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Preferred)
+
+    def set_series(self, area, series):
+        self.series[area] = series
+        self._pixmap = None
+        self.update()
+
+    def paintEvent(self, event):
+        if self._pixmap is None or self._pixmap.size() != self.size():
+            self._pixmap = self.render_pixmap()
+        painter = QPainter(self)
+        painter.drawPixmap(0, 0, self._pixmap)
+        painter.end()
+
+    def render_pixmap(self):
+        pixmap = QPixmap(self.size())
+        pixmap.fill(Qt.GlobalColor.white)
+        painter = QPainter(pixmap)
+        self._cells = []
+
+        areas = [(area, s) for area, s in self.series.items() if s is not None and s.length]
+        if not areas:
+            painter.drawText(QRectF(pixmap.rect()), Qt.AlignmentFlag.AlignCenter, "데이터 없음")
+            painter.end()
+            return pixmap
+
+        zones = max(s.zones for _, s in areas)
+        cols = min(zones, self.COLUMNS)
+        total_rows = sum(-(-s.zones // cols) for _, s in areas)
+        cell_w = self.width() / cols
+        cell_h = self.height() / total_rows
+        text_h = painter.fontMetrics().height()
+
+        first_row = 0
+        for area, s in areas:
+            ylim = axis_limits(s.x_range, s.y_range)[2:]
+            for z in range(s.zones):
+                data = s.zone(z + 1)
+                outer = QRectF((z % cols) * cell_w, (first_row + z // cols) * cell_h, cell_w, cell_h)
+                painter.setPen(Qt.GlobalColor.black)
+                painter.drawText(
+                    QRectF(outer.left(), outer.top(), outer.width(), text_h),
+                    Qt.AlignmentFlag.AlignHCenter, f"{area[0].upper()} Z{z + 1}"
+                )
+                plot = outer.adjusted(3, text_h + 1, -3, -3)
+                painter.setPen(GRID_COLOR)
+                painter.drawRect(plot)
+                self._cells.append((outer, z + 1))
+                if data is None:
+                    continue
+
+                xlim = (s.x_range[0], max(s.x_range[1], s.x_range[0] + 1))
+                for name, values in zip(SERIES_NAMES, data[:3]):
+                    if values is None:
+                        continue
+                    painter.setPen(QPen(SERIES_COLORS[name], 1))
+                    for polyline in _polylines(s.x, values, xlim, ylim, plot, max(int(plot.width()), 1)):
+                        painter.drawPolyline(polyline)
+            first_row += -(-s.zones // cols)
+
+        painter.end()
+        logger.debug(f"zone overview 렌더링: {len(areas)}개 run, zone {zones}개")
+        return pixmap
+
+    def mousePressEvent(self, event):
+        for rect, zone in self._cells:
+            if rect.contains(event.position()):
+                self.zone_clicked.emit(zone)
+                return
@@ -0,0 +1,102 @@
+# src/ui/widgets/param_table_model.py
+import numpy as np
+from PyQt6.QtCore import QAbstractTableModel, QModelIndex, Qt
+
+from src.utils.logger_config import setup_logger
+
+logger = setup_logger('param_table_model')
+
+INT16_MIN, INT16_MAX = -32768, 32767
+
+
+class ParamTableModel(QAbstractTableModel):
+    """
+    파라미터 테이블 (행: P1 / P2, 열: zone) 모델
+    - 값은 (rows x cols) int16 배열 1개에 보관 → 셀마다 item 객체를 만들지 않음
+    - set_values(): 이전 값과 비교해서 바뀐 셀이 있는 행 구간만 dataChanged
+    - values: PLC block write에 그대로 쓰는 배열 (복사 없음)
+    - 셀 직접 수정 가능 (INT16 범위로 제한)
+    """
+    def __init__(self, rows, cols, row_labels=("P1", "P2"), parent=None):
+        super().__init__(parent)
+        self.values = np.zeros((rows, cols), dtype=np.int16)
+        self.row_labels = list(row_labels)
+
+    # ----------------- Qt 모델 API -----------------
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self.values.shape[0]
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self.values.shape[1]
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        if role in (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.EditRole):
+            return int(self.values[index.row(), index.column()])
+        if role == Qt.ItemDataRole.TextAlignmentRole:
+            return Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter
+        return None
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role != Qt.ItemDataRole.DisplayRole:
+            return None
+        if orientation == Qt.Orientation.Horizontal:
+            return f"Z{section + 1}"
+        return self.row_labels[section] if section < len(self.row_labels) else str(section + 1)
+
+    def flags(self, index):
+        return (
+            Qt.ItemFlag.ItemIsEnabled
+            | Qt.ItemFlag.ItemIsSelectable
+            | Qt.ItemFlag.ItemIsEditable
+        )
+
+    def setData(self, index, value, role=Qt.ItemDataRole.EditRole):
+        if not index.isValid() or role != Qt.ItemDataRole.EditRole:
+            return False
+        try:
+            value = int(value)
+        except (TypeError, ValueError):
+            logger.warning(f"테이블 값이 정수가 아님: row={index.row()}, col={index.column()}, value='{value}'")
+            return False
+        if not INT16_MIN <= value <= INT16_MAX:
+            logger.warning(f"INT16 범위를 벗어난 값: row={index.row()}, col={index.column()}, value={value}")
+            return False
+
+        self.values[index.row(), index.column()] = value
+        self.dataChanged.emit(index, index, [Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.EditRole])
+        return True
+
+    # ----------------- 값 갱신 -----------------
+    def set_values(self, data):
+        """
+        data: 행 우선 1차원 값 목록 (P1 zone1~N, P2 zone1~N) 또는 2차원 배열
+        개수가 다르면 앞에서부터 채울 수 있는 만큼만 반영
+        return: 바뀐 셀 수
+        """
+        flat = np.asarray(data).ravel()
+        if flat.size != self.values.size:
+            logger.warning(f"테이블 값 개수 불일치: 값={flat.size}, 테이블={self.values.shape[0]}x{self.values.shape[1]}")
+
+        new = self.values.copy()
+        n = min(flat.size, new.size)
+        new.ravel()[:n] = flat[:n].astype(np.int64).clip(INT16_MIN, INT16_MAX)
+
+        changed = new != self.values
+        if not changed.any():
+            return 0
+        self.values[:] = new
+
+        # 행별로 바뀐 첫 열 ~ 마지막 열 구간만 알림
+        for row in np.flatnonzero(changed.any(axis=1)):
+            cols = np.flatnonzero(changed[row])
+            self.dataChanged.emit(
+                self.index(int(row), int(cols[0])), self.index(int(row), int(cols[-1])),
+                [Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.EditRole],
+            )
+        return int(changed.sum())
+
+    def to_list(self):
+        """2차원 list (기존 prev_*_param 형식)"""
+        return self.values.tolist()
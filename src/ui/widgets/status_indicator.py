@@ -0,0 +1,108 @@
+# src/ui/widgets/status_indicator.py
+"""
+상태 표시용 위젯 + 화면 갱신 스케줄러
+- setStyleSheet는 호출할 때마다 스타일 재해석 / polish / 레이아웃을 다시 하므로
+  타이머 tick마다 같은 값을 넣으면 poll 주기만큼 GUI CPU가 늘어남
+- IndicatorLamp / StatusLabel: 마지막으로 그린 상태를 기억 → 바뀔 때만 다시 그림 (palette / paintEvent)
+- UiUpdateScheduler: 상태 변경 요청을 모아 두었다가 최대 INDICATOR_MAX_FPS로 반영
+  (한 프레임 안의 여러 요청은 마지막 값 1개만 적용)
+"""
+from PyQt6.QtWidgets import QLabel, QWidget
+from PyQt6.QtCore import QObject, QTimer, Qt
+from PyQt6.QtGui import QColor, QPainter, QPalette
+
+from src.config.settings import UI_SETTINGS
+from src.utils.logger_config import setup_logger
+
+logger = setup_logger('status_indicator')
+
+
+class IndicatorLamp(QWidget):
+    """원형 상태 램프 (state: 색 이름, 예: "green", "red", "gray")"""
+    def __init__(self, diameter=15, state="red", parent=None):
+        super().__init__(parent)
+        self.setFixedSize(diameter, diameter)
+        self.state = None
+        self._color = None
+        self.set_state(state)
+
+    def set_state(self, state):
+        """상태가 바뀔 때만 다시 그림. return: 바뀌었으면 True"""
+        if state == self.state:
+            return False
+        self.state = state
+        self._color = QColor(state)
+        self.update()
+        return True
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setBrush(self._color)
+        painter.drawEllipse(self.rect())
+        painter.end()
+
+
+class StatusLabel(QLabel):
+    """글자 + 글자색 상태 라벨 (state: (텍스트, 색 이름))"""
+    def __init__(self, text="", color=None, parent=None):
+        super().__init__(parent)
+        self.state = None
+        self.set_state((text, color))
+
+    def set_state(self, state):
+        """텍스트 / 색이 바뀔 때만 반영. return: 바뀌었으면 True"""
+        if state == self.state:
+            return False
+        text, color = state
+        previous = self.state or (None, None)
+        self.state = state
+        if text != previous[0]:
+            self.setText(text)
+        if color != previous[1] and color is not None:
+            palette = self.palette()
+            palette.setColor(QPalette.ColorRole.WindowText, QColor(color))
+            self.setPalette(palette)
+        return True
+
+
+class UiUpdateScheduler(QObject):
+    """
+    위젯 상태 변경 요청을 프레임 단위로 모아서 반영
+    - post(widget, state): 다음 프레임에 widget.set_state(state) (같은 프레임의 이전 요청은 덮어씀)
+    - 요청이 있을 때만 타이머 동작 (유휴 시 CPU 사용 없음)
+    """
+    def __init__(self, max_fps=None, parent=None):
+        super().__init__(parent)
+        fps = max_fps or UI_SETTINGS.get('INDICATOR_MAX_FPS', 10)
+        self._pending = {}
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(int(1000 / max(fps, 1)))
+        self._timer.timeout.connect(self.flush)
+
+    def post(self, widget, state):
+        self._pending[widget] = state
+        if not self._timer.isActive():
+            self._timer.start()
+
+    def flush(self):
+        pending, self._pending = self._pending, {}
+        for widget, state in pending.items():
+            try:
+                widget.set_state(state)
+            except RuntimeError as e:
+                # 이미 삭제된 위젯
+                logger.debug(f"상태 반영 생략: {e}")
+
+
+_default_scheduler = None
+
+
+def get_ui_scheduler() -> UiUpdateScheduler:
+    """공용 스케줄러 (QApplication 생성 후 호출)"""
+    global _default_scheduler
+    if _default_scheduler is None:
+        _default_scheduler = UiUpdateScheduler()
+    return _default_scheduler
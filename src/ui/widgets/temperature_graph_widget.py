@@ -1,235 +1,402 @@
 # src/ui/widgets/temperature_graph_widget.py
 from PyQt6.QtWidgets import (
     QGroupBox, QVBoxLayout, QHBoxLayout,
-    QPushButton, QWidget
+    QPushButton, QWidget, QSpinBox
 )
-from PyQt6.QtCore import pyqtSlot
-from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
-from matplotlib.figure import Figure
+from PyQt6.QtCore import QTimer, pyqtSignal, pyqtSlot
 
+from src.config.settings import COMPARE_SETTINGS, TEMPERATURE_TAG_SETTINGS, UI_SETTINGS
+from src.utils.graph_axes import overlay_colors
 from src.utils.logger_config import setup_logger
+from src.utils.run_catalog import scan_runs, recent_job_runs
+from src.utils.run_loader import RunLoader
+from src.utils.run_series import RunSeries, LiveSeries
+from src.utils.startup_profiler import get_startup_profiler
 
 logger = setup_logger('temperature_graph_widget')
 
 
+def graph_backend_classes(backend=None):
+    """
+    그래프 backend별 (패널 클래스, overview 클래스)
+    - "matplotlib": FigureCanvasQTAgg + blit (기본)
+    - "native": QPainter로 직접 그림 (matplotlib import / 폰트 설정 없음 → 저사양 PC용)
+    사용하는 backend 모듈만 import (matplotlib 폰트 설정도 여기서 처음 1번)
+    """
+    backend = backend or UI_SETTINGS.get('GRAPH_BACKEND', 'matplotlib')
+    if backend == "native":
+        from src.ui.widgets.native_graph_panel import NativeGraphPanel, NativeZoneOverview
+        return NativeGraphPanel, NativeZoneOverview
+    if backend != "matplotlib":
+        logger.warning(f"알 수 없는 그래프 backend: {backend} → matplotlib 사용")
+    from src.config.mpl_config import setup_korean_font
+    setup_korean_font()
+    from src.ui.widgets.mpl_graph_panel import GraphPanel, ZoneOverview
+    return GraphPanel, ZoneOverview
+
+
 class TemperatureGraphWidget(QGroupBox):
     """
-    Zone1~8 선택 버튼 + Normal/High 온도 그래프 표시 위젯
+    Zone1~N 선택 버튼 + Normal/High 온도 그래프 표시 위젯
     - 외부에서 normal_rows, high_rows 받아와서 update_normal_graph(), update_high_graph() 호출
     - zone 버튼 누르면 선택된 zone 기준으로 다시 그리기
+    - zone 버튼 수는 설정값으로 시작, 받은 rows의 헤더(SP1 ~ SPn)에 맞춰 다시 생성
+    - rows를 받을 때 zone 전체 series를 1번만 파싱(RunSeries) → zone 전환은 배열 선택만
+    - "전체 zone" 버튼: zone 전체 small multiples (ZoneOverview) 표시
+    - 실시간 모드: start_live() 후 append_live_sample()로 샘플 추가
+      최근 LIVE_WINDOW_SAMPLES개만 ring buffer(LiveSeries)에 보관, 화면 갱신은 LIVE_MAX_FPS로 제한
+      run 종료 후 set_*_rows()가 호출되면 전체 run 표시로 전환
+    - "run 비교" 버튼: 현재 tube의 최근 N개 job run에서 선택 zone의 PTC를 겹쳐 표시
+      run은 RunLoader(스레드 풀 + 메모리 제한 LRU)로 백그라운드 로드, 도착하는 대로 추가로 그림
+    - 그래프 backend는 UI_SETTINGS['GRAPH_BACKEND'] ("matplotlib" / "native")로 선택
+      backend import / 그래프 생성은 창이 처음 표시된 뒤(ensure_panels)로 미룸 → 창이 먼저 뜸
     """
-    def __init__(self, parent=None):
+    # (비교 요청 번호, 경로, RunSeries | None): loader 스레드 → UI 스레드
+    run_loaded = pyqtSignal(int, object, object)
+
+    def __init__(self, parent=None, backend=None):
         super().__init__("온도 그래프")
         self.parent = parent
+        self.backend = backend
+        self.panel_class = self.overview_class = None
+        self.overview = self.normal_panel = self.high_panel = None
 
         self.current_zone = 1
+        self.zone_count = 0
         self.normal_rows = None
         self.high_rows = None
+        self.normal_series = None
+        self.high_series = None
+        self._live_dirty = set()
+
+        # run 비교 모드
+        self.tube_id = None
+        self.run_loader = None   # 처음 비교할 때 생성 (스레드 풀)
+        self.compare_runs = {"normal": [], "high": []}   # area별 RunFile (오래된 job → 최신 job)
+        self.compare_series = {}  # 경로 → RunSeries | None (현재 비교 요청에서 로드 끝난 것)
+        self._compare_generation = 0
+        self.run_loaded.connect(self._on_run_loaded)
 
         self._init_ui()
 
+        # 실시간 모드 화면 갱신 타이머 (샘플이 들어온 area만 다시 그림)
+        self.live_timer = QTimer(self)
+        self.live_timer.setInterval(int(1000 / max(UI_SETTINGS.get('LIVE_MAX_FPS', 4), 1)))
+        self.live_timer.timeout.connect(self._flush_live)
+
     def _init_ui(self):
         main_layout = QVBoxLayout(self)
 
-        # 1) Zone1~8 버튼 줄
+        # 1) Zone1~N 버튼 줄
         button_bar = QWidget()
-        button_layout = QHBoxLayout(button_bar)
-        button_layout.setContentsMargins(0, 0, 0, 0)
+        self.button_layout = QHBoxLayout(button_bar)
+        self.button_layout.setContentsMargins(0, 0, 0, 0)
 
         self.zone_buttons = []
-        for i in range(8):
-            btn = QPushButton(f"Z{i+1}")
-            btn.setCheckable(True)
-            if i == 0:
-                btn.setChecked(True)
-            btn.clicked.connect(self._make_zone_clicked_handler(i + 1))
-            button_layout.addWidget(btn)
-            self.zone_buttons.append(btn)
+        self.compare_count = QSpinBox()
+        self.compare_count.setRange(2, 50)
+        self.compare_count.setValue(COMPARE_SETTINGS['RUN_COUNT'])
+        self.compare_count.setPrefix("최근 ")
+        self.compare_count.setSuffix("개 job")
+        self.compare_count.valueChanged.connect(self._on_compare_count_changed)
+        self.button_layout.addWidget(self.compare_count)
+
+        self.compare_button = QPushButton("run 비교")
+        self.compare_button.setCheckable(True)
+        self.compare_button.toggled.connect(self._toggle_compare)
+        self.button_layout.addWidget(self.compare_button)
+
+        self.overview_button = QPushButton("전체 zone")
+        self.overview_button.setCheckable(True)
+        self.overview_button.toggled.connect(self._toggle_overview)
+        self.button_layout.addWidget(self.overview_button)
+        self.set_zone_count(TEMPERATURE_TAG_SETTINGS['ZONE_COUNT'])
 
         main_layout.addWidget(button_bar)
 
-        # 2) Normal / High 그래프 영역
-        graph_row = QHBoxLayout()
+        # 2) overview / Normal / High 그래프 영역 (ensure_panels()에서 채움)
+        self.graph_layout = QVBoxLayout()
+        main_layout.addLayout(self.graph_layout, stretch=1)
 
-        # Normal graph
-        self.normal_fig = Figure(figsize=(4, 3))
-        self.normal_canvas = FigureCanvas(self.normal_fig)
-        self.normal_ax = self.normal_fig.add_subplot(111)
-        self.normal_ax.set_title("Normal 온도 그래프")
-        self.normal_ax.set_xlabel("Time (index)")
-        self.normal_ax.set_ylabel("Temperature")
+    def showEvent(self, event):
+        super().showEvent(event)
+        if self.normal_panel is None:
+            # 창을 먼저 그린 뒤 다음 event loop에서 그래프 생성
+            QTimer.singleShot(0, self.ensure_panels)
 
-        # High graph
-        self.high_fig = Figure(figsize=(4, 3))
-        self.high_canvas = FigureCanvas(self.high_fig)
-        self.high_ax = self.high_fig.add_subplot(111)
-        self.high_ax.set_title("High 온도 그래프")
-        self.high_ax.set_xlabel("Time (index)")
-        self.high_ax.set_ylabel("Temperature")
-
-        graph_row.addWidget(self.normal_canvas)
-        graph_row.addWidget(self.high_canvas)
+    def ensure_panels(self):
+        """그래프 backend import + overview / 패널 생성 (처음 1번만, 그 전에 받은 데이터는 바로 그림)"""
+        if self.normal_panel is not None:
+            return
+        with get_startup_profiler().phase("graph panels (deferred)"):
+            self._build_panels()
 
-        main_layout.addLayout(graph_row)
+    def _build_panels(self):
+        self.panel_class, self.overview_class = graph_backend_classes(self.backend)
 
-    # ----------------- 버튼 핸들러 -----------------
-    def _make_zone_clicked_handler(self, zone: int):
-        def handler():
-            self.current_zone = zone
-            # 토글: 한 개만 체크되도록 처리
-            for i, b in enumerate(self.zone_buttons, start=1):
-                b.setChecked(i == zone)
-            logger.info(f"Zone {zone} 선택")
-            self.redraw_all()
-        return handler
+        # zone 전체 small multiples (기본 숨김)
+        self.overview = self.overview_class()
+        self.overview.zone_clicked.connect(self.select_zone)
+        self.overview.setVisible(self.overview_button.isChecked())
+        self.graph_layout.addWidget(self.overview)
 
-    # ----------------- 외부에서 호출하는 API -----------------
-    def set_normal_rows(self, rows):
-        """TriggerMonitor에서 normal CSV 읽은 rows를 넘겨줄 때 사용"""
-        self.normal_rows = rows
-        self.update_normal_graph()
+        graph_row = QHBoxLayout()
 
-    def set_high_rows(self, rows):
-        """TriggerMonitor에서 high CSV 읽은 rows를 넘겨줄 때 사용"""
-        self.high_rows = rows
-        self.update_high_graph()
+        self.normal_panel = self.panel_class("Normal 온도 그래프")
+        self.high_panel = self.panel_class("High 온도 그래프")
 
-    def redraw_all(self):
-        self.update_normal_graph()
-        self.update_high_graph()
+        graph_row.addWidget(self.normal_panel.widget)
+        graph_row.addWidget(self.high_panel.widget)
 
-    def _extract_series(self, rows, prefix: str, zone: int):
-        """
-        rows: CSV 전체 rows (0번: 헤더)
-        prefix: 'SP', 'PTC', 'CTC'
-        zone: 1~8
-        return: 해당 컬럼의 float 리스트
-        """
-        if not rows or len(rows) < 2:
-            return []
-
-        header = rows[0]
-        col_name = f"{prefix}{zone}"
-
-        try:
-            col_idx = header.index(col_name)
-        except ValueError:
-            logger.warning(f"헤더에서 컬럼 '{col_name}' 을(를) 찾을 수 없습니다.")
-            return []
-
-        series = []
-        for row in rows[1:]:  # 데이터 행만
-            if len(row) <= col_idx:
-                continue
-            raw = row[col_idx]
-            try:
-                series.append(float(raw))
-            except (TypeError, ValueError):
-                # 숫자로 안 바뀌면 0 처리
-                series.append(0.0)
-
-        return series
+        self.graph_layout.addLayout(graph_row)
 
-    # ----------------- 실제 그래프 그리기 -----------------
-    @pyqtSlot()
-    def update_normal_graph(self):
-        self.normal_ax.clear()
+        for area in ("normal", "high"):
+            series = getattr(self, f"{area}_series")
+            if isinstance(series, RunSeries):
+                self.overview.set_series(area, series)
+        self.redraw_all()
 
-        if not self.normal_rows:
-            self.normal_ax.set_title("Normal 온도 그래프 (데이터 없음)")
-            self.normal_canvas.draw()
+    def set_zone_count(self, zone_count: int):
+        """zone 선택 버튼을 zone_count개로 다시 생성 (같은 수면 그대로 유지)"""
+        if zone_count <= 0 or zone_count == self.zone_count:
             return
 
-        # 현재 선택된 zone 기준으로 SP, PTC, CTC만 뽑기
-        sp = self._extract_series(self.normal_rows, "SP", self.current_zone)
-        ptc = self._extract_series(self.normal_rows, "PTC", self.current_zone)
-        ctc = self._extract_series(self.normal_rows, "CTC", self.current_zone)
-
-        # PTC 원본값(패딩 전)으로 최대값 계산
-        ptc_original = ptc[:]  # 복사본
-        max_ptc = max(ptc_original) if ptc_original else None
+        for btn in self.zone_buttons:
+            self.button_layout.removeWidget(btn)
+            btn.setParent(None)
+            btn.deleteLater()
+        self.zone_buttons = []
 
-        # x축은 데이터 인덱스 (0,1,2,...)
-        length = max(len(sp), len(ptc), len(ctc))
-        x = list(range(length))
+        self.zone_count = zone_count
+        if self.current_zone > zone_count:
+            self.current_zone = 1
 
-        # 부족한 쪽은 길이 맞춰주기
-        def pad(seq):
-            return seq + [seq[-1] if seq else 0.0] * (length - len(seq))
+        for i in range(zone_count):
+            btn = QPushButton(f"Z{i+1}")
+            btn.setCheckable(True)
+            if i + 1 == self.current_zone:
+                btn.setChecked(True)
+            btn.clicked.connect(self._make_zone_clicked_handler(i + 1))
+            self.button_layout.insertWidget(i, btn)
+            self.zone_buttons.append(btn)
 
-        sp = pad(sp)
-        ptc = pad(ptc)
-        ctc = pad(ctc)
+        logger.info(f"zone 버튼 {zone_count}개 구성")
 
-        self.normal_ax.plot(x, sp, label="SP")
-        self.normal_ax.plot(x, ptc, label="PTC")
-        self.normal_ax.plot(x, ctc, label="CTC")
+    def _sync_zone_count(self):
+        """현재 normal/high run의 zone 수에 맞춰 버튼 수 맞추기"""
+        series = [self.normal_series, self.high_series]
+        if self.compare_button.isChecked():
+            series += list(self.compare_series.values())
+        counts = [s.zones for s in series if s is not None]
+        if counts:
+            self.set_zone_count(max(counts))
 
-        # 그리드 켜기
-        self.normal_ax.grid(True, which="both", linestyle="--", alpha=0.4)
+    # ----------------- 버튼 핸들러 -----------------
+    def _make_zone_clicked_handler(self, zone: int):
+        def handler():
+            self.select_zone(zone)
+        return handler
 
-        self.normal_ax.set_title(f"Normal 온도 그래프 - Z{self.current_zone}")
-        self.normal_ax.set_xlabel("Index")
-        self.normal_ax.set_ylabel("Temperature")
-        self.normal_ax.legend()
+    @pyqtSlot(int)
+    def select_zone(self, zone: int):
+        self.current_zone = zone
+        # 토글: 한 개만 체크되도록 처리
+        for i, b in enumerate(self.zone_buttons, start=1):
+            b.setChecked(i == zone)
+        logger.info(f"Zone {zone} 선택")
+        self.redraw_all()
 
-        # PTC 최대값 텍스트로 표시 (좌측 상단)
-        if max_ptc is not None:
-            self.normal_ax.text(
-                0.02, 0.95,
-                f"PTC max: {max_ptc:.1f}",
-                transform=self.normal_ax.transAxes,
-                va="top"
-            )
+    def _toggle_overview(self, checked):
+        self.ensure_panels()
+        self.overview.setVisible(checked)
 
-        self.normal_canvas.draw()
+    # ----------------- 외부에서 호출하는 API -----------------
+    def set_normal_rows(self, rows):
+        """TriggerMonitor에서 normal run(RunBuffer 또는 CSV rows)을 넘겨줄 때 사용"""
+        self.normal_rows = rows
+        self._live_dirty.discard("normal")
+        self.normal_series = RunSeries.from_rows(rows)
+        self._sync_zone_count()
+        self.ensure_panels()
+        self.overview.set_series("normal", self.normal_series)
+        self.update_normal_graph()
 
-    @pyqtSlot()
-    def update_high_graph(self):
-        self.high_ax.clear()
+    def set_high_rows(self, rows):
+        """TriggerMonitor에서 high run(RunBuffer 또는 CSV rows)을 넘겨줄 때 사용"""
+        self.high_rows = rows
+        self._live_dirty.discard("high")
+        self.high_series = RunSeries.from_rows(rows)
+        self._sync_zone_count()
+        self.ensure_panels()
+        self.overview.set_series("high", self.high_series)
+        self.update_high_graph()
 
-        if not self.high_rows:
-            self.high_ax.set_title("High 온도 그래프 (데이터 없음)")
-            self.high_canvas.draw()
+    # ----------------- 실시간 모드 -----------------
+    @pyqtSlot(str, int)
+    def start_live(self, temp_area: str, zones: int):
+        """temp_area("normal" / "high") run 로깅 시작 → 해당 그래프를 실시간 표시로 전환"""
+        series = LiveSeries(zones, UI_SETTINGS.get('LIVE_WINDOW_SAMPLES', 600))
+        setattr(self, f"{temp_area}_series", series)
+        setattr(self, f"{temp_area}_rows", None)
+        self.set_zone_count(zones)
+        self._live_dirty.add(temp_area)
+        if not self.live_timer.isActive():
+            self.live_timer.start()
+        logger.info(f"{temp_area} 실시간 그래프 시작 (zone {zones}개, 최근 {series.capacity}샘플)")
+
+    @pyqtSlot(str, object, object, object)
+    def append_live_sample(self, temp_area: str, ptc, ctc, sp):
+        """샘플 1개 추가 (ring buffer 기록만, 그리기는 live_timer에서)"""
+        series = getattr(self, f"{temp_area}_series", None)
+        if not isinstance(series, LiveSeries):
             return
+        series.append(sp, ptc, ctc)
+        self._live_dirty.add(temp_area)
 
-        sp = self._extract_series(self.high_rows, "SP", self.current_zone)
-        ptc = self._extract_series(self.high_rows, "PTC", self.current_zone)
-        ctc = self._extract_series(self.high_rows, "CTC", self.current_zone)
-
-        ptc_original = ptc[:]
-        max_ptc = max(ptc_original) if ptc_original else None
+    def _flush_live(self):
+        live = [area for area in ("normal", "high") if isinstance(getattr(self, f"{area}_series"), LiveSeries)]
+        if not live:
+            self.live_timer.stop()
+            return
+        if self.compare_button.isChecked():
+            # 비교 화면 표시 중 → 샘플은 계속 쌓고 그리기만 생략 (비교 종료 시 redraw_all)
+            self._live_dirty.clear()
+            return
+        for area in live:
+            if area in self._live_dirty:
+                getattr(self, f"update_{area}_graph")()
+        self._live_dirty.clear()
+
+    # ----------------- run 비교 -----------------
+    def set_tube(self, tube_id):
+        """비교 대상 tube 설정 (job 완료 시 호출). 비교 중에 tube가 바뀌면 다시 로드"""
+        changed = tube_id != self.tube_id
+        self.tube_id = tube_id
+        if changed and self.compare_button.isChecked():
+            self.start_compare()
+
+    def _toggle_compare(self, checked):
+        if checked:
+            self.start_compare()
+            return
+        self._compare_generation += 1
+        if self.run_loader is not None:
+            self.run_loader.cancel()
+        self.compare_series = {}
+        self.redraw_all()
+
+    def _on_compare_count_changed(self, count):
+        if self.compare_button.isChecked():
+            self.start_compare()
+
+    def start_compare(self):
+        """현재 tube의 최근 N개 job run을 백그라운드로 로드 시작 (이전 요청은 취소)"""
+        if self.tube_id is None:
+            logger.warning("run 비교: tube 정보 없음 (job 완료 후 사용 가능)")
+            self.compare_button.setChecked(False)
+            return
 
-        length = max(len(sp), len(ptc), len(ctc))
-        x = list(range(length))
+        count = self.compare_count.value()
+        runs = scan_runs(tube_id=self.tube_id)
+        self.compare_runs = {area: recent_job_runs(runs, area, count) for area in ("normal", "high")}
+        self.compare_series = {}
+
+        self._compare_generation += 1
+        generation = self._compare_generation
+        if self.run_loader is None:
+            self.run_loader = RunLoader()
+        # 최신 job부터 로드 → 가장 관심 있는 run이 먼저 그려짐
+        paths = [run.path for area in ("normal", "high") for run in reversed(self.compare_runs[area])]
+        self.run_loader.load(paths, lambda path, series: self.run_loaded.emit(generation, path, series))
+
+        logger.info(
+            f"run 비교 시작: T{self.tube_id}, 최근 {count}개 job "
+            f"(normal {len(self.compare_runs['normal'])}개, high {len(self.compare_runs['high'])}개)"
+        )
+        self.redraw_all()
+
+    @pyqtSlot(int, object, object)
+    def _on_run_loaded(self, generation, path, series):
+        if generation != self._compare_generation:
+            return  # 취소된 이전 요청 결과
+        self.compare_series[path] = series
+        if series is not None:
+            self._sync_zone_count()
+        for area, runs in self.compare_runs.items():
+            if any(run.path == path for run in runs):
+                self._update_compare_panel(area)
+
+    def _update_compare_panel(self, area):
+        panel = getattr(self, f"{area}_panel")
+        runs = self.compare_runs[area]
+        if not runs:
+            panel.set_empty("비교할 run 없음")
+            return
 
-        def pad(seq):
-            return seq + [seq[-1] if seq else 0.0] * (length - len(seq))
+        traces, colors, y_ranges, ptc_max = [], [], [], []
+        for run, color in zip(runs, overlay_colors(len(runs))):
+            series = self.compare_series.get(run.path)
+            data = series.zone(self.current_zone) if series is not None else None
+            if data is None or data[1] is None:
+                continue  # 로딩 중 / 없는 zone / PTC 컬럼 없는 로그
+            traces.append((f"J{run.job_id}", series.x, data[1]))
+            colors.append(color)
+            if series.y_range is not None:
+                y_ranges.append(series.y_range)
+            if data[3] is not None:
+                ptc_max.append(data[3])
+
+        loaded = sum(run.path in self.compare_series for run in runs)
+        if not traces:
+            panel.set_empty(f"Z{self.current_zone} 로딩 중 {loaded}/{len(runs)}")
+            return
 
-        sp = pad(sp)
-        ptc = pad(ptc)
-        ctc = pad(ctc)
+        panel.set_traces(
+            f"{panel.title} - Z{self.current_zone} PTC 비교 ({loaded}/{len(runs)})",
+            traces,
+            f"PTC max: {min(ptc_max):.1f} ~ {max(ptc_max):.1f}" if ptc_max else "",
+            (min(lo for lo, _ in y_ranges), max(hi for _, hi in y_ranges)) if y_ranges else None,
+            (0, max(max(len(x) for _, x, _ in traces) - 1, 1)),
+            colors,
+        )
+
+    def shutdown(self):
+        """창 종료 시 호출: 대기 중인 run 로딩 취소"""
+        self.live_timer.stop()
+        if self.run_loader is not None:
+            self.run_loader.shutdown()
 
-        self.high_ax.plot(x, sp, label="SP")
-        self.high_ax.plot(x, ptc, label="PTC")
-        self.high_ax.plot(x, ctc, label="CTC")
+    def redraw_all(self):
+        self.update_normal_graph()
+        self.update_high_graph()
 
-        # 그리드 켜기
-        self.high_ax.grid(True, which="both", linestyle="--", alpha=0.4)
+    # ----------------- 실제 그래프 그리기 -----------------
+    def _update_panel(self, panel, series):
+        if series is None:
+            panel.set_empty()
+            return
 
-        self.high_ax.set_title(f"High 온도 그래프 - Z{self.current_zone}")
-        self.high_ax.set_xlabel("Index")
-        self.high_ax.set_ylabel("Temperature")
-        self.high_ax.legend()
+        # 미리 파싱해 둔 배열에서 현재 zone만 선택
+        data = series.zone(self.current_zone)
+        if data is None:
+            panel.set_empty(f"Z{self.current_zone} 없음")
+            return
 
-        # PTC 최대값 텍스트 표시
-        if max_ptc is not None:
-            self.high_ax.text(
-                0.02, 0.95,
-                f"PTC max: {max_ptc:.1f}",
-                transform=self.high_ax.transAxes,
-                va="top"
-            )
+        sp, ptc, ctc, max_ptc = data
+        panel.set_series(self.current_zone, series.x, sp, ptc, ctc, max_ptc, series.y_range, series.x_range)
 
-        self.high_canvas.draw()
+    @pyqtSlot()
+    def update_normal_graph(self):
+        self.ensure_panels()
+        if self.compare_button.isChecked():
+            self._update_compare_panel("normal")
+        else:
+            self._update_panel(self.normal_panel, self.normal_series)
 
+    @pyqtSlot()
+    def update_high_graph(self):
+        self.ensure_panels()
+        if self.compare_button.isChecked():
+            self._update_compare_panel("high")
+        else:
+            self._update_panel(self.high_panel, self.high_series)
@@ -0,0 +1,446 @@
+# src/utils/acquisition_engine.py
+"""
+트리거 감시 / 온도 CSV 로깅 / 파라미터 튜닝 엔진 (Qt 없음)
+- poll() 1번 = 기존 TriggerMonitorWidget 타이머 tick 1번
+  (파라미터 트리거 → PLC 파라미터 읽기 / 해제 시 튜닝, 온도 트리거 → CSV + RunBuffer 로깅)
+- GUI: TriggerMonitorWidget이 QTimer에서 poll()을 호출하고 listener로 결과를 받아 화면 표시
+- 서비스: service.py가 run()으로 GUI / Qt event loop 없이 24시간 실행
+- listener: 아래 메서드 중 필요한 것만 구현한 객체 (없는 메서드는 호출하지 않음)
+    on_trigger_state(state)                     파라미터 트리거 비트 (None = 통신 오류)
+    on_trigger_count(count)                     파라미터 트리거 감지 횟수
+    on_params_read(left_values, right_values)   PLC 현재 파라미터 (Normal / High, 행 우선 P1 zone1~N, P2 zone1~N)
+    on_new_params(temp_area, values)            튜닝으로 계산한 새 파라미터
+    on_temp_trigger(state, temp_area)           온도 트리거 (state None = 통신 오류, temp_area None = 로깅 안 함)
+    on_run_refused(temp_area, message)          설정 오류로 온도 로깅을 시작하지 않음 (트리거 ON 동안 매 poll)
+    on_run_started(temp_area, zones, run_buffer)
+    on_zone_deviation(event, alarms)            편차 경보 발생 / 해제 (DeviationEvent, 현재 경보 목록)
+    on_run_completed(tube_id, job_id, normal_rows, high_rows)
+                                                normal / high run: RunBuffer (이번 실행 중 로깅) 또는 CSV rows (디스크)
+"""
+import threading
+import time
+
+from src.communication.comm_stats import LatencyStats
+from src.config.settings import ACQUISITION_SETTINGS, TEMPERATURE_TAG_SETTINGS
+from src.utils.logger_config import setup_logger
+from src.utils.plc_codec import decode_words, encode_values
+from src.utils.run_buffer import RunBuffer
+from src.utils.run_statistics import ZoneStatistics
+from src.utils.temperature_logger import (
+    init_plc_csv_logger, append_temperature_log, job_info_read, get_latest_temperature_log, set_plc_connector,
+    temperature_block_schema,
+)
+
+logger = setup_logger('acquisition_engine')
+
+# 파라미터 트리거 / 온도 트리거 비트 (EM 0xAF, word 1)
+TRIGGER_MEMORY_AREA = 0xAF
+TRIGGER_WORD_ADDR = 1
+PARAM_TRIGGER_BIT = 1
+TEMP_TRIGGER_BIT = 2
+TEMP_AREA_NORMAL_BIT = 3
+TEMP_AREA_HIGH_BIT = 4
+
+# temp_area별 zone 파라미터 영역 내 offset (zone마다 Normal P1, P2, High P1, P2)
+PARAM_AREA_OFFSETS = {"normal": 0, "high": 2}
+
+
+class AcquisitionEngine:
+    def __init__(self, plc_connector, zone_count=None):
+        self.plc_connector = plc_connector
+        set_plc_connector(plc_connector)  # 온도 로깅도 같은 연결 사용
+        self.zone_count = zone_count or TEMPERATURE_TAG_SETTINGS['ZONE_COUNT']
+        self.listeners = []
+        # 급하지 않은 작업(튜닝 결과 캐시 저장 등) 실행 방법: 기본은 바로 실행
+        # GUI는 QTimer.singleShot(0, fn)으로 바꿔서 화면 갱신 뒤로 미룸
+        self.defer = lambda fn: fn()
+
+        self.prev_trigger_state = False
+        self.prev_temp_trigger_state = False
+        self.trigger_count = 0
+        self.comm_errors = 0   # 연속 통신 오류 횟수 (서비스 재연결 판단용)
+        self.overruns = 0      # run()에서 poll이 주기보다 오래 걸려 건너뛴 tick 수
+        # poll 주기(시작 간격) / poll 소요 시간 (ms) → 통신 RTT와 비교해서 지연 원인 구분
+        self.cycle_stats = LatencyStats()
+        self.poll_stats = LatencyStats()
+        self._last_poll = None
+
+        self.log_writer = None
+        self.log_file = None
+        self.log_file_path = None
+        self.run_buffer = None
+        self.zone_stats = None
+        self.refused_run = None   # 설정 오류로 시작하지 않은 run의 오류 메시지
+        self.completed_runs = {"normal": None, "high": None}
+
+        self.tube_id = None
+        self.job_id = None
+        self.latest_normal_log_path = None
+        self.latest_normal_log_rows = None
+        self.latest_high_log_path = None
+        self.latest_high_log_rows = None
+        self.prev_left_table_value = None
+        self.prev_right_table_value = None
+        self.normal_p1 = None
+        self.normal_p2 = None
+        self.normal_init_p2 = None
+        self.high_p1 = None
+        self.high_p2 = None
+        self.high_init_p2 = None
+        self.new_left_table_value = None
+        self.new_right_table_value = None
+
+    # ----------------- listener -----------------
+    def add_listener(self, listener):
+        self.listeners.append(listener)
+
+    def remove_listener(self, listener):
+        if listener in self.listeners:
+            self.listeners.remove(listener)
+
+    def _notify(self, name, *args):
+        for listener in self.listeners:
+            handler = getattr(listener, name, None)
+            if handler is None:
+                continue
+            try:
+                handler(*args)
+            except Exception as e:
+                logger.exception(f"listener {name} 처리 중 예외 발생: {e}")
+
+    # ----------------- 실행 -----------------
+    def poll(self):
+        """1 tick: 파라미터 트리거 + 온도 트리거 확인"""
+        start = time.monotonic()
+        if self._last_poll is not None:
+            self.cycle_stats.add((start - self._last_poll) * 1000)
+        self._last_poll = start
+
+        ok = self.check_trigger()
+        ok = self.check_trigger_temperature() and ok
+        self.comm_errors = 0 if ok else self.comm_errors + 1
+        self.poll_stats.add((time.monotonic() - start) * 1000)
+
+    def reset_timing(self):
+        """poll을 다시 시작할 때 호출 (정지 구간이 주기 통계에 들어가지 않도록)"""
+        self._last_poll = None
+        self.cycle_stats.reset_window()
+        self.poll_stats.reset_window()
+
+    def run(self, stop_event=None, interval=None, on_tick=None):
+        """
+        stop_event가 set될 때까지 interval(초)마다 poll() (Qt 없이 서비스에서 사용)
+        - 시작 시각 기준 고정 주기 → poll 소요 시간만큼 주기가 밀리지 않음
+        - poll이 주기보다 오래 걸리면 밀린 tick은 몰아서 실행하지 않고 건너뜀 (overruns)
+        - on_tick(engine): poll 후 호출 (재연결 판단 등)
+        """
+        stop_event = stop_event or threading.Event()
+        interval = interval or ACQUISITION_SETTINGS['POLL_INTERVAL']
+        logger.info(f"acquisition 시작 (주기 {interval:.3f}s, zone {self.zone_count}개)")
+        self.reset_timing()
+
+        next_tick = time.monotonic()
+        while not stop_event.is_set():
+            try:
+                self.poll()
+                if on_tick is not None:
+                    on_tick(self)
+            except Exception as e:
+                logger.exception(f"acquisition tick 처리 중 예외 발생: {e}")
+
+            next_tick += interval
+            delay = next_tick - time.monotonic()
+            if delay < 0:
+                skipped = int(-delay // interval) + 1
+                self.overruns += skipped
+                next_tick += skipped * interval
+                delay = next_tick - time.monotonic()
+                logger.warning(f"poll 주기 초과: {skipped} tick 건너뜀 (누적 {self.overruns})")
+            stop_event.wait(delay)
+
+        self.close_log()
+        logger.info("acquisition 종료")
+
+    # ----------------- 파라미터 트리거 -----------------
+    def check_trigger(self):
+        """트리거 비트 상태 확인. return: 통신 성공 여부"""
+        trigger_state = self.plc_connector.read_trigger_bit(
+            mem_area=TRIGGER_MEMORY_AREA, word_addr=TRIGGER_WORD_ADDR, bit_offset=PARAM_TRIGGER_BIT
+        )
+
+        if trigger_state is None:
+            self._notify("on_trigger_state", None)
+            return False
+
+        # Rising edge 감지 (0 → 1)
+        if trigger_state and not self.prev_trigger_state:
+            self.trigger_detected()
+        elif not trigger_state and self.prev_trigger_state:
+            self.trigger_released()
+
+        self.prev_trigger_state = trigger_state
+        self._notify("on_trigger_state", bool(trigger_state))
+        return True
+
+    def trigger_detected(self):
+        """트리거 감지시 처리"""
+        self.trigger_count += 1
+        logger.info(f"트리거 감지 (카운트: {self.trigger_count})")
+        self._notify("on_trigger_count", self.trigger_count)
+
+        # 데이터 읽기 처리
+        try:
+            self.update_plc_data()
+        except Exception as e:
+            logger.error(f"데이터 읽기 처리 중 오류 발생: {str(e)}")
+
+    def read_param_block(self):
+        """
+        zone 전체 파라미터 영역을 block read 1번으로 읽기
+        return: (zone 수 x PARAM_ZONE_STRIDE) int16 배열, 실패 시 None
+        """
+        tags = TEMPERATURE_TAG_SETTINGS
+        stride = tags['PARAM_ZONE_STRIDE']
+        raw = self.plc_connector.read_block(tags['PARAM_MEMORY_AREA'], tags['PARAM_BASE_ADDR'], stride * self.zone_count)
+        if raw is None or len(raw) < stride * self.zone_count:
+            return None
+        # ★ signed INT16 변환 적용
+        return decode_words(raw, "INT16").reshape(self.zone_count, stride)
+
+    def update_plc_data(self):
+        """PLC에서 현재 파라미터 읽기"""
+        try:
+            block = self.read_param_block()
+            if block is None:
+                logger.error("PLC 파라미터 block 읽기 실패")
+                return
+
+            # zone마다 [Normal P1, Normal P2, High P1, High P2, ...]
+            # → 테이블 형식(행 우선: P1 zone1~N, P2 zone1~N)으로 정렬
+            left_values = block[:, 0:2].T.ravel().tolist()
+            right_values = block[:, 2:4].T.ravel().tolist()
+
+            self.prev_left_table_value = left_values
+            logger.debug(f"left_values: {self.prev_left_table_value}")
+            self.prev_right_table_value = right_values
+            logger.debug(f"right_values: {self.prev_right_table_value}")
+
+            self._notify("on_params_read", left_values, right_values)
+
+        except Exception as e:
+            logger.error(f"PLC 데이터 읽기 실패: {str(e)}")
+
+    def trigger_released(self):
+        # 튜닝 계산 모듈은 처음 필요할 때 import (시작 시간 단축)
+        from src.utils.data_processor_tuning import is_all_zero, ary_sum
+
+        try:
+            self.tube_id, self.job_id = job_info_read()
+        except Exception as e:
+            logger.exception(f"job_info_read() 호출 중 예외 발생: {e}")
+            return
+
+        if self.tube_id is None or self.job_id is None:
+            logger.warning("trigger_released: tube_id 또는 job_id가 None 입니다.")
+            return
+
+        logger.info(f"trigger_released: tube_id={self.tube_id}, job_id={self.job_id}")
+
+        self.latest_normal_log_path, self.latest_normal_log_rows, normal_summary = self.load_run("normal")
+        self.latest_high_log_path, self.latest_high_log_rows, high_summary = self.load_run("high")
+
+        if self.latest_normal_log_path:
+            logger.info(f"최신 normal 온도 로그: {self.latest_normal_log_path}")
+            summary = normal_summary
+            self.normal_p1, self.normal_init_p2, self.normal_p2 = summary["p1"], summary["init_p2"], summary["p2"]
+            if is_all_zero(self.prev_left_table_value):
+                self.new_left_table_value = self.normal_p1 + self.normal_init_p2
+            else:
+                self.new_left_table_value = ary_sum(self.normal_p1, self.normal_p2, self.prev_left_table_value)
+            logger.info(f"new_left_table_value: {self.new_left_table_value}")
+            self._notify("on_new_params", "normal", self.new_left_table_value)
+        else:
+            logger.info("해당 tube/job에 대한 normal 온도 로그 없음")
+
+        if self.latest_high_log_path:
+            logger.info(f"최신 high 온도 로그: {self.latest_high_log_path}")
+            summary = high_summary
+            self.high_p1, self.high_init_p2, self.high_p2 = summary["p1"], summary["init_p2"], summary["p2"]
+            if is_all_zero(self.prev_right_table_value):
+                self.new_right_table_value = self.high_p1 + self.high_init_p2
+            else:
+                self.new_right_table_value = ary_sum(self.high_p1, self.high_p2, self.prev_right_table_value)
+            logger.info(f"new_right_table_value: {self.new_right_table_value}")
+            self._notify("on_new_params", "high", self.new_right_table_value)
+        else:
+            logger.info("해당 tube/job에 대한 high 온도 로그 없음")
+
+        if self.latest_normal_log_path and self.latest_high_log_path:
+            self._notify(
+                "on_run_completed", self.tube_id, self.job_id,
+                self.latest_normal_log_rows or [],
+                self.latest_high_log_rows or []
+            )
+        else:
+            logger.info("해당 tube/job에 대한 high 온도 로그 없음")
+
+    def load_run(self, temp_area):
+        """
+        현재 tube/job의 temp_area run 데이터를 (path, run, 튜닝 결과)로 반환
+        - 이번 실행 중 로깅한 run이 메모리에 있으면 RunBuffer를 그대로 반환 (rows 변환 없음)
+          (튜닝 결과는 로깅 중 샘플마다 갱신된 OnlineTuningState 값)
+        - 없으면 (재시작 등) temperature_logs의 최신 CSV를 읽고 결과 캐시 사용
+        """
+        from src.utils.tuning_cache import cached_tuning_summary, get_tuning_cache
+
+        run = self.completed_runs.get(temp_area)
+        if run is not None and run.matches(self.tube_id, self.job_id):
+            logger.debug(f"{temp_area} run 메모리 버퍼 사용: {run.length}행")
+            summary = run.tuning.summary()
+            if run.file_path:
+                # 캐시 저장(sqlite)은 테이블 갱신이 끝난 뒤 처리 (파일은 다시 읽지 않음)
+                self.defer(lambda: get_tuning_cache().put_summary(run.file_path, summary))
+            return run.file_path, run, summary
+
+        path, rows = get_latest_temperature_log(self.tube_id, self.job_id, temp_area)
+        if not path:
+            return None, None, None
+        return path, rows, cached_tuning_summary(path, rows)
+
+    # ----------------- 파라미터 쓰기 -----------------
+    def param_addresses(self, temp_area, rows=2):
+        """zone 수만큼 파라미터 주소 테이블 생성 (행: P1, P2 / 열: zone)"""
+        tags = TEMPERATURE_TAG_SETTINGS
+        offset = PARAM_AREA_OFFSETS[temp_area]
+        return [
+            [
+                (tags['PARAM_BASE_ADDR'] + z * tags['PARAM_ZONE_STRIDE'] + offset + r, tags['PARAM_MEMORY_AREA'])
+                for z in range(self.zone_count)
+            ]
+            for r in range(rows)
+        ]
+
+    def write_params(self, temp_area, values, title=None):
+        """
+        temp_area 파라미터 (행: P1 / P2, 열: zone) int16 배열을 PLC에 쓰기
+        zone 1개의 P1, P2는 연속 주소 → zone마다 block write 1번
+        return: 성공 여부
+        """
+        title = title or temp_area
+        addr_table = self.param_addresses(temp_area)
+
+        # 주소/값 길이 체크 (예방 차원)
+        if values.shape != (len(addr_table), len(addr_table[0]) if addr_table else 0):
+            logger.error(
+                f"테이블 크기 불일치: 값={values.shape[0]}x{values.shape[1]}, "
+                f"주소={len(addr_table)}x{len(addr_table[0]) if addr_table else 0}"
+            )
+            return False
+
+        try:
+            # INT16 → word 변환 (범위를 벗어난 값이면 ValueError → 쓰지 않음)
+            words = encode_values(values, "INT16")
+            for c in range(words.shape[1]):
+                word_addr, mem_area = addr_table[0][c]
+                column = words[:, c]
+
+                logger.debug(
+                    f"PLC write -> title={title}, zone={c + 1}, "
+                    f"mem_area=0x{mem_area:X}, word_addr={word_addr}, values={column.tolist()}"
+                )
+
+                if not self.plc_connector.write_block(mem_area, word_addr, column):
+                    logger.error(f"{title} Restore 실패: zone {c + 1} (word_addr={word_addr})")
+                    return False
+
+            logger.info(f"{title} 테이블 Restore 완료")
+            return True
+
+        except Exception as e:
+            logger.exception(f"{title} Restore 중 예외 발생: {e}")
+            return False
+
+    # ----------------- 온도 트리거 / 로깅 -----------------
+    def check_trigger_temperature(self):
+        """온도 트리거 확인 + 로깅. return: 통신 성공 여부"""
+        read_bit = self.plc_connector.read_trigger_bit
+        trigger_state = read_bit(mem_area=TRIGGER_MEMORY_AREA, word_addr=TRIGGER_WORD_ADDR, bit_offset=TEMP_TRIGGER_BIT)
+        temp_area_normal = read_bit(mem_area=TRIGGER_MEMORY_AREA, word_addr=TRIGGER_WORD_ADDR, bit_offset=TEMP_AREA_NORMAL_BIT)
+        temp_area_high = read_bit(mem_area=TRIGGER_MEMORY_AREA, word_addr=TRIGGER_WORD_ADDR, bit_offset=TEMP_AREA_HIGH_BIT)
+
+        if trigger_state is None:
+            self._notify("on_temp_trigger", None, None)
+            return False
+
+        temp_area = None
+        if trigger_state and temp_area_normal:
+            temp_area = "normal"
+        elif trigger_state and temp_area_high:
+            temp_area = "high"
+
+        if temp_area is not None:
+            if not self.prev_temp_trigger_state:
+                self.refused_run = None
+                try:
+                    self.start_run(temp_area)
+                except ValueError as e:
+                    # zone / 주소 설정 오류: 잘못된 주소의 값을 로깅 / 튜닝하지 않도록 run 시작 안 함
+                    logger.error(f"{temp_area} 온도 로깅 시작 안 함: {e}")
+                    self.refused_run = str(e)
+            self.prev_temp_trigger_state = True
+            if self.refused_run is not None:
+                self._notify("on_run_refused", temp_area, self.refused_run)
+                return True
+            append_temperature_log(self.log_file, self.log_writer, self.run_buffer)
+        else:
+            # 트리거가 1 -> 0 으로 떨어지는 순간에만 파일 닫기
+            if self.prev_temp_trigger_state:
+                self.close_log()
+            self.prev_temp_trigger_state = False
+
+        self._notify("on_temp_trigger", True, temp_area)
+        return True
+
+    def start_run(self, temp_area):
+        """
+        온도 로깅 시작: CSV 파일 + 메모리 버퍼 + zone 통계/편차 감시
+        zone 수가 온도 블록 주소 구성과 맞지 않으면 파일을 만들기 전에 ValueError
+        """
+        temperature_block_schema(self.zone_count, TEMPERATURE_TAG_SETTINGS['SIGNAL_STRIDE'])
+        self.log_file, self.log_writer, self.log_file_path = init_plc_csv_logger(temp_area, self.zone_count)
+        self.run_buffer = RunBuffer(temp_area, self.log_file_path, zones=self.zone_count)
+
+        self.zone_stats = ZoneStatistics(self.zone_count, callback=self.on_zone_deviation)
+        self.run_buffer.add_observer(self.zone_stats)
+
+        self._notify("on_run_started", temp_area, self.zone_count, self.run_buffer)
+
+    def close_log(self):
+        """로깅 중인 CSV 닫기 + 종료된 run은 메모리에 보관 (trigger_released에서 파일 재읽기 없이 사용)"""
+        if self.log_file:
+            try:
+                self.log_file.close()
+                logger.info(f"Temperature CSV Log 종료: {self.log_file_path}")
+            except Exception as e:
+                logger.exception(f"로그 파일 종료 중 예외 발생: {e}")
+            finally:
+                self.log_file = None
+                self.log_writer = None
+                self.log_file_path = None
+
+        if self.run_buffer is not None:
+            self.completed_runs[self.run_buffer.temp_area] = self.run_buffer
+            self.run_buffer = None
+
+    def on_zone_deviation(self, event):
+        """편차 기준을 넘거나 복귀한 순간에만 호출됨 (샘플마다 호출되지 않음)"""
+        if event.state:
+            logger.warning(
+                f"편차 경보: Z{event.zone} {event.signal}={event.deviation:+.1f} "
+                f"(기준 {event.limit:+.1f}, 샘플 {event.sample_index})"
+            )
+        else:
+            logger.info(f"편차 정상 복귀: Z{event.zone} {event.signal}={event.deviation:+.1f}")
+
+        alarms = self.zone_stats.active_alarms() if self.zone_stats else []
+        self._notify("on_zone_deviation", event, alarms)
@@ -1,8 +1,13 @@
 from typing import List, Tuple
 from src.utils.logger_config import setup_logger
+from src.utils.plc_codec import to_int16
+from src.utils.tuning_engine import analyse_run, run_zone_count, detect_heater_zones
 
 logger = setup_logger('data_processor_tuning')
 
+# 튜닝 규칙(계산 방식)이 바뀌면 올려야 함 → 저장된 튜닝 결과 캐시 자동 무효화
+TUNING_ALGORITHM_VERSION = 1
+
 def _to_float(value, default=0.0):
     try:
         return float(value)
@@ -10,7 +15,8 @@ def _to_float(value, default=0.0):
         return default
 
 
-def max_ptc_zones(rows, zones=8):
+def max_ptc_zones(rows, zones=None):
+    zones = run_zone_count(rows, zones)
     max_ptc_zone = []
     for i in range(zones):
         ptc_list = ptc_scrap(rows, i + 1)
@@ -45,7 +51,8 @@ def search_temp_retain_point(rows):
     return retain_point
 
 
-def retain_point_ctc_zones(rows, zones=8):
+def retain_point_ctc_zones(rows, zones=None):
+    zones = run_zone_count(rows, zones)
     retain_point = search_temp_retain_point(rows)
 
     retain_point_ctc_zone = []
@@ -59,7 +66,8 @@ def retain_point_ctc_zones(rows, zones=8):
     return retain_point_ctc_zone
 
 
-def retain_point_ptc_average(rows, zones=8):
+def retain_point_ptc_average(rows, zones=None):
+    zones = run_zone_count(rows, zones)
     retain_point = search_temp_retain_point(rows)
 
     retain_point_ptc_average_list = []
@@ -81,7 +89,8 @@ def retain_point_ptc_average(rows, zones=8):
     return retain_point_ptc_average_list
 
 
-def retain_sp_zones(rows, zones=8):
+def retain_sp_zones(rows, zones=None):
+    zones = run_zone_count(rows, zones)
     retain_point = search_temp_retain_point(rows)
 
     retain_sp_zone = []
@@ -98,7 +107,7 @@ def retain_sp_zones(rows, zones=8):
 def set_point_scrap(rows, zone):
     """
     rows: CSV 전체 (첫 행은 헤더)
-    zone: 1~8
+    zone: 1~N
     return: SP(zone) float 리스트
     """
     if not rows:
@@ -207,33 +216,28 @@ def mv_scrap(rows, zone):
 
 
 
-def p_calculation(rows, zone_count = 8):
-    ptc = max_ptc_zones(rows, zone_count)
-    sp = retain_sp_zones(rows, zone_count)
-    ctc = retain_point_ctc_zones(rows, zone_count)
-    rtn_ptc = retain_point_ptc_average(rows, zone_count)
-
-    adjust_p1 = []
-    for i in range(zone_count):
-        delta = ptc[i] - sp[i]
-        # logger.debug(f"ptc[{i}] - sp[{i}]: {delta}")
-        if delta <= 1:
-            adjust_p1.append(0)
-        elif delta > 1:
-            adjust_p1.append(int(delta))
+def tuning_summary(rows, zone_count=None):
+    """
+    run 1개의 튜닝 결과 전체 반환
+    rows: CSV rows(0번: 헤더) 또는 RunBuffer
+    zone_count: None이면 헤더(SP1 ~ SPn) / RunBuffer에서 자동 검출
+    return: {"p1", "init_p2", "p2", "retain_point", "ptc_max"}
 
-    initial_p2 = [int(sp[i] - ctc[i] + 3) for i in range(zone_count)]
-    adjust_p2 = [int(rtn_ptc[i] - sp[i]) for i in range(zone_count)]
+    계산은 tuning_engine.analyse_run에서 1회 파싱 + 배열 연산으로 수행
+    (아래 *_zones / *_scrap 함수들과 결과 동일)
+    """
+    summary = analyse_run(rows, zone_count)
 
-    logger.debug(f"P1 adjustment values: {adjust_p1}")
-    logger.debug(f"Initial P2 values: {initial_p2}")
-    logger.debug(f"P2 adjustment values: {adjust_p2}")
+    logger.debug(f"P1 adjustment values: {summary['p1']}")
+    logger.debug(f"Initial P2 values: {summary['init_p2']}")
+    logger.debug(f"P2 adjustment values: {summary['p2']}")
 
-    return adjust_p1, initial_p2, adjust_p2
+    return summary
 
 
-def detect_heater_zones(headers: List[str]) -> int:
-    return sum(1 for h in headers if h.strip().startswith("ZONE") and h.strip().endswith("(SP)"))
+def p_calculation(rows, zone_count=None):
+    summary = tuning_summary(rows, zone_count)
+    return summary["p1"], summary["init_p2"], summary["p2"]
 
 
 def is_all_zero(ary):
@@ -244,7 +248,4 @@ def ary_sum(ary1, ary2, ary3):
     ary1_16 = ary1 + ary2
     ary2_16 = ary3
     result = [a+b for a,b in zip(ary1_16, ary2_16)]
-    return result
-
-def to_int16(value: int) -> int:
-    return value - 65536 if value >= 32768 else value
\ No newline at end of file
+    return result
\ No newline at end of file
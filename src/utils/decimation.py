@@ -0,0 +1,72 @@
+# src/utils/decimation.py
+import numpy as np
+
+
+def visible_slice(x, xlim=None):
+    """
+    x(오름차순)에서 xlim 범위에 보이는 index 구간 [i0, i1)
+    양쪽으로 1점씩 더 포함 → 선이 화면 끝까지 이어짐
+    """
+    n = len(x)
+    if xlim is None or n == 0:
+        return 0, n
+    xmin, xmax = xlim
+    i0 = max(int(np.searchsorted(x, xmin, side="left")) - 1, 0)
+    i1 = min(int(np.searchsorted(x, xmax, side="right")) + 1, n)
+    return i0, max(i1, i0)
+
+
+def minmax_indices(y, i0, i1, n_buckets):
+    """
+    y[i0:i1]를 n_buckets 구간으로 나눠 구간별 최소/최대 위치만 남긴 index 배열 (시간 순)
+    - 구간 안의 순서(최소가 먼저인지 최대가 먼저인지)를 유지 → 모양이 원본과 같음
+    - 첫 점 / 끝 점은 항상 포함
+    - 점 수가 2 * n_buckets 이하이면 전체 index
+    - NaN(빈 샘플)은 최소/최대 선택에서 제외, NaN이 있는 구간은 첫 NaN 위치를 추가 → 축소해도 선이 끊김
+    """
+    n = i1 - i0
+    if n <= 2 * n_buckets or n_buckets <= 0:
+        return np.arange(i0, i1)
+
+    size = -(-n // n_buckets)  # 구간 크기 (올림)
+    full = n // size           # 꽉 찬 구간 수
+
+    window = y[i0:i1]
+    nan = np.isnan(window)
+    gaps = np.flatnonzero(nan)
+    if len(gaps):
+        low, high = np.where(nan, np.inf, window), np.where(nan, -np.inf, window)
+    else:
+        low = high = window
+
+    base = i0 + np.arange(full) * size
+    picked = [
+        base + low[:full * size].reshape(full, size).argmin(axis=1),
+        base + high[:full * size].reshape(full, size).argmax(axis=1),
+    ]
+
+    # 마지막 남은 구간
+    tail_start = i0 + full * size
+    if tail_start < i1:
+        k = full * size
+        picked.append(np.array([tail_start + low[k:].argmin(), tail_start + high[k:].argmax()]))
+
+    if len(gaps):
+        bucket = gaps // size
+        picked.append(i0 + gaps[np.concatenate(([True], bucket[1:] != bucket[:-1]))])
+
+    picked.append(np.array([i0, i1 - 1]))
+    return np.unique(np.concatenate(picked))
+
+
+def minmax_decimate(x, y, n_buckets, xlim=None):
+    """
+    화면 표시용 min/max 다운샘플링
+    x, y: 같은 길이의 배열, n_buckets: 보통 화면 가로 픽셀 수
+    return: (x, y) 최대 약 2 * n_buckets + 4 점 (피크 값 보존)
+    """
+    x = np.asarray(x)
+    y = np.asarray(y)
+    i0, i1 = visible_slice(x, xlim)
+    idx = minmax_indices(y, i0, i1, n_buckets)
+    return x[idx], y[idx]
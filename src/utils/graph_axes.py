@@ -0,0 +1,63 @@
+# src/utils/graph_axes.py
+import math
+
+import numpy as np
+
+SERIES_NAMES = ("SP", "PTC", "CTC")
+Y_LIMIT_STEP = 50.0  # y축 범위를 이 단위로 올림 → zone을 바꿔도 범위가 같으면 축을 다시 그리지 않음
+MIN_VIEW_SAMPLES = 10  # 확대 시 최소 표시 샘플 수
+
+
+def axis_limits(x_range, y_range, step=Y_LIMIT_STEP):
+    """(xmin, xmax, ymin, ymax): y는 step 단위로 내림/올림"""
+    lo, hi = y_range if y_range is not None else (0.0, step)
+    ymin = math.floor(lo / step) * step
+    ymax = math.ceil(hi / step) * step
+    if ymax <= ymin:
+        ymax = ymin + step
+    xmin, xmax = x_range
+    return xmin, max(xmax, xmin + 1), ymin, ymax
+
+
+def data_range(arrays):
+    """배열 여러 개의 (min, max). None(로그에 없는 signal) / NaN(빈 샘플)은 무시, 값이 없으면 None"""
+    lo, hi = math.inf, -math.inf
+    for values in arrays:
+        if values is None or not np.size(values):
+            continue
+        a, b = float(np.fmin.reduce(values, axis=None)), float(np.fmax.reduce(values, axis=None))
+        if not math.isnan(a):
+            lo, hi = min(lo, a), max(hi, b)
+    return (lo, hi) if lo <= hi else None
+
+
+def clamp_view(x0, x1, lo, hi, min_width=MIN_VIEW_SAMPLES):
+    """확대/이동한 x 범위를 전체 범위 [lo, hi] 안으로 제한 (폭은 min_width 이상)"""
+    width = min(max(x1 - x0, min_width), hi - lo)
+    x0 = min(max(x0, lo), hi - width)
+    return x0, x0 + width
+
+
+def nice_ticks(lo, hi, max_ticks=8):
+    """lo ~ hi 사이 1 / 2 / 5 x 10^n 간격 눈금 값 목록"""
+    span = hi - lo
+    if span <= 0 or max_ticks < 2:
+        return [lo]
+    raw = span / (max_ticks - 1)
+    magnitude = 10 ** math.floor(math.log10(raw))
+    step = next(m * magnitude for m in (1, 2, 5, 10) if m * magnitude >= raw)
+
+    first = math.ceil(lo / step) * step
+    count = int(math.floor((hi - first) / step + 1e-9)) + 1
+    return [first + i * step for i in range(count)]
+
+
+def overlay_colors(count, start="#9ecae1", end="#08306b"):
+    """run 비교용 선 색 (hex 문자열): 오래된 run → 최신 run 순으로 옅은 색 → 진한 색"""
+    a = [int(start[i:i + 2], 16) for i in (1, 3, 5)]
+    b = [int(end[i:i + 2], 16) for i in (1, 3, 5)]
+    colors = []
+    for k in range(count):
+        t = k / (count - 1) if count > 1 else 1.0
+        colors.append("#" + "".join(f"{round(p + (q - p) * t):02x}" for p, q in zip(a, b)))
+    return colors
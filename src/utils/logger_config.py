@@ -1,59 +1,306 @@
+# src/utils/logger_config.py
+"""
+로깅 설정 (queue 기반, 호출 스레드는 record를 queue에 넣기만 함)
+- 모든 모듈 logger가 QueueHandler 1개를 공유 → 공용 QueueListener 스레드 1개가
+  포맷 / 파일 쓰기 / 파일 rotation / 콘솔 출력 처리 (PLC poll 주기에 파일 I/O가 끼지 않음)
+- 파일은 기존과 같이 모듈별: logs/<name>.log (INFO, 날짜별) + logs/<name>_debug.log (DEBUG, 10MB)
+  → listener 스레드의 _ModuleFileRouter가 record.name으로 찾아서 기록 (모듈별 파일 handler는 처음 쓸 때 생성)
+- 메시지 포맷은 listener 스레드에서 (lazy) → 자주 호출되는 곳은 logger.debug("... %s", value) 형태 사용
+  (args는 나중에 포맷되므로 호출 후 변경되는 객체는 넘기지 않음)
+- 레벨별 rate limit (LOGGING_SETTINGS['RATE_LIMITS']): 호출 위치마다 RATE_LIMIT_INTERVAL 동안 N건까지만 기록,
+  초과분은 버리고 다음 기록에 생략 건수를 붙임 (기본: DEBUG만 제한, INFO 이상은 모두 기록)
+- queue가 가득 차면 (디스크 지연 등) 새 record는 버리고 건수를 경고로 남김 (queue를 거치지 않고 listener 스레드에서 바로 기록)
+- 프로세스 풀 worker: ProcessPoolExecutor(initializer=logging_initializer, initargs=(worker_log_queue(),))
+  → worker 로그는 부모 프로세스 listener가 같은 모듈별 파일에 기록 (worker가 파일을 직접 열거나 rotation하지 않음)
+- fork된 자식 프로세스는 listener 스레드가 복사되지 않으므로 자식에서 새 queue / listener로 다시 시작
+"""
+import atexit
 import logging
+import multiprocessing
+import multiprocessing.util
 import os
-from datetime import datetime
-from logging.handlers import RotatingFileHandler, TimedRotatingFileHandler
+import queue
+import threading
+import time
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler, TimedRotatingFileHandler
+
+from src.config.settings import LOGGING_SETTINGS
+
+FORMAT = '[%(levelname)s] %(asctime)s [%(name)s:%(filename)s:%(lineno)d] - %(message)s'
+DEBUG_FORMAT = (
+    '[%(levelname)s] %(asctime)s [%(name)s:%(filename)s:%(lineno)d]\n'
+    'Thread: %(threadName)s\n'
+    'Message: %(message)s\n'
+)
+
+_lock = threading.Lock()
+_queue_handler = None
+_listener = None
+_router = None
+_console_handler = None
+_worker_queues = {}       # start method → (multiprocessing.Queue, QueueListener): 프로세스 풀 worker → 이 프로세스
+
+
+class _RateLimitFilter(logging.Filter):
+    """
+    호출 위치(logger 이름, 파일, 줄)마다 interval 동안 limits[level]건까지만 통과 (호출 스레드에서 실행, dict 조회 1번)
+    - 버린 건수는 다음 interval에 처음 통과하는 record 메시지 뒤에 붙임
+    - GUI / loader pool / service 등 여러 스레드에서 호출 → _sites 갱신은 lock 안에서
+    """
+    def __init__(self, limits, interval):
+        super().__init__()
+        self.limits = limits
+        self.interval = interval
+        self._sites = {}   # (name, pathname, lineno) → [window 시작, 통과 수, 버린 수]
+        self._lock = threading.Lock()
+
+    def filter(self, record):
+        limit = self.limits.get(record.levelno)
+        if limit is None:
+            return True
+
+        key = (record.name, record.pathname, record.lineno)
+        now = time.monotonic()
+        with self._lock:
+            site = self._sites.get(key)
+            if site is None:
+                self._sites[key] = [now, 1, 0]
+                return True
+
+            if now - site[0] >= self.interval:
+                suppressed = site[2]
+                site[0], site[1], site[2] = now, 1, 0
+            elif site[1] < limit:
+                site[1] += 1
+                return True
+            else:
+                site[2] += 1
+                return False
+
+        if suppressed:
+            record.msg = f"{record.msg} (이전 {self.interval:g}s 동안 {suppressed}건 생략)"
+        return True
+
+
+class _NonBlockingQueueHandler(QueueHandler):
+    """
+    호출 스레드 작업 = filter + queue.put_nowait
+    - 같은 프로세스 안의 queue이므로 prepare()에서 포맷하지 않음 (포맷은 listener 스레드 handler가 함)
+      (cross_process: worker → 부모 queue는 pickle되므로 QueueHandler 기본 prepare로 메시지 / 예외를 문자열로 만듦)
+    - queue가 가득 차면 버리고 건수만 셈 (호출 스레드를 막지 않음)
+    """
+    def __init__(self, log_queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+        self.cross_process = False
+
+    def prepare(self, record):
+        if self.cross_process:
+            return super().prepare(record)
+        return record
+
+    def enqueue(self, record):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+class _ModuleFileRouter(logging.Handler):
+    """
+    listener 스레드에서 record.name별 파일 handler(INFO 날짜별 + DEBUG 크기별)로 전달
+    - 모듈별 handler는 처음 기록할 때 생성 (파일도 delay=True로 첫 기록 때 엶)
+    - queue 가득 참(버린 건수) 경고는 queue를 거치지 않고 바로 기록 (console_handler + logger_config 파일)
+    """
+    def __init__(self, queue_handler, console_handler=None):
+        super().__init__(logging.DEBUG)
+        self.queue_handler = queue_handler
+        self.console_handler = console_handler
+        self.log_dirs = {}    # logger 이름 → 로그 디렉토리 (setup_logger에서 등록)
+        self._handlers = {}   # logger 이름 → (daily_handler, debug_handler)
+        self._reported_drops = 0
+        self._formatter = logging.Formatter(FORMAT)
+        self._debug_formatter = logging.Formatter(DEBUG_FORMAT)
+
+    def _module_handlers(self, name):
+        handlers = self._handlers.get(name)
+        if handlers is not None:
+            return handlers
+
+        log_dir = self.log_dirs.get(name, LOGGING_SETTINGS['LOG_DIR'])
+        os.makedirs(log_dir, exist_ok=True)
+
+        # 날짜별 로그 파일 설정
+        daily_handler = TimedRotatingFileHandler(
+            filename=os.path.join(log_dir, f'{name}.log'),
+            when='midnight',
+            interval=1,
+            backupCount=LOGGING_SETTINGS['BACKUP_COUNT'],
+            encoding='utf-8',
+            delay=True  # 파일은 첫 로그를 쓸 때 엶
+        )
+        daily_handler.setLevel(logging.INFO)
+        daily_handler.setFormatter(self._formatter)
+
+        # 크기 기반 상세 로그 파일 설정
+        debug_handler = RotatingFileHandler(
+            filename=os.path.join(log_dir, f'{name}_debug.log'),
+            maxBytes=LOGGING_SETTINGS['MAX_LOG_SIZE'],
+            backupCount=LOGGING_SETTINGS['DEBUG_BACKUP_COUNT'],
+            encoding='utf-8',
+            delay=True
+        )
+        debug_handler.setLevel(logging.DEBUG)
+        debug_handler.setFormatter(self._debug_formatter)
+
+        handlers = self._handlers[name] = (daily_handler, debug_handler)
+        return handlers
+
+    def emit(self, record):
+        for handler in self._module_handlers(record.name):
+            if record.levelno >= handler.level:
+                handler.handle(record)
+
+        dropped = self.queue_handler.dropped
+        if dropped != self._reported_drops:
+            self._reported_drops = dropped
+            self._report_drops(dropped)
+
+    def _report_drops(self, dropped):
+        # logger.warning()은 같은 queue에 다시 넣음 → queue가 가득 차 있으면 이 경고도 버려지고 건수만 늘어남
+        notice = logging.LogRecord(
+            'logger_config', logging.WARNING, __file__, 0,
+            f"로그 queue 가득 참: 누적 {dropped}건 버림", None, None,
+        )
+        for handler in self._module_handlers(notice.name):
+            if notice.levelno >= handler.level:
+                handler.handle(notice)
+        if self.console_handler is not None:
+            self.console_handler.handle(notice)
+
+    def close(self):
+        for handlers in self._handlers.values():
+            for handler in handlers:
+                handler.close()
+        super().close()
+
+
+def _start_listener(log_dirs=None):
+    """공용 QueueHandler / QueueListener 생성 (프로세스에서 1번, fork된 자식에서는 다시 시작)"""
+    global _queue_handler, _listener, _router, _console_handler
+
+    log_queue = queue.Queue(maxsize=LOGGING_SETTINGS['QUEUE_SIZE'])
+    if _queue_handler is None:
+        _queue_handler = _NonBlockingQueueHandler(log_queue)
+        _queue_handler.setLevel(logging.DEBUG)
+        limits = {
+            logging.getLevelName(level): count
+            for level, count in LOGGING_SETTINGS['RATE_LIMITS'].items()
+        }
+        _queue_handler.addFilter(_RateLimitFilter(limits, LOGGING_SETTINGS['RATE_LIMIT_INTERVAL']))
+        atexit.register(stop_logging)
+    else:
+        # 모듈 logger들이 이미 _queue_handler를 들고 있음 → queue만 교체
+        _queue_handler.queue = log_queue
+
+    # 콘솔 출력 핸들러 (모든 모듈 공용 1개)
+    _console_handler = logging.StreamHandler()
+    _console_handler.setLevel(logging.DEBUG)
+    _console_handler.setFormatter(logging.Formatter(FORMAT))
+
+    _router = _ModuleFileRouter(_queue_handler, _console_handler)
+    _router.log_dirs.update(log_dirs or {})
+
+    _listener = QueueListener(log_queue, _router, _console_handler, respect_handler_level=True)
+    _listener.start()
+
+
+def _restart_after_fork():
+    """
+    fork된 자식 프로세스 (os.register_at_fork)
+    - 부모 listener 스레드는 복사되지 않음 → 그대로 두면 record가 아무도 읽지 않는 queue에 쌓이고 사라짐
+    - 부모 스레드가 쥐고 있던 lock / queue 상태가 복사되었을 수 있으므로 lock / queue / router를 새로 만듦
+    - multiprocessing 자식은 atexit 없이 종료 → Finalize로 남은 record 기록
+    """
+    global _lock, _worker_queues
+    _lock = threading.Lock()
+    _worker_queues = {}
+    if _queue_handler is None or _queue_handler.cross_process:
+        return
+    _start_listener(_router.log_dirs)
+    multiprocessing.util.Finalize(None, stop_logging, exitpriority=10)
+
+
+os.register_at_fork(after_in_child=_restart_after_fork)
+
+
+def worker_log_queue(mp_context=None):
+    """
+    프로세스 풀 worker 로그를 받을 queue (start method별로 처음 호출 때 생성, 이 프로세스의 listener 스레드가 기록)
+    mp_context: 풀과 같은 multiprocessing context (None: 기본 context)
+    사용 예: ProcessPoolExecutor(initializer=logging_initializer, initargs=(worker_log_queue(),))
+    """
+    context = mp_context or multiprocessing.get_context()
+    method = context.get_start_method()
+    with _lock:
+        if _queue_handler is None:
+            _start_listener()
+        entry = _worker_queues.get(method)
+        if entry is None:
+            log_queue = context.Queue(LOGGING_SETTINGS['QUEUE_SIZE'])
+            listener = QueueListener(log_queue, _router, _console_handler, respect_handler_level=True)
+            listener.start()
+            entry = _worker_queues[method] = (log_queue, listener)
+        return entry[0]
+
+
+def logging_initializer(log_queue):
+    """
+    프로세스 풀 worker 초기화: 이 프로세스의 모든 모듈 logger 출력을 부모의 worker_log_queue()로 보냄
+    - spawn(Windows)은 import 때 worker마다 listener가 생겨 같은 logs/*.log를 열고 rotation함 → 멈춤
+    """
+    global _listener
+    with _lock:
+        if _queue_handler is None:
+            _start_listener()
+        if _listener is not None:
+            _listener.stop()
+            _listener = None
+            _router.close()
+        _queue_handler.queue = log_queue
+        _queue_handler.cross_process = True
+
+
+def stop_logging():
+    """queue에 남은 로그를 모두 기록하고 listener 스레드 종료 (프로그램 종료 시 atexit로 자동 호출)"""
+    global _listener
+    with _lock:
+        for _, listener in _worker_queues.values():
+            listener.stop()
+        _worker_queues.clear()
+        if _listener is None:
+            return
+        _listener.stop()
+        _listener = None
+        _router.close()
+
 
 def setup_logger(name, log_dir='logs'):
     # 로거 생성
     logger = logging.getLogger(name)
     logger.setLevel(logging.DEBUG)
-    
-    # 로그 디렉토리가 없으면 생성
-    if not os.path.exists(log_dir):
-        os.makedirs(log_dir)
-    
-    # 날짜별 로그 파일 설정
-    daily_handler = TimedRotatingFileHandler(
-        filename=os.path.join(log_dir, f'{name}.log'),
-        when='midnight',
-        interval=1,
-        backupCount=30,
-        encoding='utf-8'
-    )
-    daily_handler.setLevel(logging.INFO)
-    
-    # 크기 기반 상세 로그 파일 설정
-    debug_handler = RotatingFileHandler(
-        filename=os.path.join(log_dir, f'{name}_debug.log'),
-        maxBytes=10*1024*1024,  # 10MB
-        backupCount=5,
-        encoding='utf-8'
-    )
-    debug_handler.setLevel(logging.DEBUG)
-    
-    # 콘솔 출력 핸들러
-    console_handler = logging.StreamHandler()
-    console_handler.setLevel(logging.DEBUG)
-    
-    # 포맷터 설정
-    formatter = logging.Formatter(
-        '[%(levelname)s] %(asctime)s [%(name)s:%(filename)s:%(lineno)d] - %(message)s'
-    )
-    
-    debug_formatter = logging.Formatter(
-        '[%(levelname)s] %(asctime)s [%(name)s:%(filename)s:%(lineno)d]\n'
-        'Thread: %(threadName)s\n'
-        'Message: %(message)s\n'
-    )
-    
-    daily_handler.setFormatter(formatter)
-    debug_handler.setFormatter(debug_formatter)
-    console_handler.setFormatter(formatter)
-    
-    # 핸들러 추가
-    if not logger.handlers:
-        logger.addHandler(daily_handler)
-        logger.addHandler(debug_handler)
-        logger.addHandler(console_handler)
-    
-    return logger
\ No newline at end of file
+
+    # 이미 설정된 로거면 핸들러를 다시 추가하지 않음
+    if logger.handlers:
+        return logger
+
+    with _lock:
+        if _queue_handler is None:
+            _start_listener()
+        _router.log_dirs[name] = log_dir
+        logger.addHandler(_queue_handler)
+
+    return logger
+
+
+logger = setup_logger('logger_config')
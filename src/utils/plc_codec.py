@@ -0,0 +1,155 @@
+# src/utils/plc_codec.py
+import numpy as np
+
+# 32bit 값의 word 순서
+# - LOW_FIRST : 하위 word가 낮은 주소 (Omron CJ/NJ DINT, REAL 기본)
+# - HIGH_FIRST: 상위 word가 낮은 주소
+LOW_FIRST = "low_first"
+HIGH_FIRST = "high_first"
+
+# tag type → (word 수, numpy dtype)
+TAG_TYPES = {
+    "UINT16": (1, np.uint16),
+    "INT16": (1, np.int16),
+    "UINT32": (2, np.uint32),
+    "INT32": (2, np.int32),
+    "DINT": (2, np.int32),
+    "REAL": (2, np.float32),
+}
+
+
+def bytes_to_words(data: bytes) -> np.ndarray:
+    """FINS 응답 데이터(big-endian) → uint16 배열"""
+    usable = len(data) - (len(data) % 2)
+    return np.frombuffer(data[:usable], dtype=">u2").astype(np.uint16)
+
+
+def words_to_bytes(words) -> bytes:
+    """uint16 배열 → FINS 쓰기용 big-endian bytes"""
+    return np.asarray(words, dtype=np.uint16).astype(">u2").tobytes()
+
+
+def _type_info(tag_type: str):
+    try:
+        return TAG_TYPES[tag_type.upper()]
+    except KeyError:
+        raise ValueError(f"지원하지 않는 tag type: {tag_type}")
+
+
+def decode_words(words, tag_type="UINT16", scale=1, offset=0.0, word_order=LOW_FIRST):
+    """
+    word 배열 전체를 한 번에 typed 배열로 변환
+    - 결과값 = raw / scale + offset
+    - scale=1, offset=0 이면 정수형 그대로 (INT16 → int16 배열 등)
+    """
+    n_words, dtype = _type_info(tag_type)
+    raw = np.asarray(words, dtype=np.uint16)
+
+    if n_words == 1:
+        values = raw.view(dtype) if dtype != np.uint16 else raw
+    else:
+        pairs = raw[:len(raw) - len(raw) % 2].reshape(-1, 2).astype(np.uint32)
+        if word_order == LOW_FIRST:
+            combined = pairs[:, 0] | (pairs[:, 1] << 16)
+        else:
+            combined = (pairs[:, 0] << 16) | pairs[:, 1]
+        values = combined.astype(np.uint32).view(dtype)
+
+    if scale == 1 and offset == 0:
+        return values
+    return values / scale + offset
+
+
+def encode_values(values, tag_type="UINT16", scale=1, offset=0.0, word_order=LOW_FIRST) -> np.ndarray:
+    """
+    decode_words의 역변환: 값 배열 → PLC에 쓸 uint16 word 배열
+    - (값 - offset) * scale이 tag type 범위를 벗어나면 ValueError (잘린 값을 PLC에 쓰지 않음)
+    """
+    n_words, dtype = _type_info(tag_type)
+    values = np.asarray(values)
+
+    if scale != 1 or offset != 0:
+        values = (values - offset) * scale
+        if dtype != np.float32:
+            values = np.rint(values)
+
+    if values.size:
+        limits = np.finfo(dtype) if dtype == np.float32 else np.iinfo(dtype)
+        if not (np.all(np.isfinite(values)) and limits.min <= values.min() and values.max() <= limits.max):
+            raise ValueError(f"{tag_type} 범위를 벗어난 값: {values.min()} ~ {values.max()} (허용 {limits.min} ~ {limits.max})")
+
+    if dtype == np.float32:
+        typed = values.astype(np.float32)
+    else:
+        # 음수 int16 → 2의 보수 word (int64 경유 후 해당 폭으로 자름)
+        typed = values.astype(np.int64).astype(dtype)
+
+    if n_words == 1:
+        return typed.view(np.uint16)
+
+    combined = typed.view(np.uint32)
+    low = (combined & 0xFFFF).astype(np.uint16)
+    high = (combined >> 16).astype(np.uint16)
+    if word_order == LOW_FIRST:
+        return np.stack([low, high], axis=1).reshape(-1)
+    return np.stack([high, low], axis=1).reshape(-1)
+
+
+def to_int16(value):
+    """unsigned word → signed INT16 (정수 1개 또는 배열)"""
+    if np.isscalar(value):
+        value = int(value)
+        return value - 65536 if value >= 32768 else value
+    return decode_words(value, "INT16")
+
+
+class TagField:
+    """
+    블록 안의 tag 1개(또는 같은 type의 연속 tag count개) 정의
+    word_offset: 블록 시작 주소 기준 word 위치
+    """
+    def __init__(self, name, word_offset, count=1, tag_type="UINT16", scale=1, offset=0.0, word_order=LOW_FIRST):
+        self.name = name
+        self.word_offset = word_offset
+        self.count = count
+        self.tag_type = tag_type
+        self.scale = scale
+        self.offset = offset
+        self.word_order = word_order
+
+    @property
+    def word_count(self):
+        return _type_info(self.tag_type)[0] * self.count
+
+    def decode(self, words):
+        block = np.asarray(words, dtype=np.uint16)[self.word_offset:self.word_offset + self.word_count]
+        if len(block) < self.word_count:
+            block = np.concatenate([block, np.zeros(self.word_count - len(block), dtype=np.uint16)])
+        return decode_words(block, self.tag_type, self.scale, self.offset, self.word_order)
+
+    def encode(self, values):
+        return encode_values(values, self.tag_type, self.scale, self.offset, self.word_order)
+
+
+class BlockSchema:
+    """
+    PLC 연속 영역 1개의 구성 정의
+    - read 1회로 블록 전체를 읽고 decode()로 tag별 typed 배열을 얻음
+    - encode()는 쓰기용 word 배열 생성 (정의되지 않은 word는 0)
+    """
+    def __init__(self, fields):
+        self.fields = list(fields)
+
+    @property
+    def word_count(self):
+        return max(f.word_offset + f.word_count for f in self.fields) if self.fields else 0
+
+    def decode(self, words) -> dict:
+        return {f.name: f.decode(words) for f in self.fields}
+
+    def encode(self, values: dict) -> np.ndarray:
+        words = np.zeros(self.word_count, dtype=np.uint16)
+        for f in self.fields:
+            if f.name in values:
+                words[f.word_offset:f.word_offset + f.word_count] = f.encode(values[f.name])
+        return words
@@ -0,0 +1,118 @@
+# src/utils/run_buffer.py
+import numpy as np
+from src.config.settings import TEMPERATURE_TAG_SETTINGS
+from src.utils.logger_config import setup_logger
+from src.utils.tuning_engine import OnlineTuningState
+
+logger = setup_logger('run_buffer')
+
+# CSV 컬럼 순서와 동일한 신호 순서
+SIGNALS = ("PTC", "CTC", "SP", "MV")
+
+
+def build_csv_header(zones):
+    """
+    온도 로그 CSV 헤더 생성
+    ["time", "tube", "job", PTC1..N, CTC1..N, SP1..N, MV1..N]
+    """
+    header = ["time", "tube", "job"]
+    for signal in SIGNALS:
+        header += [f"{signal}{i + 1}" for i in range(zones)]
+    return header
+
+
+class RunBuffer:
+    """
+    온도 로깅 중인 run 1개의 샘플을 메모리에 누적하는 버퍼
+    - signal(PTC/CTC/SP/MV)별로 (capacity x zones) 배열을 미리 할당
+    - 가득 차면 2배로 확장 (append는 평균 O(1))
+    - run 종료 시 CSV를 다시 읽지 않고 버퍼 그대로 그래프(RunSeries.from_rows)에 전달
+      (to_rows()는 CSV rows 형태가 꼭 필요한 경우에만)
+    - tuning: 샘플마다 갱신되는 OnlineTuningState (run 종료 즉시 P1/P2 사용 가능)
+    - observers: 샘플마다 update(ptc, ctc, sp, mv)가 호출되는 객체 목록
+    """
+    def __init__(self, temp_area: str, file_path=None, zones=None, capacity=1024):
+        # zones: None이면 설정값(TEMPERATURE_TAG_SETTINGS['ZONE_COUNT'])
+        zones = zones or TEMPERATURE_TAG_SETTINGS['ZONE_COUNT']
+        self.temp_area = temp_area
+        self.file_path = file_path
+        self.zones = zones
+        self.tube_id = None
+        self.job_id = None
+        self.length = 0
+
+        self.tuning = OnlineTuningState(zones)
+        self.observers = []
+
+        self._times = []
+        self._data = {
+            signal: np.zeros((capacity, zones), dtype=np.int64 if signal == "MV" else np.float64)
+            for signal in SIGNALS
+        }
+
+    @property
+    def capacity(self):
+        return self._data["PTC"].shape[0]
+
+    def _grow(self):
+        new_capacity = self.capacity * 2
+        for signal, arr in self._data.items():
+            grown = np.zeros((new_capacity, self.zones), dtype=arr.dtype)
+            grown[:self.length] = arr[:self.length]
+            self._data[signal] = grown
+        logger.debug(f"RunBuffer 확장: {self.temp_area}, capacity={new_capacity}")
+
+    def append(self, timestamp: str, values):
+        """
+        values: data_read() 결과
+                [tube, job, PTC N개, CTC N개, SP N개, MV N개]
+        """
+        if self.length >= self.capacity:
+            self._grow()
+
+        if self.tube_id is None:
+            self.tube_id, self.job_id = values[0], values[1]
+
+        idx = self.length
+        for k, signal in enumerate(SIGNALS):
+            start = 2 + k * self.zones
+            self._data[signal][idx] = values[start:start + self.zones]
+
+        self._times.append(timestamp)
+        self.length += 1
+
+        ptc, ctc, sp, mv = (self._data[signal][idx] for signal in SIGNALS)
+        self.tuning.update(ptc, ctc, sp, mv)
+        for observer in self.observers:
+            try:
+                observer.update(ptc, ctc, sp, mv)
+            except Exception as e:
+                logger.exception(f"RunBuffer observer 처리 중 예외 발생: {e}")
+
+    def add_observer(self, observer):
+        self.observers.append(observer)
+
+    def matches(self, tube_id, job_id) -> bool:
+        return self.length > 0 and self.tube_id == tube_id and self.job_id == job_id
+
+    def series(self, signal: str):
+        """signal의 (length x zones) 배열 view 반환 (복사 없음)"""
+        return self._data[signal][:self.length]
+
+    def to_rows(self):
+        """
+        CSV 파일과 동일한 구조의 rows 반환 (0번: 헤더)
+        값은 문자열이 아닌 숫자로 들어있어 다시 파싱할 필요가 없음
+        """
+        rows = [build_csv_header(self.zones)]
+        if self.length == 0:
+            return rows
+
+        values = [self.series(signal).tolist() for signal in SIGNALS]
+        for i, timestamp in enumerate(self._times):
+            row = [timestamp, self.tube_id, self.job_id]
+            for signal_values in values:
+                row += signal_values[i]
+            rows.append(row)
+
+        return rows
@@ -0,0 +1,87 @@
+# src/utils/run_catalog.py
+import csv
+import os
+import re
+from collections import namedtuple
+from pathlib import Path
+
+from src.utils.logger_config import setup_logger
+
+logger = setup_logger('run_catalog')
+
+# temperature_T{tube}_{job}_{area}_{YYYYMMDD}_{HHMMSS}.csv
+RUN_FILE_PATTERN = re.compile(
+    r"^temperature_T(?P<tube>-?\d+)_(?P<job>-?\d+)_(?P<area>[A-Za-z]+)_(?P<stamp>\d{8}_\d{6})\.csv$"
+)
+
+RunFile = namedtuple("RunFile", ["path", "tube_id", "job_id", "temp_area", "timestamp"])
+
+
+def default_log_dir() -> Path:
+    return Path(os.getcwd()) / "temperature_logs"
+
+
+def parse_run_file(path) -> RunFile:
+    """파일명에서 tube/job/area/시각 추출. 형식이 다르면 None"""
+    path = Path(path)
+    match = RUN_FILE_PATTERN.match(path.name)
+    if match is None:
+        return None
+    return RunFile(
+        path,
+        int(match.group("tube")),
+        int(match.group("job")),
+        match.group("area").lower(),
+        match.group("stamp"),
+    )
+
+
+def scan_runs(log_dir=None, tube_id=None):
+    """log_dir의 온도 로그 run 목록 (시각 순)"""
+    log_dir = Path(log_dir) if log_dir else default_log_dir()
+    if not log_dir.exists():
+        logger.warning(f"scan_runs: 로그 디렉토리가 존재하지 않습니다: {log_dir}")
+        return []
+
+    pattern = f"temperature_T{tube_id}_*.csv" if tube_id is not None else "temperature_T*.csv"
+    runs = [run for run in map(parse_run_file, log_dir.glob(pattern)) if run is not None]
+    runs.sort(key=lambda r: (r.timestamp, r.path.name))
+    return runs
+
+
+def latest_run_pairs(runs):
+    """
+    (tube_id, job_id)별 최신 normal / high run 묶음
+    return: {(tube, job): {"normal": RunFile | None, "high": RunFile | None}}
+    """
+    pairs = {}
+    for run in runs:
+        entry = pairs.setdefault((run.tube_id, run.job_id), {"normal": None, "high": None})
+        if run.temp_area in entry:
+            # runs가 시각 순이므로 뒤에 오는 것이 최신
+            entry[run.temp_area] = run
+    return pairs
+
+
+def recent_job_runs(runs, temp_area, count):
+    """
+    temp_area run 중 job별 최신 run을 최근 job count개만 (오래된 job → 최신 job 순)
+    runs: scan_runs() 결과 (시각 순)
+    """
+    latest = {}
+    for run in runs:
+        if run.temp_area == temp_area:
+            # 다시 넣어서 job 순서를 마지막 run 시각 기준으로 유지
+            latest.pop(run.job_id, None)
+            latest[run.job_id] = run
+    return list(latest.values())[-count:] if count > 0 else []
+
+
+def load_run_rows(path):
+    """CSV 전체를 list[list[str]]로 읽음. 실패 시 None"""
+    try:
+        with open(path, "r", encoding="utf-8", newline="") as f:
+            return list(csv.reader(f))
+    except Exception as e:
+        logger.exception(f"load_run_rows: CSV 읽기 실패: {path}, 예외: {e}")
+        return None
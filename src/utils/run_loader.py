@@ -0,0 +1,145 @@
+# src/utils/run_loader.py
+import csv
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+
+import numpy as np
+from src.config.settings import COMPARE_SETTINGS
+from src.utils.logger_config import setup_logger
+from src.utils.run_series import GRAPH_SIGNALS, RunSeries
+from src.utils.tuning_engine import RunMatrix, parse_run
+
+logger = setup_logger('run_loader')
+
+# 이 행 수 단위로 읽기 / 파싱
+# list(csv.reader) / 문자열 → float 변환은 파일 전체를 한 번에 처리하는 동안 GIL을 놓지 않아서
+# loader 스레드가 여러 개면 UI 스레드가 그만큼 기다림 → 짧게 나눠서 중간중간 UI 스레드에 양보
+CHUNK_ROWS = 2000
+
+
+def read_run_series(path, chunk_rows=CHUNK_ROWS):
+    """CSV → RunSeries (SP / PTC / CTC만, chunk_rows행씩 파싱). 데이터가 없으면 None"""
+    with open(path, "r", encoding="utf-8", newline="") as f:
+        reader = csv.reader(f)
+        header = next(reader, None)
+        if header is None:
+            return None
+        parts = []
+        while True:
+            chunk = list(islice(reader, chunk_rows))
+            if not chunk:
+                break
+            parts.append(parse_run([header] + chunk, signals=GRAPH_SIGNALS, fill=np.nan))
+
+    if not parts:
+        return None
+    return RunSeries(RunMatrix(**{
+        name.lower(): np.concatenate([getattr(part, name.lower()) for part in parts])
+        for name in GRAPH_SIGNALS
+    }, missing=parts[0].missing, rows=sum(part.n_samples for part in parts)))
+
+
+def series_nbytes(series):
+    return series.x.nbytes + sum(m.nbytes for m in (series.sp, series.ptc, series.ctc) if m is not None)
+
+
+class RunSeriesCache:
+    """
+    로드한 RunSeries LRU 캐시 (개수가 아니라 배열 메모리 합계로 제한)
+    - key: (경로, 수정 시각, 크기) → 파일이 바뀌면 다시 로드
+    - 여러 loader 스레드에서 동시에 접근하므로 lock 사용
+    """
+    def __init__(self, max_bytes):
+        self.max_bytes = max_bytes
+        self.nbytes = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            series = self._entries.get(key)
+            if series is not None:
+                self._entries.move_to_end(key)
+            return series
+
+    def put(self, key, series):
+        size = series_nbytes(series)
+        if size > self.max_bytes:
+            # 캐시 상한보다 큰 run은 보관하지 않음 (표시는 가능)
+            return
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self.nbytes -= series_nbytes(old)
+            self._entries[key] = series
+            self.nbytes += size
+            while self.nbytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self.nbytes -= series_nbytes(evicted)
+
+    def __len__(self):
+        return len(self._entries)
+
+
+class RunLoader:
+    """
+    온도 로그 CSV → RunSeries 백그라운드 로더 (run 비교 화면용)
+    - ThreadPoolExecutor에서 파일 읽기 / 파싱 → UI 스레드를 막지 않음
+    - 끝나는 순서대로 callback(path, series) 호출 (worker 스레드에서 호출되므로
+      Qt 위젯은 callback으로 pyqtSignal.emit을 넘겨서 UI 스레드로 전달)
+    - 새 요청이 오면 아직 시작하지 않은 이전 요청은 취소
+    """
+    def __init__(self, max_workers=None, cache_mb=None):
+        self.cache = RunSeriesCache((cache_mb or COMPARE_SETTINGS['CACHE_MB']) * 1024 * 1024)
+        self._pool = ThreadPoolExecutor(
+            max_workers=max_workers or COMPARE_SETTINGS['LOADER_WORKERS'],
+            thread_name_prefix="run_loader",
+        )
+        self._futures = []
+
+    @staticmethod
+    def _cache_key(path):
+        stat = os.stat(path)
+        return str(path), stat.st_mtime_ns, stat.st_size
+
+    def load_series(self, path):
+        """path의 RunSeries (캐시 우선). 파일이 없거나 데이터 없으면 None"""
+        try:
+            key = self._cache_key(path)
+        except OSError as e:
+            logger.warning(f"run 파일 확인 실패: {path}, {e}")
+            return None
+
+        series = self.cache.get(key)
+        if series is not None:
+            return series
+
+        series = read_run_series(path)
+        if series is not None:
+            self.cache.put(key, series)
+            logger.debug(f"run 로드: {path} ({series.length}행, 캐시 {self.cache.nbytes / 1e6:.1f}MB)")
+        return series
+
+    def _load(self, path, callback):
+        try:
+            series = self.load_series(path)
+        except Exception as e:
+            logger.exception(f"run 로드 중 예외 발생: {path}, {e}")
+            series = None
+        callback(path, series)
+
+    def load(self, paths, callback):
+        """paths를 백그라운드에서 로드 (이전 요청 중 대기 중인 것은 취소)"""
+        self.cancel()
+        self._futures = [self._pool.submit(self._load, path, callback) for path in paths]
+
+    def cancel(self):
+        for future in self._futures:
+            future.cancel()
+        self._futures = []
+
+    def shutdown(self):
+        self._pool.shutdown(wait=False, cancel_futures=True)
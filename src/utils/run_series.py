@@ -0,0 +1,134 @@
+# src/utils/run_series.py
+import numpy as np
+from src.utils.graph_axes import data_range
+from src.utils.logger_config import setup_logger
+from src.utils.tuning_engine import parse_run
+
+logger = setup_logger('run_series')
+
+GRAPH_SIGNALS = ("SP", "PTC", "CTC")
+
+
+class RunSeries:
+    """
+    그래프용 run 데이터
+    - CSV rows / RunBuffer를 1번만 파싱해서 zone 전체 SP / PTC / CTC 보관
+    - zone별 배열은 (zones x n_samples)로 연속 배치 → zone 전환 시 복사/파싱 없음
+    - zone별 PTC 최대값, 전체 zone y 범위 미리 계산
+    - CSV에 없는 signal(run.missing, 예: 이전 형식 로그의 SP / CTC 없음)은 None → 그리지 않음
+    - 모자란 컬럼 / 숫자가 아닌 값은 NaN → 선이 끊기고 PTC max / y 범위에서 제외
+    """
+    def __init__(self, run):
+        self.zones = run.zones
+        self.length = run.n_samples
+        self.x = np.arange(self.length)
+        self.missing = run.missing
+
+        self.sp = self._zone_major(run, "SP")
+        self.ptc = self._zone_major(run, "PTC")
+        self.ctc = self._zone_major(run, "CTC")
+
+        # zone별 PTC 최대값 (NaN 무시, PTC가 없거나 값이 하나도 없으면 NaN → zone()에서 None)
+        if self.ptc is not None and self.length:
+            self.ptc_max = np.fmax.reduce(self.ptc, axis=1)
+        else:
+            self.ptc_max = np.full(self.zones, np.nan)
+        self.y_range = data_range((self.sp, self.ptc, self.ctc))
+        self.x_range = (0, max(self.length - 1, 1))
+
+    def _zone_major(self, run, name):
+        """(n_samples x zones) → (zones x n_samples) 연속 배열. CSV에 없는 signal은 None, 샘플이 모자라면 NaN"""
+        if name in self.missing:
+            return None
+        matrix = getattr(run, name.lower())
+        if len(matrix) != self.length:
+            padded = np.full((self.length, self.zones), np.nan)
+            padded[:len(matrix)] = matrix[:self.length]
+            matrix = padded
+        return np.ascontiguousarray(matrix.T)
+
+    @classmethod
+    def from_rows(cls, rows):
+        """rows: CSV rows(0번: 헤더) 또는 RunBuffer. 데이터가 없으면 None"""
+        if rows is None:
+            return None
+        if hasattr(rows, "series"):
+            return cls(parse_run(rows)) if rows.length else None
+        if len(rows) < 2:
+            return None
+        return cls(parse_run(rows, signals=GRAPH_SIGNALS, fill=np.nan))
+
+    def zone(self, zone: int):
+        """
+        zone(1~N)의 (sp, ptc, ctc, ptc_max). run에 없는 zone이면 None
+        CSV에 없는 signal은 None, PTC 값이 없으면 ptc_max도 None
+        """
+        z = zone - 1
+        if not 0 <= z < self.zones:
+            return None
+        ptc_max = float(self.ptc_max[z])
+        return (
+            *(None if m is None else m[z] for m in (self.sp, self.ptc, self.ctc)),
+            None if np.isnan(ptc_max) else ptc_max,
+        )
+
+
+class LiveSeries:
+    """
+    로깅 중인 run의 최근 capacity개 샘플 (RunSeries와 같은 읽기 API)
+    - zone x signal별 고정 크기 ring buffer → run이 길어져도 메모리 / 프레임당 비용 일정
+    - PTC max, y 범위는 run 시작부터 누적 (샘플당 O(zones))
+    - x_range: 스크롤 창 (capacity개가 찰 때까지는 0 ~ capacity-1 고정)
+    """
+    def __init__(self, zones, capacity):
+        self.zones = zones
+        self.capacity = capacity
+        self.total = 0    # run 시작 이후 전체 샘플 수
+        self._head = 0    # 다음에 쓸 위치
+        self._ring = {name: np.zeros((zones, capacity)) for name in GRAPH_SIGNALS}
+        self.ptc_max = np.full(zones, -np.inf)
+        self.y_range = None
+
+    @property
+    def length(self):
+        return min(self.total, self.capacity)
+
+    @property
+    def x(self):
+        return np.arange(self.total - self.length, self.total)
+
+    @property
+    def x_range(self):
+        start = max(self.total - self.capacity, 0)
+        return start, start + self.capacity - 1
+
+    def append(self, sp, ptc, ctc):
+        for name, values in zip(GRAPH_SIGNALS, (sp, ptc, ctc)):
+            self._ring[name][:, self._head] = values
+        self._head = (self._head + 1) % self.capacity
+        self.total += 1
+
+        np.maximum(self.ptc_max, ptc, out=self.ptc_max)
+        lo = float(min(np.min(sp), np.min(ptc), np.min(ctc)))
+        hi = float(max(np.max(sp), np.max(ptc), np.max(ctc)))
+        if self.y_range is None:
+            self.y_range = (lo, hi)
+        elif lo < self.y_range[0] or hi > self.y_range[1]:
+            self.y_range = (min(lo, self.y_range[0]), max(hi, self.y_range[1]))
+
+    def _ordered(self, name, z):
+        row = self._ring[name][z]
+        if self.total <= self.capacity:
+            return row[:self.total]
+        # 가장 오래된 샘플부터 순서대로
+        return np.concatenate((row[self._head:], row[:self._head]))
+
+    def zone(self, zone: int):
+        """zone(1~N)의 최근 창 (sp, ptc, ctc, run 전체 PTC max). 샘플이 없거나 없는 zone이면 None"""
+        z = zone - 1
+        if not 0 <= z < self.zones or self.total == 0:
+            return None
+        return (
+            self._ordered("SP", z), self._ordered("PTC", z), self._ordered("CTC", z),
+            float(self.ptc_max[z]),
+        )
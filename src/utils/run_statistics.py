@@ -0,0 +1,161 @@
+# src/utils/run_statistics.py
+from collections import namedtuple
+
+import numpy as np
+from src.config.settings import RUN_MONITOR_SETTINGS
+from src.utils.logger_config import setup_logger
+
+logger = setup_logger('run_statistics')
+
+# state: 1 = 상한 초과, -1 = 하한 미만, 0 = 정상 복귀
+# zone: 1 ~ N, sample_index: run 내 샘플 번호 (0부터)
+DeviationEvent = namedtuple("DeviationEvent", ["signal", "zone", "deviation", "limit", "state", "sample_index"])
+
+
+class RunningStats:
+    """
+    zone별 running 통계 (샘플당 O(zones))
+    - 평균 / 분산: Welford 방식 (값을 보관하지 않음)
+    - min / max / EWMA / 마지막 값
+    """
+    def __init__(self, zones, ewma_alpha=0.1):
+        self.zones = zones
+        self.alpha = ewma_alpha
+        self.count = 0
+        self.mean = np.zeros(zones)
+        self._m2 = np.zeros(zones)
+        self.min = np.full(zones, np.inf)
+        self.max = np.full(zones, -np.inf)
+        self.ewma = np.zeros(zones)
+        self.last = np.zeros(zones)
+
+    def update(self, values):
+        x = np.asarray(values, dtype=np.float64)
+        self.count += 1
+
+        delta = x - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (x - self.mean)
+
+        np.minimum(self.min, x, out=self.min)
+        np.maximum(self.max, x, out=self.max)
+
+        if self.count == 1:
+            self.ewma[:] = x
+        else:
+            self.ewma += self.alpha * (x - self.ewma)
+        self.last = x
+
+    @property
+    def variance(self):
+        """표본 분산 (샘플 2개 미만이면 0)"""
+        if self.count < 2:
+            return np.zeros(self.zones)
+        return self._m2 / (self.count - 1)
+
+    @property
+    def std(self):
+        return np.sqrt(self.variance)
+
+    def snapshot(self):
+        if self.count == 0:
+            zeros = [0.0] * self.zones
+            return {"count": 0, "mean": zeros, "std": zeros, "min": zeros, "max": zeros, "ewma": zeros}
+        return {
+            "count": self.count,
+            "mean": self.mean.tolist(),
+            "std": self.std.tolist(),
+            "min": self.min.tolist(),
+            "max": self.max.tolist(),
+            "ewma": self.ewma.tolist(),
+        }
+
+
+class ZoneStatistics:
+    """
+    온도 로깅 중 zone별 통계 + SP 대비 편차 감시 (RunBuffer observer)
+    - PTC, CTC, PTC-SP, CTC-SP 각각 RunningStats 유지
+    - PTC-SP / CTC-SP가 기준을 넘거나 다시 돌아오는 순간에만 callback(DeviationEvent) 호출
+      (해제는 기준에서 hysteresis만큼 안쪽으로 들어왔을 때 → 경계값에서 경보가 반복되지 않도록)
+
+    limits: {"PTC-SP": (하한, 상한), "CTC-SP": (하한, 상한)}, 하한/상한 None이면 감시 안 함
+    """
+    STAT_SIGNALS = ("PTC", "CTC", "PTC-SP", "CTC-SP")
+
+    def __init__(self, zones, callback=None, ewma_alpha=None, limits=None, hysteresis=None):
+        settings = RUN_MONITOR_SETTINGS
+        self.zones = zones
+        self.n_samples = 0
+        self.hysteresis = settings['HYSTERESIS'] if hysteresis is None else hysteresis
+        self.limits = limits if limits is not None else {
+            "PTC-SP": settings['PTC_DEVIATION_LIMITS'],
+            "CTC-SP": settings['CTC_DEVIATION_LIMITS'],
+        }
+
+        alpha = settings['EWMA_ALPHA'] if ewma_alpha is None else ewma_alpha
+        self.stats = {name: RunningStats(zones, alpha) for name in self.STAT_SIGNALS}
+        self._alarm = {name: np.zeros(zones, dtype=np.int8) for name in self.limits}
+        self.callbacks = [callback] if callback is not None else []
+
+    def add_callback(self, callback):
+        self.callbacks.append(callback)
+
+    def update(self, ptc, ctc, sp, mv=None):
+        ptc_dev = ptc - sp
+        ctc_dev = ctc - sp
+        for name, values in zip(self.STAT_SIGNALS, (ptc, ctc, ptc_dev, ctc_dev)):
+            self.stats[name].update(values)
+
+        self._check("PTC-SP", ptc_dev)
+        self._check("CTC-SP", ctc_dev)
+        self.n_samples += 1
+
+    def _check(self, name, deviation):
+        if name not in self.limits:
+            return
+        lower, upper = self.limits[name]
+        state = self._alarm[name]
+        new_state = state.copy()
+
+        # 해제 먼저 판정 → 같은 샘플에서 반대쪽 기준을 넘으면 그쪽 경보로 바뀜
+        if upper is not None:
+            new_state[(state == 1) & (deviation < upper - self.hysteresis)] = 0
+        if lower is not None:
+            new_state[(state == -1) & (deviation > lower + self.hysteresis)] = 0
+        if upper is not None:
+            new_state[deviation > upper] = 1
+        if lower is not None:
+            new_state[deviation < lower] = -1
+
+        changed = np.flatnonzero(new_state != state)
+        if len(changed) == 0:
+            return
+        self._alarm[name] = new_state
+
+        for z in changed:
+            after = int(new_state[z])
+            side = after if after != 0 else int(state[z])
+            event = DeviationEvent(
+                name, int(z) + 1, float(deviation[z]),
+                upper if side > 0 else lower,
+                after, self.n_samples,
+            )
+            for callback in self.callbacks:
+                try:
+                    callback(event)
+                except Exception as e:
+                    logger.exception(f"편차 경보 callback 처리 중 예외 발생: {e}")
+
+    def active_alarms(self):
+        """현재 경보 중인 (signal, zone, state) 목록"""
+        return [
+            (name, int(z) + 1, int(state[z]))
+            for name, state in self._alarm.items()
+            for z in np.flatnonzero(state)
+        ]
+
+    def snapshot(self):
+        """signal별 통계 dict + 현재 경보 목록"""
+        result = {name: stats.snapshot() for name, stats in self.stats.items()}
+        result["alarms"] = self.active_alarms()
+        return result
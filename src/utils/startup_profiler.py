@@ -0,0 +1,96 @@
+# src/utils/startup_profiler.py
+"""
+시작 시간 측정 (python main.py --profile-startup 또는 환경변수 DFHT_PROFILE_STARTUP=1)
+- 단계(phase)별 소요 시간 / 그 단계에서 새로 import된 모듈 수를 -X importtime 형식으로 stderr에 출력
+    startup time: self [us] | cumulative [us] | modules | phase
+  (self = 하위 단계를 뺀 시간, 하위 단계는 들여쓰기)
+- 단계에서 처음 import된 최상위 패키지 이름도 함께 출력 → 어떤 import가 시작을 늦추는지 확인
+- 비활성 상태에서는 phase() / mark()가 아무 것도 하지 않음
+"""
+import os
+import sys
+import time
+from contextlib import contextmanager
+
+PROFILE_FLAG = "--profile-startup"
+PROFILE_ENV = "DFHT_PROFILE_STARTUP"
+
+
+class StartupProfiler:
+    def __init__(self, enabled=False):
+        self.enabled = enabled
+        self.t0 = time.perf_counter()
+        self._records = []   # (depth, 이름, 누적 us, 하위 제외 us, 모듈 수, 새 최상위 패키지)
+        self._stack = []     # 진행 중인 단계의 하위 단계 시간 합
+
+    @contextmanager
+    def phase(self, name):
+        if not self.enabled:
+            yield
+            return
+        before = set(sys.modules)
+        depth = len(self._stack)
+        index = len(self._records)
+        self._records.append(None)  # 시작 순서대로 출력하기 위한 자리
+        self._stack.append(0)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = int((time.perf_counter() - start) * 1e6)
+            children = self._stack.pop()
+            if self._stack:
+                self._stack[-1] += elapsed
+            new = set(sys.modules) - before
+            packages = sorted({m.split(".")[0] for m in new if not m.startswith("_")} - {m.split(".")[0] for m in before})
+            self._records[index] = (depth, name, elapsed, elapsed - children, len(new), packages)
+
+    def mark(self, name):
+        """시작 시점부터 지금까지 경과 시간 기록 (예: 첫 화면 표시)"""
+        if self.enabled:
+            elapsed = int((time.perf_counter() - self.t0) * 1e6)
+            self._records.append((0, f"@ {name}", elapsed, 0, 0, []))
+
+    def watch_first_paint(self, widget):
+        """widget이 처음 그려지는 시점을 mark("first paint")로 기록"""
+        if not self.enabled:
+            return
+        from PyQt6.QtCore import QEvent, QObject
+
+        profiler = self
+
+        class _FirstPaintFilter(QObject):
+            def eventFilter(self, obj, event):
+                if event.type() == QEvent.Type.Paint:
+                    obj.removeEventFilter(self)
+                    profiler.mark("first paint")
+                return False
+
+        self._paint_filter = _FirstPaintFilter(widget)
+        widget.installEventFilter(self._paint_filter)
+
+    def report(self, stream=None):
+        if not self.enabled:
+            return
+        stream = stream or sys.stderr
+        print("startup time: self [us] | cumulative [us] | modules | phase", file=stream)
+        for record in self._records:
+            if record is None:
+                continue
+            depth, name, cumulative, own, modules, packages = record
+            line = f"startup time: {own:>9} | {cumulative:>16} | {modules:>7} | {'  ' * depth}{name}"
+            if packages:
+                line += f"  [{', '.join(packages)}]"
+            print(line, file=stream)
+        stream.flush()
+
+
+_profiler = None
+
+
+def get_startup_profiler() -> StartupProfiler:
+    """공용 profiler (인자 / 환경변수로 활성화 여부 결정)"""
+    global _profiler
+    if _profiler is None:
+        _profiler = StartupProfiler(PROFILE_FLAG in sys.argv or os.environ.get(PROFILE_ENV) == "1")
+    return _profiler
@@ -2,21 +2,67 @@ import csv
 import os
 from pathlib import Path
 from datetime import datetime
+from functools import lru_cache
 from src.communication.plc_connector import PLCConnector
+from src.config.settings import PLC_SETTINGS, TEMPERATURE_TAG_SETTINGS
 from src.utils.logger_config import setup_logger
+from src.utils.run_buffer import build_csv_header, SIGNALS
+from src.utils.plc_codec import BlockSchema, TagField
 
 logger = setup_logger('temperature_logger')
-plc_connector = PLCConnector()
-plc_connector.connect(
-    ip_address="172.22.80.1",
-    plc_port=9600,
-    plc_node=1,
-    pc_node=3
-)
-
-def init_plc_csv_logger(temp_area: str):
+
+
+@lru_cache(maxsize=None)
+def temperature_block_schema(zones: int, signal_stride: int) -> BlockSchema:
+    """
+    tube별 온도 블록 구성 (base = BASE_ADDR + (tube_id - 1) * TUBE_STRIDE)
+    기본 8 zone: PTC 17550 ~, CTC 17560 ~, SP 17570 ~, MV 17580 ~
+    zones > signal_stride이면 signal 블록이 겹침 (예: PTC9~가 CTC 주소) → ValueError
+    """
+    if zones > signal_stride:
+        raise ValueError(
+            f"ZONE_COUNT({zones})가 SIGNAL_STRIDE({signal_stride})보다 큼 → signal 블록이 겹침 "
+            f"(TEMPERATURE_TAG_SETTINGS['SIGNAL_STRIDE']를 {zones} 이상으로 설정)"
+        )
+    return BlockSchema([
+        TagField(name, word_offset=k * signal_stride, count=zones, scale=1 if name == "MV" else 10)
+        for k, name in enumerate(SIGNALS)
+    ])
+
+
+def zone_count() -> int:
+    return TEMPERATURE_TAG_SETTINGS['ZONE_COUNT']
+
+
+# PLC 연결은 처음 읽을 때 만듦 (import 시 소켓 연결 / 응답 대기를 하지 않음 → 창이 먼저 뜸)
+# GUI에서는 연결 설정 위젯의 connector를 set_plc_connector()로 넘겨서 같은 연결을 사용
+_plc_connector = None
+
+
+def set_plc_connector(connector):
+    """온도 / job 정보 읽기에 사용할 PLCConnector 지정"""
+    global _plc_connector
+    _plc_connector = connector
+
+
+def get_plc_connector() -> PLCConnector:
+    """지정된 connector (없으면 PLC_SETTINGS 기본값으로 처음 호출 시 연결)"""
+    global _plc_connector
+    if _plc_connector is None:
+        _plc_connector = PLCConnector()
+        _plc_connector.connect(
+            ip_address=PLC_SETTINGS['DEFAULT_IP'],
+            plc_port=PLC_SETTINGS['DEFAULT_PORT'],
+            plc_node=PLC_SETTINGS['DEFAULT_PLC_NODE'],
+            pc_node=PLC_SETTINGS['DEFAULT_PC_NODE']
+        )
+    return _plc_connector
+
+
+def init_plc_csv_logger(temp_area: str, zones=None):
     """
     temp_area = "Normal" / "High" 같은 문자열
+    zones: zone 수 (None이면 설정값)
     CSV 로그 파일 생성 + writer 반환
     """
 
@@ -29,7 +75,7 @@ def init_plc_csv_logger(temp_area: str):
     # ------------------------------
     # 2) Job 정보 읽기
     # ------------------------------
-    job_info = plc_connector.read_word(
+    job_info = get_plc_connector().read_word(
         mem_area=0xAF,
         word_addr=500,
         word_count=2
@@ -61,13 +107,7 @@ def init_plc_csv_logger(temp_area: str):
     # ------------------------------
     # 4) 헤더 생성
     # ------------------------------
-    header = [
-        "time", "tube", "job",
-        "PTC1", "PTC2", "PTC3", "PTC4", "PTC5", "PTC6", "PTC7", "PTC8",
-        "CTC1", "CTC2", "CTC3", "CTC4", "CTC5", "CTC6", "CTC7", "CTC8",
-        "SP1", "SP2", "SP3", "SP4", "SP5", "SP6", "SP7", "SP8",
-        "MV1", "MV2", "MV3", "MV4", "MV5", "MV6", "MV7", "MV8"
-    ]
+    header = build_csv_header(zones or zone_count())
 
     log_writer.writerow(header)
     log_file.flush()
@@ -79,9 +119,9 @@ def init_plc_csv_logger(temp_area: str):
     # ------------------------------
     return log_file, log_writer, file_path
 
-def data_read():
+def data_read(zones=None):
     # 1) Job 정보 읽기
-    job_info = plc_connector.read_word(
+    job_info = get_plc_connector().read_word(
         mem_area=0xAF,
         word_addr=500,
         word_count=2
@@ -98,19 +138,21 @@ def data_read():
 
     tube_id, job_id = job_info[:2]
 
-    # 2) PTC/CTC/SP/MV 블록 읽기
-    base = 17550 + (tube_id - 1) * 800
+    # 2) PTC/CTC/SP/MV 블록을 한 번에 읽어서 decode
+    tags = TEMPERATURE_TAG_SETTINGS
+    schema = temperature_block_schema(zones or zone_count(), tags['SIGNAL_STRIDE'])
+    base = tags['BASE_ADDR'] + (tube_id - 1) * tags['TUBE_STRIDE']
 
-    ptc = [v / 10 for v in read_block(0xA0, base + 0, 8)]   # 17550 ~
-    ctc = [v / 10 for v in read_block(0xA0, base + 10, 8)]  # 17560 ~
-    sp  = [v / 10 for v in read_block(0xA0, base + 20, 8)]  # 17570 ~
-    mv  = read_block(0xA0, base + 30, 8)                    # 17580 ~
+    words = read_block(tags['MEMORY_AREA'], base, schema.word_count)
+    block = schema.decode(words)
 
     # 3) CSV row에 딱 맞는 평탄화 리스트로 반환
-    #    [tube, job, PTC 8개, CTC 8개, SP 8개, MV 8개]
-    row_values = [tube_id, job_id] + ptc + ctc + sp + mv
+    #    [tube, job, PTC N개, CTC N개, SP N개, MV N개]
+    row_values = [tube_id, job_id]
+    for name in SIGNALS:
+        row_values += block[name].tolist()
 
-    logger.debug(f"data_read row_values: {row_values}")
+    logger.debug("data_read row_values: %s", row_values)
 
     return row_values
 
@@ -120,7 +162,7 @@ def read_block(mem_area, word_addr: int, count: int) -> list[int]:
     PLC에서 특정 word_addr부터 count개 읽어서
     항상 길이 count인 리스트로 반환
     """
-    data = plc_connector.read_word(
+    data = get_plc_connector().read_word(
         mem_area=mem_area,
         word_addr=word_addr,
         word_count=count
@@ -143,29 +185,36 @@ def read_block(mem_area, word_addr: int, count: int) -> list[int]:
 
     return data
 
-def append_temperature_log(log_file, log_writer):
+def append_temperature_log(log_file, log_writer, run_buffer=None):
+    """
+    PLC 온도 데이터를 1줄 읽어서 CSV에 추가
+    run_buffer가 주어지면 같은 값을 메모리 버퍼에도 누적 (run 종료 시 파일 재읽기 방지)
+    """
     # log_file 또는 log_writer가 아직 초기화 안 된 경우
     if log_file is None or log_writer is None:
         logger.warning("append_temperature_log: log_file 또는 log_writer가 None 입니다. (초기화 안 됨)")
         return
 
     # 값 읽기
-    values = data_read()
+    values = data_read(run_buffer.zones if run_buffer is not None else None)
     timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 
     row = [timestamp] + values
 
+    if run_buffer is not None:
+        run_buffer.append(timestamp, values)
+
     # CSV append
     try:
         log_writer.writerow(row)
         log_file.flush()
-        logger.debug(f"로그 1줄 추가됨 → {row}")
+        logger.debug("로그 1줄 추가됨 → %s", row)
     except Exception as e:
         logger.exception(f"append_temperature_log 중 예외 발생: {e}")
 
 def job_info_read():
     # 1) Job 정보 읽기
-    job_info = plc_connector.read_word(
+    job_info = get_plc_connector().read_word(
         mem_area=0xAF,
         word_addr=500,
         word_count=2
@@ -0,0 +1,226 @@
+# src/utils/tuning_cache.py
+import csv
+import hashlib
+import io
+import json
+import os
+import sqlite3
+import threading
+from collections import OrderedDict
+from datetime import datetime
+from pathlib import Path
+
+from src.config.settings import TUNING_SETTINGS
+from src.utils.data_processor_tuning import tuning_summary, TUNING_ALGORITHM_VERSION
+from src.utils.logger_config import setup_logger
+
+logger = setup_logger('tuning_cache')
+
+# put_summary로 저장해서 아직 내용 해시를 계산하지 않은 항목
+UNHASHED = ""
+
+
+def _parse_csv_bytes(data: bytes):
+    return list(csv.reader(io.StringIO(data.decode("utf-8"), newline="")))
+
+
+def _copy_result(result):
+    # 캐시에 보관된 리스트를 호출자가 수정하지 못하도록 복사본 반환
+    return {k: list(v) if isinstance(v, list) else v for k, v in result.items()}
+
+
+class TuningResultCache:
+    """
+    run(CSV 파일)별 튜닝 결과 캐시
+    - key: run 식별자(파일명) + 내용 해시 + 튜닝 알고리즘 버전 + zone 수
+    - 저장값: P1, Initial P2, P2, retain point, zone별 PTC max
+    - 파일 내용이나 TUNING_ALGORITHM_VERSION이 바뀌면 자동으로 다시 계산
+    - 메모리 LRU + sqlite 영구 저장 2단 구성
+    """
+    def __init__(self, db_path=None, max_memory_entries=None):
+        self.db_path = Path(db_path or TUNING_SETTINGS['CACHE_FILE'])
+        self.max_memory_entries = max_memory_entries or TUNING_SETTINGS['CACHE_MEMORY_ENTRIES']
+        self._memory = OrderedDict()
+        self._lock = threading.Lock()
+        self._conn = None
+
+    # ----------------- 저장소 -----------------
+    def _connection(self):
+        if self._conn is None:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False, timeout=30)
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS tuning_results ("
+                " run_id TEXT PRIMARY KEY,"
+                " content_hash TEXT NOT NULL,"
+                " algo_version INTEGER NOT NULL,"
+                " zones INTEGER NOT NULL,"
+                " size INTEGER NOT NULL,"
+                " mtime_ns INTEGER NOT NULL,"
+                " result TEXT NOT NULL,"
+                " created TEXT NOT NULL)"
+            )
+            self._conn.commit()
+        return self._conn
+
+    def _remember(self, run_id, entry):
+        self._memory[run_id] = entry
+        self._memory.move_to_end(run_id)
+        while len(self._memory) > self.max_memory_entries:
+            self._memory.popitem(last=False)
+
+    def _load_entry(self, run_id):
+        entry = self._memory.get(run_id)
+        if entry is not None:
+            self._memory.move_to_end(run_id)
+            return entry
+
+        row = self._connection().execute(
+            "SELECT content_hash, algo_version, zones, size, mtime_ns, result"
+            " FROM tuning_results WHERE run_id = ?",
+            (run_id,)
+        ).fetchone()
+        if row is None:
+            return None
+
+        entry = {
+            "content_hash": row[0],
+            "algo_version": row[1],
+            "zones": row[2],
+            "size": row[3],
+            "mtime_ns": row[4],
+            "result": json.loads(row[5]),
+        }
+        self._remember(run_id, entry)
+        return entry
+
+    def _store_entry(self, run_id, entry):
+        self._remember(run_id, entry)
+        conn = self._connection()
+        conn.execute(
+            "INSERT OR REPLACE INTO tuning_results"
+            " (run_id, content_hash, algo_version, zones, size, mtime_ns, result, created)"
+            " VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                run_id, entry["content_hash"], entry["algo_version"], entry["zones"],
+                entry["size"], entry["mtime_ns"], json.dumps(entry["result"]),
+                datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            )
+        )
+        conn.commit()
+
+    # ----------------- 외부 API -----------------
+    def get_summary(self, path, rows=None, zone_count=None):
+        """
+        path의 튜닝 결과 반환 (tuning_summary와 같은 dict)
+        rows가 주어지면 계산이 필요할 때 파일을 다시 파싱하지 않고 rows를 사용
+        zone_count가 None이면 헤더에서 자동 검출 (캐시 key에는 0으로 저장)
+        """
+        path = Path(path)
+        run_id = path.name
+        zones_key = zone_count or 0
+
+        with self._lock:
+            try:
+                stat = path.stat()
+            except OSError:
+                stat = None
+
+            if stat is None:
+                # 파일이 없으면 캐시 없이 계산만
+                logger.warning(f"tuning cache: 파일 없음, 캐시 미사용: {path}")
+                return tuning_summary(rows or [], zone_count)
+
+            entry = self._load_entry(run_id)
+            valid = (
+                entry is not None
+                and entry["algo_version"] == TUNING_ALGORITHM_VERSION
+                and entry["zones"] == zones_key
+            )
+
+            # 1) 크기/수정시각이 같으면 해시 계산 없이 바로 사용
+            if valid and entry["size"] == stat.st_size and entry["mtime_ns"] == stat.st_mtime_ns:
+                logger.debug(f"tuning cache hit: {run_id}")
+                return _copy_result(entry["result"])
+
+            # 2) 내용 해시 비교 (put_summary로 저장된 항목은 해시가 없으므로 다시 계산)
+            data = path.read_bytes()
+            content_hash = hashlib.sha1(data).hexdigest()
+            if valid and entry["content_hash"] != UNHASHED and entry["content_hash"] == content_hash:
+                entry["size"] = stat.st_size
+                entry["mtime_ns"] = stat.st_mtime_ns
+                self._store_entry(run_id, entry)
+                logger.debug(f"tuning cache hit (hash): {run_id}")
+                return _copy_result(entry["result"])
+
+            # 3) 새로 계산
+            if rows is None:
+                rows = _parse_csv_bytes(data)
+            result = tuning_summary(rows, zone_count)
+
+            self._store_entry(run_id, {
+                "content_hash": content_hash,
+                "algo_version": TUNING_ALGORITHM_VERSION,
+                "zones": zones_key,
+                "size": stat.st_size,
+                "mtime_ns": stat.st_mtime_ns,
+                "result": result,
+            })
+            logger.info(f"tuning cache 저장: {run_id}")
+            return _copy_result(result)
+
+    def put_summary(self, path, summary, zone_count=None):
+        """
+        이미 계산된 결과(예: OnlineTuningState)를 path의 현재 크기 / 수정시각 기준으로 저장
+        - 방금 쓴 CSV를 다시 읽지 않도록 내용 해시는 비워 둠 (UNHASHED)
+          → 크기 / 수정시각이 같으면 그대로 사용, 다르면 get_summary에서 해시 계산 후 다시 저장
+        """
+        path = Path(path)
+        with self._lock:
+            try:
+                stat = path.stat()
+            except OSError as e:
+                logger.warning(f"tuning cache: 저장 실패, 파일 정보 오류: {path}, {e}")
+                return
+
+            self._store_entry(path.name, {
+                "content_hash": UNHASHED,
+                "algo_version": TUNING_ALGORITHM_VERSION,
+                "zones": zone_count or 0,
+                "size": stat.st_size,
+                "mtime_ns": stat.st_mtime_ns,
+                "result": _copy_result(summary),
+            })
+
+    def invalidate(self, run_id=None):
+        """run_id 하나 또는 전체(None) 캐시 삭제"""
+        with self._lock:
+            conn = self._connection()
+            if run_id is None:
+                self._memory.clear()
+                conn.execute("DELETE FROM tuning_results")
+            else:
+                self._memory.pop(run_id, None)
+                conn.execute("DELETE FROM tuning_results WHERE run_id = ?", (run_id,))
+            conn.commit()
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+_default_cache = None
+
+
+def get_tuning_cache() -> TuningResultCache:
+    global _default_cache
+    if _default_cache is None:
+        _default_cache = TuningResultCache(os.path.join(os.getcwd(), TUNING_SETTINGS['CACHE_FILE']))
+    return _default_cache
+
+
+def cached_tuning_summary(path, rows=None, zone_count=None):
+    """기본 캐시를 사용하는 tuning_summary"""
+    return get_tuning_cache().get_summary(path, rows, zone_count)
@@ -0,0 +1,367 @@
+# src/utils/tuning_engine.py
+import re
+from itertools import chain
+
+import numpy as np
+from src.config.settings import TEMPERATURE_TAG_SETTINGS
+from src.utils.logger_config import setup_logger
+
+logger = setup_logger('tuning_engine')
+
+SIGNALS = ("PTC", "CTC", "SP", "MV")
+TUNING_SIGNALS = ("PTC", "CTC", "SP")
+
+# 튜닝 규칙 기본값 (tuning_sweep에서 바꿔가며 시뮬레이션)
+P1_DEADBAND = 1             # PTC max - SP 가 이 값 이하이면 P1 = 0
+INIT_P2_OFFSET = 3          # Initial P2 = SP - CTC + offset
+RETAIN_PLATEAU = 100        # SP1이 이 샘플 수만큼 유지되면 retain point
+RETAIN_AVERAGE_WINDOW = 60  # retain point 이후 PTC 평균 샘플 수
+PTC_MAX_WINDOW = 3          # PTC max 이동평균 샘플 수
+
+_SP_COLUMN = re.compile(r"^SP\d+$")
+
+
+def _to_float(value, default=0.0):
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return default
+
+
+class RunMatrix:
+    """
+    run 1개를 signal별 (n_samples x zones) float 배열로 보관
+    - CSV rows는 parse_run()으로 1회만 파싱
+    - RunBuffer는 복사/파싱 없이 그대로 감쌈
+    - missing: CSV 헤더에 없는 signal 이름 (해당 배열은 0행, 튜닝 결과는 기존 *_scrap과 동일)
+    """
+    def __init__(self, ptc, ctc, sp, mv=None, missing=(), rows=0):
+        self.ptc = ptc
+        self.ctc = ctc
+        self.sp = sp
+        self.mv = mv
+        self.missing = tuple(missing)
+        self.rows = rows   # CSV 데이터 행 수 (signal이 모두 없어도 샘플 수 유지)
+
+    @classmethod
+    def from_buffer(cls, run_buffer):
+        return cls(
+            run_buffer.series("PTC"),
+            run_buffer.series("CTC"),
+            run_buffer.series("SP"),
+            run_buffer.series("MV").astype(np.float64),
+        )
+
+    @property
+    def n_samples(self):
+        return max([self.rows] + [len(m) for m in (self.ptc, self.ctc, self.sp, self.mv) if m is not None])
+
+    @property
+    def zones(self):
+        return next(m.shape[1] for m in (self.ptc, self.ctc, self.sp, self.mv) if m is not None)
+
+
+def detect_heater_zones(headers) -> int:
+    """
+    CSV 헤더에서 heater zone 수 계산
+    - 현재 형식: SP1 ~ SPn 컬럼 수
+    - 이전 형식: 'ZONEn (SP)' 컬럼 수
+    """
+    count = 0
+    for h in headers:
+        h = str(h).strip()
+        if _SP_COLUMN.match(h) or (h.startswith("ZONE") and h.endswith("(SP)")):
+            count += 1
+    return count
+
+
+def run_zone_count(rows, zones=None) -> int:
+    """
+    run의 zone 수
+    - zones가 주어지면 그대로 사용
+    - RunBuffer / RunMatrix: 배열 폭, CSV rows: 헤더의 SP 컬럼 수
+    - 알 수 없으면 설정값(TEMPERATURE_TAG_SETTINGS['ZONE_COUNT'])
+    """
+    if zones:
+        return zones
+    if isinstance(rows, RunMatrix):
+        return rows.zones
+    if hasattr(rows, "zones"):
+        return rows.zones
+    if rows:
+        detected = detect_heater_zones(rows[0])
+        if detected:
+            return detected
+    return TEMPERATURE_TAG_SETTINGS['ZONE_COUNT']
+
+
+def _slow_matrix(body, anchor, zones, fill=0.0):
+    # 행 길이가 다르거나 숫자가 아닌 값이 섞여 있는 경우: 셀 단위 변환 (없는 값/오류는 fill)
+    matrix = np.full((len(body), zones), fill)
+    for i, row in enumerate(body):
+        for z in range(zones):
+            idx = anchor + z
+            if len(row) > idx:
+                matrix[i, z] = _to_float(row[idx], fill)
+    return matrix
+
+
+def _parse_signals(header, body, signals, zones, fill=0.0):
+    """
+    헤더에서 '{signal}1' 위치를 찾아 그 뒤 zones개 컬럼을 (n x zones) 배열로 변환
+    - 필요한 signal 컬럼 범위 전체를 한 번에 float 변환
+    - 결과는 기존 *_scrap 함수와 동일 (모자란 컬럼 / 숫자가 아닌 값은 fill, 기본 0.0)
+    - 헤더에 없는 signal(예: 이전 형식 'ZONEn (SP)' 로그)은 (0 x zones) 배열 (기존 *_scrap의 빈 리스트)
+    """
+    result = {}
+    anchors = {}
+    for name in signals:
+        try:
+            anchors[name] = header.index(f"{name}1")
+        except ValueError:
+            logger.error(f"헤더에 '{name}1' 컬럼을 찾을 수 없습니다.")
+            result[name] = np.zeros((0, zones))
+
+    if not anchors:
+        return result
+
+    lo = min(anchors.values())
+    hi = max(anchors.values()) + zones
+    if all(len(row) >= hi for row in body):
+        try:
+            block = np.fromiter(
+                map(float, chain.from_iterable(row[lo:hi] for row in body)),
+                dtype=np.float64,
+                count=len(body) * (hi - lo),
+            ).reshape(len(body), hi - lo)
+            for name, anchor in anchors.items():
+                result[name] = block[:, anchor - lo:anchor - lo + zones]
+            return result
+        except (TypeError, ValueError):
+            pass
+
+    for name, anchor in anchors.items():
+        result[name] = _slow_matrix(body, anchor, zones, fill)
+    return result
+
+
+def parse_run(rows, zones=None, signals=SIGNALS, fill=0.0) -> RunMatrix:
+    """
+    CSV rows(0번: 헤더) 또는 RunBuffer → RunMatrix
+    zones가 None이면 헤더에서 zone 수 자동 검출
+    signals에 없는 signal은 파싱하지 않음 (None)
+    fill: 모자란 컬럼 / 숫자가 아닌 값 (튜닝: 0.0 = 기존 *_scrap, 그래프: NaN → 선이 끊김)
+    """
+    if isinstance(rows, RunMatrix):
+        return rows
+    if hasattr(rows, "series"):
+        return RunMatrix.from_buffer(rows)
+
+    zones = run_zone_count(rows, zones)
+    if not rows:
+        return RunMatrix(**{name.lower(): np.zeros((0, zones)) for name in SIGNALS})
+
+    header = list(rows[0])
+    parsed = _parse_signals(header, rows[1:], signals, zones, fill)
+    missing = [name for name in signals if f"{name}1" not in header]
+    return RunMatrix(**{name.lower(): parsed.get(name) for name in SIGNALS}, missing=missing, rows=len(rows) - 1)
+
+
+def plateau_counter(values):
+    """
+    search_temp_retain_point의 counter 값을 샘플마다 한 번에 계산
+    - 지금까지의 최대값(초기 0.0)보다 커지면 counter = 0
+    - 최대값과 같으면 counter += 1
+    """
+    values = np.asarray(values, dtype=np.float64)
+    n = len(values)
+    if n == 0:
+        return np.zeros(0, dtype=np.int64)
+
+    # i번째 샘플 처리 직전의 buffer 값 (NaN은 무시 → fmax)
+    prev_buffer = np.fmax.accumulate(np.concatenate(([0.0], values)))[:-1]
+    reset = values > prev_buffer
+    counts = np.cumsum(values == prev_buffer)
+
+    last_reset = np.maximum.accumulate(np.where(reset, np.arange(n), -1))
+    base = np.where(last_reset >= 0, counts[np.maximum(last_reset, 0)], 0)
+    return counts - base
+
+
+def find_retain_point(values, plateau=RETAIN_PLATEAU):
+    """SP plateau가 plateau 샘플 유지된 마지막 지점의 시작 index (없으면 0)"""
+    hits = np.nonzero(plateau_counter(values) == plateau)[0]
+    return int(hits[-1]) - plateau if len(hits) else 0
+
+
+def _rows_at(matrix, index, zones):
+    if 0 <= index < len(matrix):
+        return matrix[index]
+    return np.zeros(zones)
+
+
+def _window_average(matrix, start, end, zones):
+    # 기존 sum(list) / n 과 같은 순서(앞에서부터 누적)로 더함
+    start = max(start, 0)
+    end = min(end, len(matrix))
+    if end > start:
+        return np.cumsum(matrix[start:end], axis=0)[-1] / (end - start)
+    return np.zeros(zones)
+
+
+def moving_average(matrix, window):
+    """
+    샘플 축 이동평균 ((n - window + 1) x zones)
+    앞에서부터 순서대로 더해서 기존 (a + b + c) / 3 계산과 결과 동일
+    """
+    count = len(matrix) - window + 1
+    acc = matrix[0:count].copy()
+    for k in range(1, window):
+        acc += matrix[k:k + count]
+    return acc / window
+
+
+def analyse_run(rows, zone_count=None):
+    """
+    run 1회 파싱 + retain point 1회 탐색으로 tuning_summary 결과 전체 계산
+    zone_count가 None이면 run에서 zone 수 자동 검출
+    return: {"p1", "init_p2", "p2", "retain_point", "ptc_max"}
+    """
+    run = parse_run(rows, zone_count, TUNING_SIGNALS)
+    ptc, ctc, sp = run.ptc, run.ctc, run.sp
+    zone_count = run.zones
+
+    # zone별 PTC 3샘플 이동평균의 최대값
+    if len(ptc) >= PTC_MAX_WINDOW:
+        ptc_max = moving_average(ptc, PTC_MAX_WINDOW).max(axis=0)
+    else:
+        ptc_max = np.zeros(zone_count)
+
+    retain_point = find_retain_point(sp[:, 0]) if len(sp) else 0
+
+    sp_at = _rows_at(sp, retain_point, zone_count)
+    ctc_at = _rows_at(ctc, retain_point, zone_count)
+    rtn_ptc = _window_average(ptc, retain_point + 1, retain_point + 1 + RETAIN_AVERAGE_WINDOW, zone_count)
+
+    return _summary(ptc_max, sp_at, ctc_at, rtn_ptc, retain_point)
+
+
+def _summary(ptc_max, sp_at, ctc_at, rtn_ptc, retain_point):
+    delta = ptc_max - sp_at
+    adjust_p1 = np.where(delta <= P1_DEADBAND, 0, np.trunc(delta)).astype(np.int64).tolist()
+    initial_p2 = np.trunc(sp_at - ctc_at + INIT_P2_OFFSET).astype(np.int64).tolist()
+    adjust_p2 = np.trunc(rtn_ptc - sp_at).astype(np.int64).tolist()
+
+    return {
+        "p1": adjust_p1,
+        "init_p2": initial_p2,
+        "p2": adjust_p2,
+        "retain_point": retain_point,
+        "ptc_max": np.asarray(ptc_max).tolist(),
+    }
+
+
+class OnlineTuningState:
+    """
+    샘플이 들어올 때마다 튜닝 상태를 갱신 (샘플당 O(1))
+    - zone별 PTC 3샘플 이동평균 최대값
+    - SP1 plateau counter (search_temp_retain_point와 동일 규칙)
+    - retain point 시점의 CTC / SP, 이후 60샘플 PTC 평균
+    summary()는 같은 데이터에 대한 analyse_run 결과와 동일
+    """
+    PLATEAU = RETAIN_PLATEAU
+    AVERAGE_WINDOW = RETAIN_AVERAGE_WINDOW
+
+    def __init__(self, zones):
+        self.zones = zones
+        self.n_samples = 0
+
+        # 최근 PLATEAU+1 샘플 보관 (retain point = 현재 - PLATEAU)
+        size = self.PLATEAU + 1
+        self._ring_ptc = np.zeros((size, zones))
+        self._ring_ctc = np.zeros((size, zones))
+        self._ring_sp = np.zeros((size, zones))
+
+        self._ptc_max = np.full(zones, -np.inf)
+
+        self._sp_buffer = 0.0
+        self._counter = 0
+        self.retain_point = 0
+        self._detected = None  # (sp_at, ctc_at, rtn_ptc)
+
+        # retain point를 아직 못 찾은 경우(기본값 0) 대비
+        self._first_sp = None
+        self._first_ctc = None
+        self._default_sum = np.zeros(zones)
+        self._default_count = 0
+
+    def update(self, ptc, ctc, sp, mv=None):
+        i = self.n_samples
+        size = len(self._ring_ptc)
+        slot = i % size
+        self._ring_ptc[slot] = ptc
+        self._ring_ctc[slot] = ctc
+        self._ring_sp[slot] = sp
+        self.n_samples += 1
+
+        # 1) PTC 3샘플 이동평균 최대값
+        if i >= 2:
+            avg = (self._ring_ptc[(i - 2) % size] + self._ring_ptc[(i - 1) % size] + self._ring_ptc[slot]) / 3
+            self._ptc_max = np.maximum(self._ptc_max, avg)
+
+        # 2) retain point 기본값(0) 기준 스냅샷 / 평균
+        if i == 0:
+            self._first_sp = self._ring_sp[slot].copy()
+            self._first_ctc = self._ring_ctc[slot].copy()
+        elif i <= self.AVERAGE_WINDOW:
+            self._default_sum = self._default_sum + self._ring_ptc[slot]
+            self._default_count += 1
+
+        # 3) SP1 plateau counter
+        val = float(sp[0])
+        if self._sp_buffer < val:
+            self._sp_buffer = val
+            self._counter = 0
+        elif self._sp_buffer == val:
+            self._counter += 1
+
+        if self._counter == self.PLATEAU:
+            self._on_retain_point(i - self.PLATEAU)
+
+    def _ring_row(self, ring, index):
+        return ring[index % len(ring)]
+
+    def _on_retain_point(self, retain_point):
+        self.retain_point = retain_point
+
+        if retain_point >= 0:
+            sp_at = self._ring_row(self._ring_sp, retain_point).copy()
+            ctc_at = self._ring_row(self._ring_ctc, retain_point).copy()
+        else:
+            sp_at = np.zeros(self.zones)
+            ctc_at = np.zeros(self.zones)
+
+        start = max(retain_point + 1, 0)
+        end = min(retain_point + 1 + self.AVERAGE_WINDOW, self.n_samples)
+        if end > start:
+            window = np.array([self._ring_row(self._ring_ptc, j) for j in range(start, end)])
+            rtn_ptc = np.cumsum(window, axis=0)[-1] / (end - start)
+        else:
+            rtn_ptc = np.zeros(self.zones)
+
+        self._detected = (sp_at, ctc_at, rtn_ptc)
+        logger.debug(f"online retain point: {retain_point}")
+
+    def summary(self):
+        """현재까지 들어온 샘플 기준 튜닝 결과 (analyse_run과 같은 dict)"""
+        ptc_max = self._ptc_max if self.n_samples >= 3 else np.zeros(self.zones)
+
+        if self._detected is not None:
+            sp_at, ctc_at, rtn_ptc = self._detected
+        else:
+            zeros = np.zeros(self.zones)
+            sp_at = self._first_sp if self._first_sp is not None else zeros
+            ctc_at = self._first_ctc if self._first_ctc is not None else zeros
+            rtn_ptc = self._default_sum / self._default_count if self._default_count else zeros
+
+        return _summary(ptc_max, sp_at, ctc_at, rtn_ptc, self.retain_point)
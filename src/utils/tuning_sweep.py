@@ -0,0 +1,217 @@
+# src/utils/tuning_sweep.py
+import itertools
+
+import numpy as np
+
+from src.utils.logger_config import setup_logger
+from src.utils.tuning_engine import (
+    parse_run, plateau_counter, analyse_run, TUNING_SIGNALS,
+    P1_DEADBAND, INIT_P2_OFFSET, RETAIN_PLATEAU, RETAIN_AVERAGE_WINDOW, PTC_MAX_WINDOW,
+)
+
+logger = setup_logger('tuning_sweep')
+
+# 파라미터 이름 → 기본값 (결과 배열의 축 순서와 무관, 조합 표에서 이 순서로 표시)
+PARAMETERS = {
+    "deadband": P1_DEADBAND,
+    "p2_offset": INIT_P2_OFFSET,
+    "plateau": RETAIN_PLATEAU,
+    "avg_window": RETAIN_AVERAGE_WINDOW,
+    "max_window": PTC_MAX_WINDOW,
+}
+
+
+def _as_grid(values, default):
+    if values is None:
+        values = [default]
+    return np.atleast_1d(np.asarray(values))
+
+
+def _ptc_max_grid(ptc, windows, zones):
+    """
+    (n_window x zones): window별 PTC 이동평균 최대값
+    window 크기를 1씩 늘려가며 누적 → 모든 window를 샘플 축 배열 연산으로 계산
+    (앞에서부터 더하므로 기본 window=3 결과는 analyse_run과 동일)
+    """
+    n = len(ptc)
+    result = np.zeros((len(windows), zones))
+    if n == 0:
+        return result
+
+    max_w = int(windows.max())
+    acc = ptc.copy()
+    sums = {}
+    for w in range(1, min(max_w, n) + 1):
+        if w > 1:
+            acc = acc[:-1] + ptc[w - 1:]
+        sums[w] = acc
+
+    for i, w in enumerate(windows):
+        w = int(w)
+        if w in sums and n >= w:
+            result[i] = (sums[w] / w).max(axis=0)
+    return result
+
+
+def _retain_points(sp1, plateaus):
+    """(n_plateau,): plateau 길이별 retain point (없으면 0)"""
+    counter = plateau_counter(sp1)
+    if len(counter) == 0:
+        return np.zeros(len(plateaus), dtype=np.int64)
+    hits = counter[None, :] == plateaus[:, None]
+    last = np.where(hits, np.arange(len(counter))[None, :], -1).max(axis=1)
+    return np.where(last >= 0, last - plateaus, 0)
+
+
+def _rows_at(matrix, indices, zones):
+    """(len(indices) x zones): index가 범위 밖이면 0.0"""
+    valid = (indices >= 0) & (indices < len(matrix))
+    if len(matrix) == 0:
+        return np.zeros((len(indices), zones))
+    rows = matrix[np.clip(indices, 0, len(matrix) - 1)]
+    return np.where(valid[:, None], rows, 0.0)
+
+
+def _window_averages(ptc, retain_points, windows, zones):
+    """
+    (n_plateau x n_avg_window x zones): retain point 다음 샘플부터 window개 PTC 평균
+    retain point별로 최대 window 길이만큼 모아 앞에서부터 누적합 (기존 sum()과 같은 순서)
+    """
+    n = len(ptc)
+    result = np.zeros((len(retain_points), len(windows), zones))
+    if n == 0:
+        return result
+
+    max_w = int(windows.max())
+    starts = np.maximum(retain_points + 1, 0)
+    idx = starts[:, None] + np.arange(max_w)[None, :]
+    gathered = np.where((idx < n)[:, :, None], ptc[np.clip(idx, 0, n - 1)], 0.0)
+    prefix = np.cumsum(gathered, axis=1)
+
+    counts = np.minimum(windows[None, :], np.maximum(n - starts, 0)[:, None])
+    has_data = counts > 0
+    picked = np.take_along_axis(prefix, np.maximum(counts - 1, 0)[:, :, None], axis=1)
+    result = np.where(has_data[:, :, None], picked / np.maximum(counts, 1)[:, :, None], 0.0)
+    return result
+
+
+def sweep_run(rows, zone_count=None, deadband=None, p2_offset=None, plateau=None, avg_window=None, max_window=None):
+    """
+    run 1개에 대해 파라미터 조합 전체의 P1 / Initial P2 / P2 계산 (배열 broadcast)
+    각 파라미터는 값 리스트 (None이면 기본값 1개)
+    zone_count가 None이면 run에서 자동 검출
+
+    return: {
+        "grid": {파라미터: 값 배열},
+        "p1": (deadband x max_window x plateau x zones),
+        "init_p2": (p2_offset x plateau x zones),
+        "p2": (plateau x avg_window x zones),
+        "retain_point": (plateau,),
+    }
+    """
+    grid = {
+        "deadband": _as_grid(deadband, P1_DEADBAND).astype(np.float64),
+        "p2_offset": _as_grid(p2_offset, INIT_P2_OFFSET).astype(np.float64),
+        "plateau": _as_grid(plateau, RETAIN_PLATEAU).astype(np.int64),
+        "avg_window": _as_grid(avg_window, RETAIN_AVERAGE_WINDOW).astype(np.int64),
+        "max_window": _as_grid(max_window, PTC_MAX_WINDOW).astype(np.int64),
+    }
+
+    run = parse_run(rows, zone_count, TUNING_SIGNALS)
+    ptc, ctc, sp = run.ptc, run.ctc, run.sp
+    zone_count = run.zones
+
+    ptc_max = _ptc_max_grid(ptc, grid["max_window"], zone_count)                  # (W, Z)
+    retain = _retain_points(sp[:, 0] if len(sp) else np.zeros(0), grid["plateau"])  # (L,)
+    sp_at = _rows_at(sp, retain, zone_count)                                      # (L, Z)
+    ctc_at = _rows_at(ctc, retain, zone_count)                                    # (L, Z)
+    rtn_ptc = _window_averages(ptc, retain, grid["avg_window"], zone_count)      # (L, A, Z)
+
+    delta = ptc_max[:, None, :] - sp_at[None, :, :]                               # (W, L, Z)
+    p1 = np.where(delta[None] <= grid["deadband"][:, None, None, None], 0, np.trunc(delta)[None])
+    init_p2 = np.trunc((sp_at - ctc_at)[None] + grid["p2_offset"][:, None, None])
+    p2 = np.trunc(rtn_ptc - sp_at[:, None, :])
+
+    return {
+        "grid": grid,
+        "p1": p1.astype(np.int64),
+        "init_p2": init_p2.astype(np.int64),
+        "p2": p2.astype(np.int64),
+        "retain_point": retain,
+    }
+
+
+def _expand(values, axes):
+    """
+    values: (runs, *axes에 해당하는 축, zones) → (runs, D, O, L, A, W, zones) broadcast view
+    axes: values의 파라미터 축 이름 순서
+    """
+    order = list(PARAMETERS)
+    shape = [values.shape[0]] + [1] * len(order) + [values.shape[-1]]
+    for i, name in enumerate(axes):
+        shape[1 + order.index(name)] = values.shape[1 + i]
+    # 축 순서를 PARAMETERS 순서로 재배치
+    src = [1 + axes.index(name) for name in order if name in axes]
+    moved = np.moveaxis(values, src, sorted(src)) if src else values
+    return moved.reshape(shape)
+
+
+def sweep_runs(runs, zone_count=None, **grid):
+    """
+    여러 run에 대한 파라미터 sweep + 현재 규칙(기본값) 대비 변화 요약
+
+    runs: CSV rows / RunBuffer / RunMatrix 리스트 (zone 수가 같아야 함, zone_count=None이면 run별 자동 검출)
+    grid: sweep_run과 같은 파라미터 값 리스트
+    return: 조합별 요약 dict 리스트
+        {파라미터 값..., "p1_changed", "init_p2_changed", "p2_changed" (변경된 zone 비율),
+         "p1_mean_delta", "init_p2_mean_delta", "p2_mean_delta" (평균 변화량)}
+    """
+    p1_all, init_all, p2_all = [], [], []
+    base_p1, base_init, base_p2 = [], [], []
+    grid_values = None
+
+    for rows in runs:
+        run = parse_run(rows, zone_count, TUNING_SIGNALS)
+        if p1_all and run.zones != p1_all[0].shape[-1]:
+            logger.warning(f"tuning sweep: zone 수가 다른 run 제외 ({run.zones} != {p1_all[0].shape[-1]})")
+            continue
+        result = sweep_run(run, **grid)
+        baseline = analyse_run(run)
+
+        grid_values = result["grid"]
+        p1_all.append(result["p1"])
+        init_all.append(result["init_p2"])
+        p2_all.append(result["p2"])
+        base_p1.append(baseline["p1"])
+        base_init.append(baseline["init_p2"])
+        base_p2.append(baseline["p2"])
+
+    if grid_values is None:
+        return []
+
+    # (runs, ...축, zones)
+    p1 = _expand(np.stack(p1_all), ["deadband", "max_window", "plateau"])
+    init_p2 = _expand(np.stack(init_all), ["p2_offset", "plateau"])
+    p2 = _expand(np.stack(p2_all), ["plateau", "avg_window"])
+
+    def baseline_view(values):
+        arr = np.asarray(values)
+        return arr.reshape(arr.shape[0], *([1] * len(PARAMETERS)), arr.shape[1])
+
+    stats = {}
+    for name, values, base in (("p1", p1, base_p1), ("init_p2", init_p2, base_init), ("p2", p2, base_p2)):
+        diff = values - baseline_view(base)
+        # run, zone 축 평균 → 파라미터 축만 남김
+        stats[f"{name}_changed"] = (diff != 0).mean(axis=(0, -1))
+        stats[f"{name}_mean_delta"] = diff.mean(axis=(0, -1))
+
+    shape = tuple(len(grid_values[name]) for name in PARAMETERS)
+    table = []
+    for index in itertools.product(*(range(n) for n in shape)):
+        row = {name: grid_values[name][i].item() for name, i in zip(PARAMETERS, index)}
+        for key, arr in stats.items():
+            row[key] = float(np.broadcast_to(arr, shape)[index])
+        table.append(row)
+
+    logger.info(f"tuning sweep 완료: run {len(p1_all)}개, 조합 {len(table)}개")
+    return table
@@ -0,0 +1,203 @@
+# tests/benchmark_tuning.py
+"""
+튜닝 / 로그 로딩 경로 벤치마크
+
+사용 예:
+    python -m tests.benchmark_tuning                       # 기본 케이스, benchmark_results.json 저장
+    python -m tests.benchmark_tuning --quick               # 240 / 1000행만
+    python -m tests.benchmark_tuning --compare old.json    # 이전 결과 대비 비율 표시
+
+- 실제 로그와 비슷한 모양(승온 ramp → SP plateau, PTC overshoot/노이즈)의 run을 합성
+- run 길이 240 ~ 100k행, zone 8 ~ 32개
+- 측정 대상: _read_csv_rows, *_scrap, p_calculation, RunSeries.from_rows (그래프 series 캐시)
+- 결과는 JSON으로 저장해서 버전 간 비교
+"""
+import argparse
+import csv
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+
+LENGTHS = [240, 1000, 10000, 100000]
+ZONES = [8, 16, 32]
+# 기본 실행에서는 (행 수 x zone 수)가 이 값을 넘는 케이스 생략 (--full 로 전체 실행)
+DEFAULT_MAX_CELLS = 1_600_000
+
+
+def make_run(n_rows, zones, seed=0):
+    """
+    합성 run rows (0번: 헤더) 생성
+    SP는 계단식으로 올라 목표 온도에서 유지, PTC는 1차 지연 + overshoot + 노이즈로 추종
+    """
+    rng = np.random.default_rng(seed)
+    ramp_len = max(n_rows // 3, 3)
+    target = 900.0 + rng.uniform(-20, 20, zones)
+
+    t = np.arange(n_rows)[:, None]
+    steps = np.minimum(t // max(ramp_len // 10, 1), 10) / 10.0
+    sp = np.round(25.0 + (target - 25.0) * steps, 1)
+
+    ptc = np.empty((n_rows, zones))
+    level = np.full(zones, 25.0)
+    for i in range(n_rows):
+        level += (sp[i] - level) * 0.08
+        ptc[i] = level
+    overshoot = 4.0 * np.exp(-((t - ramp_len) / (ramp_len * 0.1 + 1)) ** 2)
+    ptc = np.round(ptc + overshoot + rng.normal(0, 0.3, (n_rows, zones)), 1)
+    ctc = np.round(ptc + rng.uniform(-25, 25, zones), 1)
+    mv = rng.integers(0, 100, (n_rows, zones))
+
+    header = ["time", "tube", "job"]
+    for name in ("PTC", "CTC", "SP", "MV"):
+        header += [f"{name}{z + 1}" for z in range(zones)]
+
+    rows = [header]
+    for i in range(n_rows):
+        rows.append(
+            ["2025-11-14 08:15:00", "1", "6588"]
+            + [str(v) for v in ptc[i].tolist()]
+            + [str(v) for v in ctc[i].tolist()]
+            + [str(v) for v in sp[i].tolist()]
+            + [str(v) for v in mv[i].tolist()]
+        )
+    return rows
+
+
+def write_csv(rows, path):
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        csv.writer(f).writerows(rows)
+
+
+def measure(func, repeat, budget=1.0):
+    """func 실행 시간(초) 목록. 첫 실행이 budget보다 길면 1회만"""
+    times = []
+    for i in range(repeat):
+        t0 = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - t0)
+        if i == 0 and times[0] > budget:
+            break
+    return times
+
+
+def _load_targets():
+    """측정 대상 함수 로드 (없는 모듈은 생략)"""
+    from src.utils import data_processor_tuning as tuning
+    targets = {"tuning": tuning}
+
+    try:
+        from src.utils.temperature_logger import _read_csv_rows
+        targets["read_csv_rows"] = _read_csv_rows
+    except Exception as e:
+        print(f"_read_csv_rows 생략: {e}")
+
+    try:
+        from src.utils.run_series import RunSeries
+        targets["run_series"] = RunSeries.from_rows
+    except Exception as e:
+        print(f"RunSeries 생략: {e}")
+
+    return targets
+
+
+def run_benchmarks(cases, repeat):
+    targets = _load_targets()
+    tuning = targets["tuning"]
+    results = []
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for n_rows, zones in cases:
+            rows = make_run(n_rows, zones, seed=n_rows + zones)
+            path = Path(tmp) / f"bench_{n_rows}_{zones}.csv"
+            write_csv(rows, path)
+
+            benches = []
+            if "read_csv_rows" in targets:
+                benches.append(("_read_csv_rows", lambda: targets["read_csv_rows"](path)))
+            for name in ("set_point_scrap", "ptc_scrap", "ctc_scrap", "mv_scrap"):
+                func = getattr(tuning, name)
+                benches.append((name, lambda f=func: [f(rows, z + 1) for z in range(zones)]))
+            benches.append(("p_calculation", lambda: tuning.p_calculation(rows, zones)))
+            if "run_series" in targets:
+                benches.append(("RunSeries.from_rows", lambda: targets["run_series"](rows)))
+
+            for name, func in benches:
+                times = measure(func, repeat)
+                result = {
+                    "name": name,
+                    "rows": n_rows,
+                    "zones": zones,
+                    "repeat": len(times),
+                    "min": min(times),
+                    "median": statistics.median(times),
+                    "mean": statistics.fmean(times),
+                }
+                results.append(result)
+                print(f"{name:<42} rows={n_rows:>6} zones={zones:>2}  min={result['min'] * 1000:10.2f} ms")
+
+    return results
+
+
+def _git_revision():
+    try:
+        return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], text=True, stderr=subprocess.DEVNULL).strip()
+    except Exception:
+        return None
+
+
+def compare(results, baseline_path):
+    with open(baseline_path, "r", encoding="utf-8") as f:
+        baseline = {(r["name"], r["rows"], r["zones"]): r for r in json.load(f)["results"]}
+
+    print(f"\n비교 기준: {baseline_path} (min 기준, <1 이면 빨라짐)")
+    for r in results:
+        base = baseline.get((r["name"], r["rows"], r["zones"]))
+        if base and base["min"] > 0:
+            print(f"{r['name']:<42} rows={r['rows']:>6} zones={r['zones']:>2}  x{r['min'] / base['min']:.2f}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="튜닝 / 로그 로딩 벤치마크")
+    parser.add_argument("-o", "--output", default="benchmark_results.json")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--quick", action="store_true", help="240 / 1000행, 8 zone만")
+    parser.add_argument("--full", action="store_true", help="100k x 32 zone 포함 전체 케이스")
+    parser.add_argument("--compare", default=None, help="이전 결과 JSON과 비교")
+    args = parser.parse_args(argv)
+
+    if args.quick:
+        cases = [(n, 8) for n in LENGTHS[:2]]
+    else:
+        cases = [(n, z) for n in LENGTHS for z in ZONES if args.full or n * z <= DEFAULT_MAX_CELLS]
+
+    results = run_benchmarks(cases, args.repeat)
+
+    report = {
+        "meta": {
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "git_revision": _git_revision(),
+            "python": sys.version.split()[0],
+            "numpy": np.__version__,
+            "platform": platform.platform(),
+        },
+        "results": results,
+    }
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    print(f"저장 완료: {args.output}")
+
+    if args.compare:
+        compare(results, args.compare)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,86 @@
+# tests/test_comm_stats.py
+"""
+FINS 통신 통계 테스트 (RTT percentile / 카운터 / 요약 문자열)
+
+사용 예:
+    python -m pytest tests
+"""
+import numpy as np
+import pytest
+
+from src.communication.comm_stats import (
+    RTT_BIN_EDGES_MS, CommStats, LatencyStats, format_percentiles, format_summary, rates,
+)
+from src.config.settings import COMM_STATS_SETTINGS
+
+
+def test_percentiles_on_known_rtts():
+    stats = LatencyStats(window=1000)
+    assert stats.percentiles() is None and stats.jitter() == 0.0
+    for ms in range(1, 101):
+        stats.add(float(ms))
+
+    # numpy 기본(linear) 보간: 1 ~ 100 → p50 50.5, p95 95.05, p99 99.01
+    assert stats.percentiles() == pytest.approx([50.5, 95.05, 99.01])
+    assert stats.count == 100 and stats.max == 100.0
+    assert stats.jitter() == pytest.approx(np.std(np.arange(1, 101)))
+    assert sum(stats.histogram) == 100
+
+
+def test_percentile_window_keeps_recent_only():
+    stats = LatencyStats(window=10)
+    for ms in [1000.0] * 5 + [float(v) for v in range(1, 11)]:
+        stats.add(ms)
+
+    # 최근 10개(1 ~ 10)만 percentile, max / count / 히스토그램은 전체 누적
+    assert stats.percentiles((0, 50, 100)) == pytest.approx([1.0, 5.5, 10.0])
+    assert stats.count == 15 and stats.max == 1000.0
+    stats.reset_window()
+    assert stats.percentiles() is None and stats.count == 15
+
+
+def test_histogram_bins():
+    stats = LatencyStats(window=10)
+    stats.add(0.01)                   # underflow 칸
+    stats.add(RTT_BIN_EDGES_MS[10])   # 경계값 → 위쪽 칸 (bisect_right)
+    stats.add(1e6)                    # overflow 칸
+    assert stats.histogram[0] == 1 and stats.histogram[11] == 1 and stats.histogram[-1] == 1
+
+
+def test_counters_and_summary(monkeypatch):
+    monkeypatch.setitem(COMM_STATS_SETTINGS, 'WINDOW', 500)
+    stats = CommStats()
+    for ms in (1.0, 2.0, 3.0, 4.0):
+        stats.record_response("0101", ms, 18, 16, "0000")
+    stats.record_response("0102", 5.0, 30, 14, "0401")
+    stats.record_timeout(18)
+    stats.record_retry()
+    stats.record_timeout(18)
+    stats.record_error()
+
+    snap = stats.snapshot()
+    assert (snap["frames_sent"], snap["frames_received"]) == (7, 5)
+    assert (snap["bytes_sent"], snap["bytes_received"]) == (4 * 18 + 30 + 2 * 18, 4 * 16 + 14)
+    assert (snap["timeouts"], snap["retries"], snap["errors"]) == (2, 1, 1)
+    assert snap["end_codes"] == {"0401": 1}
+    assert set(snap["rtt"]) == {"read", "write"}
+    read = snap["rtt"]["read"]
+    assert read["count"] == 4 and read["max"] == 4.0
+    assert read["percentiles"] == pytest.approx([2.5, 3.85, 3.97])
+
+    assert format_percentiles(read["percentiles"]) == "p50 2.50 / p95 3.85 / p99 3.97 ms"
+    assert format_percentiles(None) == "-"
+    assert format_summary(snap) == (
+        "RTT [read p50 2.50 / p95 3.85 / p99 3.97 ms, write p50 5.00 / p95 5.00 / p99 5.00 ms], "
+        "프레임 7/5, timeout 2, retry 1, 오류 1, end code {'0401': 1}"
+    )
+    assert format_summary(CommStats().snapshot()) == (
+        "RTT [-], 프레임 0/0, timeout 0, retry 0, 오류 0, end code -"
+    )
+
+
+def test_rates():
+    before = {"t": 10.0, "frames_sent": 10, "frames_received": 8, "bytes_sent": 100, "bytes_received": 80}
+    after = {"t": 12.0, "frames_sent": 30, "frames_received": 28, "bytes_sent": 500, "bytes_received": 280}
+    assert rates(before, after) == (10.0, 10.0, 200.0, 100.0)
+    assert rates(after, after) == (0.0, 0.0, 0.0, 0.0)
@@ -0,0 +1,119 @@
+# tests/test_fins_comm.py
+"""
+FINS UDP 클라이언트 테스트 (로컬 UDP 소켓으로 PLC 응답 흉내)
+
+사용 예:
+    python -m pytest tests
+"""
+import socket
+import threading
+import time
+
+import pytest
+
+from src.communication.fins_comm import FinsUDPClient
+from src.config.settings import FRAME_TRACE_SETTINGS
+
+
+class _StalePLC:
+    """명령마다 SID가 다른(늦게 도착한 이전 명령) 응답만 interval 간격으로 계속 보내는 PLC"""
+    def __init__(self, interval=0.05):
+        self.interval = interval
+        self.sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.sock.bind(("127.0.0.1", 0))
+        self.sock.settimeout(0.1)
+        self.port = self.sock.getsockname()[1]
+        self.running = True
+        self.thread = threading.Thread(target=self._serve, daemon=True)
+        self.thread.start()
+
+    def _serve(self):
+        while self.running:
+            try:
+                data, addr = self.sock.recvfrom(4096)
+            except socket.timeout:
+                continue
+            stale = bytearray(data[:10]) + data[10:12] + b"\x00\x00\x00\x00"
+            stale[9] = (data[9] - 1) & 255
+            deadline = time.monotonic() + 3.0
+            while self.running and time.monotonic() < deadline:
+                self.sock.sendto(bytes(stale), addr)
+                time.sleep(self.interval)
+
+    def close(self):
+        self.running = False
+        self.thread.join()
+        self.sock.close()
+
+
+class _OkPLC:
+    """모든 명령에 같은 SID + end code 0000 (읽기는 word 0) 으로 응답하는 PLC"""
+    def __init__(self):
+        self.sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.sock.bind(("127.0.0.1", 0))
+        self.port = self.sock.getsockname()[1]
+        self.commands = []
+        self.thread = threading.Thread(target=self._serve, daemon=True)
+        self.thread.start()
+
+    def _serve(self):
+        while True:
+            try:
+                data, addr = self.sock.recvfrom(4096)
+            except OSError:
+                return
+            self.commands.append(bytes(data[10:]))
+            self.sock.sendto(bytes(data[:12]) + b"\x00\x00\x00\x00", addr)
+
+    def close(self):
+        self.sock.close()
+
+
+@pytest.fixture
+def ok_plc():
+    plc = _OkPLC()
+    yield plc
+    plc.close()
+
+
+@pytest.fixture
+def stale_plc():
+    plc = _StalePLC()
+    yield plc
+    plc.close()
+
+
+def test_stale_responses_do_not_extend_timeout(stale_plc, tmp_path, monkeypatch):
+    monkeypatch.setitem(FRAME_TRACE_SETTINGS, 'DUMP_DIR', str(tmp_path))   # timeout 자동 trace 저장 위치
+    client = FinsUDPClient("127.0.0.1", stale_plc.port)
+    client.sock.settimeout(0.3)
+    client.retries = 1
+    try:
+        t0 = time.perf_counter()
+        assert client.read_word(0, 0x82) is None
+        elapsed = time.perf_counter() - t0
+    finally:
+        sock_timeout = client.sock.gettimeout()
+        client.close()
+
+    # 명령 2번(재전송 1번) x timeout 0.3s → stale 응답이 계속 와도 그 안에 끝남
+    assert 0.55 < elapsed < 1.0
+    assert sock_timeout == 0.3
+    assert client.stats.timeouts == 2 and client.stats.retries == 1
+
+
+def test_bit_and_word_writes_do_not_print(ok_plc, capsys):
+    client = FinsUDPClient("127.0.0.1", ok_plc.port)
+    client.sock.settimeout(1.0)
+    try:
+        for _ in range(3):
+            assert client.write_bit(0xB0, 10, 3, turn_on=True)
+            assert client.write_word(0x82, 100, 7)
+            assert client.write_word_bit(0x82, 100, 2)
+            assert client.read_word_bit(0x82, 100, 2) == 0
+    finally:
+        client.close()
+
+    assert capsys.readouterr().out == ""
+    # write_bit: 01 02 area addr_hi addr_lo bit 00 01 value
+    assert ok_plc.commands[0] == bytes([0x01, 0x02, 0xB0, 0, 10, 3, 0, 1, 1])
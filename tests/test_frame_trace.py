@@ -0,0 +1,89 @@
+# tests/test_frame_trace.py
+"""
+FINS 프레임 trace ring buffer / dump 파일 테스트
+
+사용 예:
+    python -m pytest tests
+"""
+import re
+
+from src.communication.frame_trace import FrameTracer
+from src.config.settings import FRAME_TRACE_SETTINGS
+
+
+def _record(tracer, i, status="0000"):
+    request = bytes([0x80, 0, 2, 0, 1, 0, 0, 3, 0, i & 255, 1, 1])
+    response = None if status == "timeout" else request[:10] + bytes([1, 1, 0, 0])
+    tracer.record(i & 255, request, response, 100.0 + i, None if response is None else 100.0 + i + 0.0015, status)
+
+
+def test_ring_before_wrap():
+    tracer = FrameTracer("t", capacity=4)
+    assert len(tracer) == 0 and tracer.frames() == []
+    for i in range(3):
+        _record(tracer, i)
+    assert len(tracer) == 3
+    assert [f[2] for f in tracer.frames()] == [0, 1, 2]
+
+
+def test_ring_overwrite_order_after_wrap():
+    tracer = FrameTracer("t", capacity=4)
+    for i in range(10):
+        _record(tracer, i)
+    # 최근 4개만, 오래된 것 → 최신 순
+    assert len(tracer) == 4
+    assert [f[2] for f in tracer.frames()] == [6, 7, 8, 9]
+
+    _record(tracer, 10)
+    assert [f[2] for f in tracer.frames()] == [7, 8, 9, 10]
+
+    # 정확히 capacity의 배수만큼 기록한 경우
+    tracer = FrameTracer("t", capacity=4)
+    for i in range(8):
+        _record(tracer, i)
+    assert [f[2] for f in tracer.frames()] == [4, 5, 6, 7]
+
+
+def test_dump_file_contents(tmp_path):
+    tracer = FrameTracer("plc", capacity=3)
+    for i in range(4):
+        _record(tracer, i)
+    _record(tracer, 4, status="timeout")
+
+    path = tracer.dump(tmp_path / "trace.txt", reason="test")
+    assert path == tmp_path / "trace.txt"
+    lines = path.read_text(encoding="utf-8").splitlines()
+
+    assert lines[0] == "# frame trace: plc, 사유: test, 프레임 3개 (누적 5)"
+    assert lines[1].startswith("# 송신 시각 | RTT ms | SID | 상태")
+    assert len(lines) == 2 + 3
+
+    line = re.compile(r"^\d\d:\d\d:\d\d\.\d{3} \| (.{8}) \| (.{3}) \| (.{7}) \| ([0-9a-f]+) \| ([0-9a-f]+|-)$")
+    rows = [line.match(text).groups() for text in lines[2:]]
+    assert [int(sid) for _, sid, _, _, _ in rows] == [2, 3, 4]
+    assert rows[0][0] == "    1.50" and rows[0][2] == "   0000"
+    request = bytes([0x80, 0, 2, 0, 1, 0, 0, 3, 0, 2, 1, 1])
+    assert rows[0][3] == request.hex() and rows[0][4] == (request[:10] + bytes([1, 1, 0, 0])).hex()
+    assert rows[2][0] == "       -" and rows[2][2] == "timeout" and rows[2][4] == "-"
+
+
+def test_dump_failure_returns_none(tmp_path):
+    tracer = FrameTracer("plc", capacity=2)
+    assert tracer.dump(tmp_path / "missing_dir" / "trace.txt") is None
+
+
+def test_auto_dump_interval(tmp_path, monkeypatch):
+    monkeypatch.setitem(FRAME_TRACE_SETTINGS, 'DUMP_DIR', str(tmp_path))
+    monkeypatch.setitem(FRAME_TRACE_SETTINGS, 'AUTO_DUMP', True)
+    monkeypatch.setitem(FRAME_TRACE_SETTINGS, 'AUTO_DUMP_MIN_INTERVAL', 60)
+    tracer = FrameTracer("plc", capacity=2)
+    _record(tracer, 0, status="timeout")
+
+    first = tracer.auto_dump("timeout")
+    assert first is not None and first.startswith(str(tmp_path))
+    assert tracer.auto_dump("timeout") is None   # 최소 간격 안
+    assert len(list(tmp_path.iterdir())) == 1
+
+    monkeypatch.setitem(FRAME_TRACE_SETTINGS, 'AUTO_DUMP', False)
+    tracer._last_auto_dump = None
+    assert tracer.auto_dump("timeout") is None
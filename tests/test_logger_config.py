@@ -0,0 +1,133 @@
+# tests/test_logger_config.py
+"""
+queue 기반 로깅 테스트 (rate limit, queue 가득 참 경고, 프로세스 풀 worker 로그)
+
+사용 예:
+    python -m pytest tests
+"""
+import logging
+import multiprocessing
+import os
+import queue
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+from src.utils.logger_config import (
+    _ModuleFileRouter, _NonBlockingQueueHandler, _RateLimitFilter,
+    setup_logger, logging_initializer, worker_log_queue,
+)
+
+
+def _record(name="mod", level=logging.DEBUG, lineno=10, msg="row %s"):
+    return logging.LogRecord(name, level, "mod.py", lineno, msg, (1,), None)
+
+
+def test_rate_limit_per_call_site():
+    limit = _RateLimitFilter({logging.DEBUG: 3}, interval=60)
+    passed = [limit.filter(_record()) for _ in range(10)]
+    assert passed == [True] * 3 + [False] * 7
+    # 다른 호출 위치 / INFO는 별도
+    assert limit.filter(_record(lineno=11))
+    assert all(limit.filter(_record(level=logging.INFO)) for _ in range(10))
+
+
+def test_rate_limit_reports_suppressed_count():
+    limit = _RateLimitFilter({logging.DEBUG: 1}, interval=60)
+    assert limit.filter(_record())
+    assert not limit.filter(_record())
+    assert not limit.filter(_record())
+    for site in limit._sites.values():
+        site[0] -= 60   # 다음 interval로 넘어간 것처럼
+    record = _record()
+    assert limit.filter(record)
+    assert "2건 생략" in record.getMessage()
+
+
+def test_rate_limit_threads():
+    limit = _RateLimitFilter({logging.DEBUG: 50}, interval=60)
+    passed = []
+
+    def worker():
+        passed.append(sum(limit.filter(_record()) for _ in range(1000)))
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert sum(passed) == 50
+
+
+class _ListHandler(logging.Handler):
+    def __init__(self):
+        super().__init__(logging.DEBUG)
+        self.records = []
+
+    def emit(self, record):
+        self.records.append(record)
+
+
+def test_drop_notice_bypasses_full_queue(tmp_path):
+    log_queue = queue.Queue(maxsize=1)
+    queue_handler = _NonBlockingQueueHandler(log_queue)
+    console = _ListHandler()
+    router = _ModuleFileRouter(queue_handler, console)
+    router.log_dirs["mod"] = router.log_dirs["logger_config"] = str(tmp_path)
+
+    queue_handler.handle(_record(level=logging.INFO))
+    queue_handler.handle(_record(level=logging.INFO))   # queue 가득 참 → 버림
+    assert queue_handler.dropped == 1
+
+    try:
+        router.emit(_record(level=logging.INFO))
+        router.emit(_record(level=logging.INFO))
+    finally:
+        router.close()
+
+    # 경고는 1번만, queue에는 다시 들어가지 않음
+    notices = [r for r in console.records if r.name == "logger_config"]
+    assert len(notices) == 1 and "누적 1건" in notices[0].getMessage()
+    assert queue_handler.dropped == 1 and log_queue.qsize() == 1
+    assert "누적 1건" in (tmp_path / "logger_config.log").read_text(encoding="utf-8")
+
+
+def _log_in_worker(name, log_dir, tag):
+    setup_logger(name, log_dir).info(f"worker {tag} pid={os.getpid()}")
+    return os.getpid()
+
+
+def _wait_for_lines(path, tag, count, timeout=10.0):
+    """listener 스레드가 기록할 때까지 대기 → tag가 들어간 줄 목록"""
+    deadline = time.monotonic() + timeout
+    while True:
+        lines = []
+        if path.exists():
+            lines = [line for line in path.read_text(encoding="utf-8").splitlines() if tag in line]
+        if len(lines) >= count or time.monotonic() > deadline:
+            return lines
+        time.sleep(0.05)
+
+
+@pytest.mark.parametrize("method, initializer", [("fork", True), ("spawn", True), ("fork", False)])
+def test_worker_records_land_in_file(tmp_path, method, initializer):
+    if method not in multiprocessing.get_all_start_methods():
+        pytest.skip(f"{method} 방식 없음")
+
+    name = f"worker_{method}_{int(initializer)}"
+    log_dir = str(tmp_path)
+    logger = setup_logger(name, log_dir)
+    logger.info(f"parent {name}")
+
+    context = multiprocessing.get_context(method)
+    kwargs = {"initializer": logging_initializer, "initargs": (worker_log_queue(context),)} if initializer else {}
+    with ProcessPoolExecutor(max_workers=2, mp_context=context, **kwargs) as pool:
+        pids = set(pool.map(_log_in_worker, [name] * 4, [log_dir] * 4, range(4)))
+    assert os.getpid() not in pids
+
+    lines = _wait_for_lines(tmp_path / f"{name}.log", name, 5)
+    assert len(lines) == 5
+    for tag in range(4):
+        assert sum(f"worker {tag} pid=" in line for line in lines) == 1
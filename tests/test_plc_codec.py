@@ -0,0 +1,101 @@
+# tests/test_plc_codec.py
+"""
+PLC word codec 테스트 (word 순서 / 부호 / scale / 범위)
+
+사용 예:
+    python -m pytest tests
+"""
+import numpy as np
+import pytest
+
+from src.utils.plc_codec import (
+    HIGH_FIRST, LOW_FIRST, BlockSchema, TagField,
+    bytes_to_words, decode_words, encode_values, to_int16, words_to_bytes,
+)
+
+
+@pytest.mark.parametrize("word_order", [LOW_FIRST, HIGH_FIRST])
+@pytest.mark.parametrize("tag_type, values", [
+    ("UINT16", [0, 1, 32768, 65535]),
+    ("INT16", [0, 1, -1, -32768, 32767]),
+    ("UINT32", [0, 1, 65536, 4294967295]),
+    ("DINT", [0, 1, -1, -2147483648, 2147483647, -123456]),
+    ("REAL", [0.0, 1.5, -2.25, 123.375, -1e-3]),
+])
+def test_round_trip(tag_type, values, word_order):
+    words = encode_values(values, tag_type, word_order=word_order)
+    assert words.dtype == np.uint16
+    decoded = decode_words(words, tag_type, word_order=word_order)
+    assert np.allclose(decoded, np.asarray(values, dtype=decoded.dtype))
+
+    # FINS bytes 경유
+    assert np.array_equal(bytes_to_words(words_to_bytes(words)), words)
+
+
+def test_word_order_layout():
+    # 0x12345678: LOW_FIRST → [0x5678, 0x1234], HIGH_FIRST → [0x1234, 0x5678]
+    assert encode_values([0x12345678], "DINT", word_order=LOW_FIRST).tolist() == [0x5678, 0x1234]
+    assert encode_values([0x12345678], "DINT", word_order=HIGH_FIRST).tolist() == [0x1234, 0x5678]
+    assert decode_words([0x5678, 0x1234], "DINT", word_order=LOW_FIRST).tolist() == [0x12345678]
+    assert decode_words([0x5678, 0x1234], "DINT", word_order=HIGH_FIRST).tolist() == [0x56781234]
+
+    # -2 (DINT) = 0xFFFFFFFE
+    assert encode_values([-2], "DINT", word_order=LOW_FIRST).tolist() == [0xFFFE, 0xFFFF]
+    # 1.0 (REAL) = 0x3F800000
+    assert encode_values([1.0], "REAL", word_order=LOW_FIRST).tolist() == [0x0000, 0x3F80]
+    assert encode_values([1.0], "REAL", word_order=HIGH_FIRST).tolist() == [0x3F80, 0x0000]
+
+
+def test_negative_int16():
+    assert encode_values([-1, -32768, 5], "INT16").tolist() == [0xFFFF, 0x8000, 5]
+    assert decode_words([0xFFFF, 0x8000, 5], "INT16").tolist() == [-1, -32768, 5]
+    assert to_int16(0xFFFF) == -1 and to_int16(32767) == 32767 and to_int16(32768) == -32768
+    assert to_int16(np.array([0xFFFE, 1], dtype=np.uint16)).tolist() == [-2, 1]
+
+    # 파라미터 write-back과 같은 2차원 int16 배열 (행: P1 / P2, 열: zone)
+    params = np.array([[-5, 10, 0], [300, -300, 1]], dtype=np.int16)
+    words = encode_values(params, "INT16")
+    assert words.shape == params.shape
+    assert np.array_equal(decode_words(words, "INT16"), params)
+
+
+def test_scaled_fields():
+    # 온도 x10 정수 (123.4도 → 1234), offset
+    assert encode_values([123.4, -0.5], "INT16", scale=10).tolist() == [1234, 0xFFFB]
+    assert decode_words([1234, 0xFFFB], "INT16", scale=10).tolist() == [123.4, -0.5]
+    words = encode_values([20.0, 25.5], "UINT16", scale=10, offset=-40.0)
+    assert words.tolist() == [600, 655]
+    assert decode_words(words, "UINT16", scale=10, offset=-40.0).tolist() == [20.0, 25.5]
+
+    schema = BlockSchema([
+        TagField("PV", 0, count=2, tag_type="INT16", scale=10),
+        TagField("COUNT", 4, count=1, tag_type="DINT", word_order=HIGH_FIRST),
+        TagField("GAIN", 6, count=1, tag_type="REAL"),
+    ])
+    assert schema.word_count == 8
+    words = schema.encode({"PV": [-12.3, 456.7], "COUNT": [70000], "GAIN": [0.5]})
+    assert words.tolist()[:2] == [0xFF85, 4567] and words.tolist()[2:4] == [0, 0]
+    block = schema.decode(words)
+    assert np.allclose(block["PV"], [-12.3, 456.7])
+    assert block["COUNT"].tolist() == [70000]
+    assert block["GAIN"].tolist() == [0.5]
+
+
+@pytest.mark.parametrize("tag_type, values, scale", [
+    ("INT16", [32768], 1),
+    ("INT16", [-32769], 1),
+    ("INT16", [3276.8], 10),      # scale 후 32768
+    ("UINT16", [-1], 1),
+    ("UINT16", [65536], 1),
+    ("DINT", [2 ** 31], 1),
+    ("INT16", [float("nan")], 1),
+    ("REAL", [1e39], 1),
+])
+def test_out_of_range_raises(tag_type, values, scale):
+    with pytest.raises(ValueError):
+        encode_values(values, tag_type, scale=scale)
+
+
+def test_unknown_tag_type():
+    with pytest.raises(ValueError):
+        decode_words([0], "LREAL")
@@ -0,0 +1,131 @@
+# tests/test_plc_snapshot.py
+"""
+PLC 스냅샷 파일 형식 / diff / restore 테스트
+
+사용 예:
+    python -m pytest tests
+"""
+import argparse
+import io
+import struct
+
+import numpy as np
+import pytest
+
+from src.config.settings import PLC_SETTINGS
+from src.tools.plc_snapshot import (
+    AREA_NAMES, FILE_HEADER, MAGIC, RANGE_HEADER, VERSION,
+    diff, parse_range, read_snapshot, restore, write_snapshot,
+)
+
+RANGES = [
+    (0xA0, 17550, np.array([0, 1, 0x7FFF, 0x8000, 0xFFFF], dtype=np.uint16)),
+    (0xAF, 0, np.arange(3, dtype=np.uint16)),
+    (0xA0, 20000, np.zeros(0, dtype=np.uint16)),
+]
+
+
+class _RecordingClient:
+    """write_block 호출만 기록하는 client (fail_at번째 호출은 실패)"""
+    def __init__(self, fail_at=None):
+        self.writes = []
+        self.fail_at = fail_at
+
+    def write_block(self, mem_area, word_addr, words):
+        self.writes.append((mem_area, word_addr, list(words)))
+        return len(self.writes) != self.fail_at
+
+
+def test_write_read_round_trip(tmp_path):
+    path = tmp_path / "before.snap"
+    write_snapshot(path, RANGES, created=1700000000.5)
+
+    created, ranges = read_snapshot(path)
+    assert created == 1700000000.5
+    assert len(ranges) == len(RANGES)
+    for (area, start, words), (area2, start2, words2) in zip(RANGES, ranges):
+        assert (area, start) == (area2, start2)
+        assert words2.dtype == np.uint16 and np.array_equal(words, words2)
+
+
+def test_file_layout(tmp_path):
+    path = tmp_path / "layout.snap"
+    write_snapshot(path, RANGES[:1], created=1.0)
+    data = path.read_bytes()
+
+    # >8sHHd 헤더 + >BxII range 헤더 + big-endian word
+    assert FILE_HEADER.size == 20 and RANGE_HEADER.size == 10
+    assert data[:FILE_HEADER.size] == struct.pack(">8sHHd", MAGIC, VERSION, 1, 1.0)
+    assert data[20:30] == bytes([0xA0, 0]) + (17550).to_bytes(4, "big") + (5).to_bytes(4, "big")
+    assert data[30:] == bytes.fromhex("0000 0001 7fff 8000 ffff")
+
+
+def test_read_rejects_other_files(tmp_path):
+    path = tmp_path / "bad.snap"
+    path.write_bytes(struct.pack(">8sHHd", b"NOTASNAP", VERSION, 0, 0.0))
+    with pytest.raises(ValueError):
+        read_snapshot(path)
+    path.write_bytes(struct.pack(">8sHHd", MAGIC, VERSION + 1, 0, 0.0))
+    with pytest.raises(ValueError):
+        read_snapshot(path)
+
+
+def test_parse_range():
+    assert parse_range("0xA0:17550:6400") == (0xA0, 17550, 6400)
+    assert parse_range("dm:0x10:4") == (0x82, 16, 4)
+    assert parse_range("EM:0:1") == (PLC_SETTINGS['HEARTBEAT_MEMORY_AREA'], 0, 1)
+    assert AREA_NAMES["EM"] == 0xAF
+    with pytest.raises(argparse.ArgumentTypeError):
+        parse_range("0xA0:10")
+
+
+def test_diff_words_and_bits():
+    before = [(0xA0, 100, np.array([1, 2, 3, 4], dtype=np.uint16)), (0xB0, 0, np.array([7], dtype=np.uint16))]
+    # 겹치는 주소(102~103)만 비교, 0xB0은 after에 없음
+    after = [(0xA0, 102, np.array([3, 0x0005, 9], dtype=np.uint16))]
+
+    out = io.StringIO()
+    assert diff(before, after, out=out) == 1
+    assert out.getvalue().splitlines() == [
+        "0XA0 103: 4 -> 5 (0x0004 -> 0x0005)",
+        "변경된 word: 1",
+    ]
+
+    out = io.StringIO()
+    assert diff(before, after, bits=True, out=out) == 1
+    assert out.getvalue().splitlines() == [
+        "0XA0 103.00: 0 -> 1",
+        "변경된 word: 1",
+    ]
+
+    out = io.StringIO()
+    assert diff(before, before, out=out) == 0
+    assert out.getvalue() == "변경된 word: 0\n"
+
+
+def test_restore_all_ranges():
+    client = _RecordingClient()
+    assert restore(client, RANGES[:2])
+    assert client.writes == [
+        (0xA0, 17550, [0, 1, 0x7FFF, 0x8000, 0xFFFF]),
+        (0xAF, 0, [0, 1, 2]),
+    ]
+
+
+def test_restore_selected_range():
+    client = _RecordingClient()
+    # 스냅샷 17550~17554 중 17552~17553, 다른 영역 spec은 무시
+    assert restore(client, RANGES[:2], specs=[(0xA0, 17552, 2), (0x82, 0, 10)])
+    assert client.writes == [(0xA0, 17552, [0x7FFF, 0x8000])]
+
+    client = _RecordingClient()
+    assert not restore(client, RANGES[:2], specs=[(0xA0, 0, 10)])
+    assert client.writes == []
+
+
+def test_restore_dry_run_and_failure():
+    assert restore(None, RANGES[:2], dry_run=True)
+
+    client = _RecordingClient(fail_at=1)
+    assert not restore(client, RANGES[:2])
+    assert len(client.writes) == 1   # 첫 쓰기 실패 후 중단
@@ -0,0 +1,40 @@
+# tests/test_render_reports.py
+"""
+리포트 렌더링 테스트 (CSV에 없는 signal 컬럼 포함)
+
+사용 예:
+    python -m pytest tests
+"""
+import csv
+
+import pytest
+
+pytest.importorskip("matplotlib")
+
+from src.tools.render_reports import render_job
+from src.utils.tuning_engine import run_zone_count
+from tests.test_tuning_engine import drop_signal, make_rows
+
+
+def _write(path, rows):
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        csv.writer(f).writerows(rows)
+    return str(path)
+
+
+@pytest.mark.parametrize("missing", [None, "CTC", "SP"])
+def test_render_job_with_missing_signal(tmp_path, missing):
+    rows = make_rows(300)
+    if missing:
+        rows = drop_signal(rows, missing)
+    paths = {
+        "normal": _write(tmp_path / "normal.csv", rows),
+        "high": _write(tmp_path / "high.csv", make_rows(300)),
+    }
+
+    written = render_job(1, 7, paths, tmp_path / "out", fmt="png", dpi=40)
+
+    # summary 1장 + area별 zone 그래프 (SP 컬럼이 없으면 zone 수는 설정값)
+    assert len(written) == 1 + run_zone_count(rows) + 4
+    assert all((tmp_path / "out" / "T1_7").joinpath(name).exists()
+               for name in ("summary.png", "normal_Z1.png", "high_Z4.png"))
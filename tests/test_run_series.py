@@ -0,0 +1,100 @@
+# tests/test_run_series.py
+"""
+그래프용 RunSeries 테스트 (CSV에 없는 signal 컬럼 / 빈 샘플 포함)
+
+사용 예:
+    python -m pytest tests
+"""
+import csv
+
+import numpy as np
+
+from src.utils.decimation import minmax_indices
+from src.utils.graph_axes import data_range
+from src.utils.run_loader import read_run_series
+from src.utils.run_series import RunSeries
+from tests.test_tuning_engine import drop_signal, make_rows, non_numeric, short_rows
+
+
+def test_rows_and_buffer_columns_match():
+    rows = make_rows(200)
+    series = RunSeries.from_rows(rows)
+    assert series.zones == 4 and series.length == 200
+    assert series.missing == ()
+    sp, ptc, ctc, ptc_max = series.zone(2)
+    assert sp[0] == float(rows[1][3 + 8 + 1])
+    assert ptc_max == float(ptc.max())
+
+
+def test_missing_ctc_column_is_not_plotted():
+    rows = drop_signal(make_rows(200), "CTC")
+    series = RunSeries.from_rows(rows)
+
+    assert series.missing == ("CTC",)
+    assert series.length == 200
+    assert series.ctc is None and series.ptc.shape == (4, 200)
+    assert series.ptc_max.tolist() == series.ptc.max(axis=1).tolist()
+    # y 범위에 0.0이 끼지 않음
+    assert series.y_range == (float(min(series.sp.min(), series.ptc.min())), float(max(series.sp.max(), series.ptc.max())))
+    sp, ptc, ctc, ptc_max = series.zone(1)
+    assert len(sp) == len(ptc) == 200 and ctc is None
+    assert ptc_max == float(ptc.max())
+
+
+def test_missing_ptc_column_has_no_ptc_max():
+    series = RunSeries.from_rows(drop_signal(make_rows(200), "PTC"))
+    sp, ptc, ctc, ptc_max = series.zone(2)
+    assert ptc is None and ptc_max is None
+    assert sp is not None and ctc is not None
+
+
+def test_old_format_header_without_signal_columns():
+    # 이전 형식: 'ZONEn (SP)' 헤더만 있고 SP1 / PTC1 / CTC1 컬럼 없음
+    header = ["time", "tube", "job"] + [f"ZONE{z + 1} (SP)" for z in range(4)]
+    rows = [header] + [[f"t{i}", "1", "7"] + ["100.0"] * 4 for i in range(50)]
+    series = RunSeries.from_rows(rows)
+
+    assert series.zones == 4 and series.length == 50
+    assert set(series.missing) == {"SP", "PTC", "CTC"}
+    assert series.y_range is None
+    assert series.zone(4) == (None, None, None, None)
+
+
+def test_bad_samples_are_nan():
+    rows = short_rows(non_numeric(make_rows(400)))
+    series = RunSeries.from_rows(rows)
+    clean = RunSeries.from_rows(make_rows(400))
+
+    # 짧은 행(37행마다) → 뒤쪽 절반 컬럼(SP 일부 / MV)이 NaN, 숫자가 아닌 값 → 그 셀만 NaN
+    assert np.isnan(series.sp[:, 0]).all()
+    assert np.isnan(series.ptc[0, 69]) and np.isnan(series.ptc[1, 74])
+    assert not np.isnan(series.ptc[0, 68])
+    assert not (series.ptc == 0.0).any() and not (series.sp == 0.0).any()
+
+    ok = ~np.isnan(series.ptc)
+    assert np.array_equal(series.ptc[ok], clean.ptc[ok])
+    assert np.array_equal(series.ptc_max, np.fmax.reduce(series.ptc, axis=1))
+    assert series.y_range[0] > 0.0
+    assert series.y_range == data_range((series.sp, series.ptc, series.ctc))
+
+
+def test_decimation_keeps_gaps():
+    y = np.sin(np.arange(5000) / 50.0)
+    y[1000:1010] = np.nan   # 다운샘플링 구간(250) 보다 짧은 빈 구간
+    idx = minmax_indices(y, 0, len(y), 20)
+    assert np.isnan(y[idx]).sum() == 1
+    finite = idx[~np.isnan(y[idx])]
+    assert np.nanmax(y) == y[finite].max() and np.nanmin(y) == y[finite].min()
+
+
+def test_read_run_series_missing_column(tmp_path):
+    path = tmp_path / "temperature_T1_7_normal_20250101_000000.csv"
+    rows = drop_signal(make_rows(5000), "CTC")
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        csv.writer(f).writerows(rows)
+
+    series = read_run_series(path, chunk_rows=1000)
+    expected = RunSeries.from_rows(rows)
+    assert series.length == 5000 and series.missing == ("CTC",)
+    assert np.array_equal(series.ptc, expected.ptc)
+    assert series.ctc is None
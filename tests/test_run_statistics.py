@@ -0,0 +1,95 @@
+# tests/test_run_statistics.py
+"""
+zone별 running 통계 / 편차 경보 hysteresis 테스트
+
+사용 예:
+    python -m pytest tests
+"""
+import numpy as np
+import pytest
+
+from src.utils.run_statistics import RunningStats, ZoneStatistics
+
+
+@pytest.mark.parametrize("n", [1, 2, 5000])
+def test_running_stats_matches_numpy(n):
+    rng = np.random.default_rng(n)
+    data = rng.normal(600.0, 25.0, size=(n, 8)) + rng.uniform(-1e3, 1e3, size=8)
+
+    stats = RunningStats(8)
+    for row in data:
+        stats.update(row)
+
+    assert stats.count == n
+    assert np.allclose(stats.mean, data.mean(axis=0), rtol=0, atol=1e-9)
+    expected_var = data.var(axis=0, ddof=1) if n > 1 else np.zeros(8)
+    assert np.allclose(stats.variance, expected_var, rtol=1e-9, atol=1e-9)
+    assert np.allclose(stats.std, np.sqrt(expected_var), rtol=1e-9, atol=1e-9)
+    assert np.array_equal(stats.min, data.min(axis=0))
+    assert np.array_equal(stats.max, data.max(axis=0))
+    assert np.array_equal(stats.last, data[-1])
+
+
+def test_running_stats_ewma_and_empty_snapshot():
+    stats = RunningStats(2, ewma_alpha=0.5)
+    assert stats.snapshot()["mean"] == [0.0, 0.0]
+    for x in ([4.0, 0.0], [8.0, 2.0], [0.0, 2.0]):
+        stats.update(x)
+    # 4 → 4 + 0.5*(8-4)=6 → 6 + 0.5*(0-6)=3
+    assert stats.ewma.tolist() == [3.0, 1.5]
+
+
+UPPER, LOWER, HYST = 10.0, -10.0, 2.0
+
+
+def _alarm_run(deviations, zones=1):
+    """PTC-SP 편차를 차례로 넣고 (샘플 번호, state) 이벤트 목록 반환 (SP = 0 → 편차 = PTC)"""
+    events = []
+    monitor = ZoneStatistics(
+        zones, callback=events.append,
+        limits={"PTC-SP": (LOWER, UPPER)}, hysteresis=HYST,
+    )
+    zeros = np.zeros(zones)
+    for d in deviations:
+        monitor.update(np.full(zones, d), zeros, zeros)
+    return monitor, [(e.sample_index, e.state) for e in events], events
+
+
+def test_alarm_on_off_at_exact_thresholds():
+    # 상한과 같음 → 경보 아님, 넘으면 ON
+    # 해제: upper - hysteresis(8.0)와 같음 → 유지, 더 내려가면 OFF
+    monitor, transitions, events = _alarm_run([UPPER, UPPER + 0.5, UPPER - HYST, UPPER - HYST - 0.5])
+    assert transitions == [(1, 1), (3, 0)]
+    assert events[0].limit == UPPER and events[0].zone == 1 and events[0].signal == "PTC-SP"
+    assert events[1].limit == UPPER   # 해제 이벤트도 어느 쪽 기준인지 표시
+    assert monitor.active_alarms() == []
+
+    # 하한: 같음 → 아님, 미만 → ON, lower + hysteresis(-8.0)와 같음 → 유지, 위로 → OFF
+    _, transitions, events = _alarm_run([LOWER, LOWER - 0.5, LOWER + HYST, LOWER + HYST + 0.5])
+    assert transitions == [(1, -1), (3, 0)]
+    assert events[0].limit == LOWER and events[1].limit == LOWER
+
+
+def test_single_noisy_sample_does_not_toggle():
+    # 경보 중 기준 근처 흔들림 (hysteresis 안쪽) → 이벤트 없음
+    noisy = [UPPER + 1.0, UPPER - 1.0, UPPER + 0.1, UPPER - HYST + 0.1, UPPER + 0.3]
+    monitor, transitions, _ = _alarm_run(noisy)
+    assert transitions == [(0, 1)]
+    assert monitor.active_alarms() == [("PTC-SP", 1, 1)]
+
+    # 정상 중 기준 바로 아래 샘플 → 이벤트 없음
+    _, transitions, _ = _alarm_run([0.0, UPPER - 0.01, UPPER, 0.0, LOWER])
+    assert transitions == []
+
+
+def test_alarm_jumps_to_opposite_side_and_per_zone():
+    # 상한 경보 중 한 샘플에 하한 아래로 → 바로 하한 경보 (해제 이벤트 없이 state -1)
+    _, transitions, _ = _alarm_run([UPPER + 1.0, LOWER - 1.0])
+    assert transitions == [(0, 1), (1, -1)]
+
+    events = []
+    monitor = ZoneStatistics(3, callback=events.append, limits={"PTC-SP": (LOWER, UPPER)}, hysteresis=HYST)
+    zeros = np.zeros(3)
+    monitor.update(np.array([11.0, 0.0, -11.0]), zeros, zeros)
+    assert [(e.zone, e.state) for e in events] == [(1, 1), (3, -1)]
+    assert monitor.active_alarms() == [("PTC-SP", 1, 1), ("PTC-SP", 3, -1)]
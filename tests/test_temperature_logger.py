@@ -0,0 +1,83 @@
+# tests/test_temperature_logger.py
+"""
+온도 블록 주소 구성 / CSV 헤더 테스트 (zone 16개 이상 포함)
+
+사용 예:
+    python -m pytest tests
+"""
+import numpy as np
+import pytest
+
+from src.utils.acquisition_engine import AcquisitionEngine, TEMP_TRIGGER_BIT, TEMP_AREA_NORMAL_BIT
+from src.utils.run_buffer import build_csv_header, SIGNALS
+from src.utils.temperature_logger import temperature_block_schema
+
+
+@pytest.mark.parametrize("zones, stride", [(16, 10), (17, 16), (32, 20)])
+def test_schema_rejects_overlapping_blocks(zones, stride):
+    with pytest.raises(ValueError):
+        temperature_block_schema(zones, stride)
+
+
+@pytest.mark.parametrize("zones, stride", [(8, 10), (16, 16), (16, 20), (32, 40)])
+def test_schema_layout(zones, stride):
+    schema = temperature_block_schema(zones, stride)
+    assert [f.name for f in schema.fields] == list(SIGNALS)
+    assert [f.word_offset for f in schema.fields] == [k * stride for k in range(len(SIGNALS))]
+    assert schema.word_count == 3 * stride + zones
+
+    # signal k, zone z word = k * 1000 + z → 각 signal이 자기 주소의 값만 읽는지 확인
+    words = np.zeros(schema.word_count, dtype=np.uint16)
+    for k in range(len(SIGNALS)):
+        words[k * stride:k * stride + zones] = k * 1000 + np.arange(zones)
+    block = schema.decode(words)
+    for k, name in enumerate(SIGNALS):
+        expected = k * 1000 + np.arange(zones)
+        if name != "MV":
+            expected = expected / 10
+        assert np.array_equal(block[name], expected)
+
+
+@pytest.mark.parametrize("zones", [8, 16, 32])
+def test_csv_header(zones):
+    header = build_csv_header(zones)
+    assert header[:3] == ["time", "tube", "job"]
+    assert len(header) == 3 + len(SIGNALS) * zones
+    for k, name in enumerate(SIGNALS):
+        start = 3 + k * zones
+        assert header[start:start + zones] == [f"{name}{z + 1}" for z in range(zones)]
+
+
+class _TriggerOnConnector:
+    """온도 트리거 ON + Normal 영역 비트만 1을 반환하는 connector"""
+    def read_trigger_bit(self, mem_area, word_addr, bit_offset):
+        return 1 if bit_offset in (TEMP_TRIGGER_BIT, TEMP_AREA_NORMAL_BIT) else 0
+
+
+class _Listener:
+    def __init__(self):
+        self.refused = []
+        self.started = []
+
+    def on_run_refused(self, temp_area, message):
+        self.refused.append(temp_area)
+
+    def on_run_started(self, temp_area, zones, run_buffer):
+        self.started.append(temp_area)
+
+
+def test_engine_refuses_run_with_overlapping_blocks(monkeypatch, tmp_path):
+    from src.config.settings import TEMPERATURE_TAG_SETTINGS
+    monkeypatch.setitem(TEMPERATURE_TAG_SETTINGS, 'SIGNAL_STRIDE', 10)
+    monkeypatch.chdir(tmp_path)
+
+    engine = AcquisitionEngine(_TriggerOnConnector(), zone_count=16)
+    listener = _Listener()
+    engine.add_listener(listener)
+
+    assert engine.check_trigger_temperature()
+    assert engine.check_trigger_temperature()
+    assert listener.started == []
+    assert listener.refused == ["normal", "normal"]
+    assert engine.run_buffer is None and engine.log_file is None
+    assert not (tmp_path / "temperature_logs").exists()
@@ -0,0 +1,148 @@
+# tests/test_tuning_engine.py
+"""
+튜닝 계산 회귀 테스트
+
+사용 예:
+    python -m pytest tests
+
+- EXPECTED: NumPy 재작성 전(baseline) data_processor_tuning.p_calculation으로 계산해 고정한 값
+  (retain point는 baseline search_temp_retain_point 결과)
+- analyse_run / p_calculation / OnlineTuningState / sweep_run(기본값)이 모두 같은 결과인지 확인
+"""
+import pytest
+
+from src.utils.data_processor_tuning import p_calculation
+from src.utils.tuning_engine import analyse_run, parse_run, OnlineTuningState
+from src.utils.tuning_sweep import sweep_run
+
+SIGNALS = ("PTC", "CTC", "SP", "MV")
+
+
+def make_rows(n_rows, zones=4, ramp=60, step=5):
+    """
+    CSV rows (0번: 헤더, 값은 csv.reader처럼 문자열)
+    SP는 step 샘플마다 40도씩 올라 ramp 이후 유지, PTC는 ramp 직후 overshoot + zone별 offset
+    """
+    header = ["time", "tube", "job"]
+    for name in SIGNALS:
+        header += [f"{name}{z + 1}" for z in range(zones)]
+    rows = [header]
+    for i in range(n_rows):
+        level = min(i, ramp) // step
+        sp = [25.0 + level * 40.0 + z * 10.0 for z in range(zones)]
+        ptc = [
+            sp[z] + ((i * 7 + z * 5) % 13 - 4) * 0.3 + (6.5 if ramp <= i < ramp + 4 else 0.0)
+            + (1.5 + z * 1.1 if i >= ramp else 0.0)
+            for z in range(zones)
+        ]
+        ctc = [sp[z] - 20.0 + z * 3.0 + (i % 5) * 0.2 for z in range(zones)]
+        mv = [(i * 3 + z) % 100 for z in range(zones)]
+        row = [f"t{i}", "1", "7"]
+        row += [f"{v:.1f}" for v in ptc + ctc + sp]
+        row += [str(v) for v in mv]
+        rows.append(row)
+    return rows
+
+
+def short_rows(rows, every=37):
+    """every행마다 뒤쪽 절반 컬럼이 없는 행"""
+    rows = [list(r) for r in rows]
+    for k in range(1, len(rows), every):
+        rows[k] = rows[k][:len(rows[k]) // 2]
+    return rows
+
+
+def non_numeric(rows, every=23):
+    """every행마다 숫자가 아닌 값 1개 + retain point 이후 PTC 평균 구간 / SP1 plateau 안의 값"""
+    rows = [list(r) for r in rows]
+    for k in range(1, len(rows), every):
+        rows[k][3 + (k % (len(rows[k]) - 3))] = "ERR" if k % 2 else ""
+    rows[70][3] = "ERR"
+    rows[75][4] = ""
+    rows[150][3 + 8] = "-"
+    return rows
+
+
+CASES = {
+    "long_plateau": lambda: make_rows(400),
+    "long_plateau_8_zones": lambda: make_rows(300, zones=8, ramp=40),
+    "no_retain_point": lambda: make_rows(120),
+    "short_rows": lambda: short_rows(make_rows(400)),
+    "non_numeric": lambda: non_numeric(make_rows(400)),
+    "two_samples": lambda: make_rows(2),
+}
+
+# case → (P1, Initial P2, P2, retain point)
+EXPECTED = {
+    "long_plateau": ([9, 10, 10, 11], [23, 20, 17, 14], [2, 3, 4, 5], 60),
+    "long_plateau_8_zones": (
+        [8, 9, 11, 12, 13, 13, 16, 17], [23, 20, 17, 14, 11, 8, 5, 2], [2, 3, 4, 5, 6, 7, 8, 10], 40
+    ),
+    "no_retain_point": ([489, 490, 490, 491], [23, 20, 17, 14], [228, 228, 228, 228], 0),
+    "short_rows": ([9, 10, 10, 11], [22, 19, 16, 13], [2, 3, 4, 5], 63),
+    "non_numeric": ([9, 10, 10, 11], [22, 19, 16, 13], [-6, -5, 4, 5], 61),
+    "two_samples": ([0, 0, 0, 0], [23, 20, 17, 14], [0, 2, 0, 1], 0),
+}
+
+
+@pytest.mark.parametrize("name", CASES)
+def test_analyse_run_matches_baseline(name):
+    p1, init_p2, p2, retain_point = EXPECTED[name]
+    summary = analyse_run(CASES[name]())
+    assert summary["p1"] == p1
+    assert summary["init_p2"] == init_p2
+    assert summary["p2"] == p2
+    assert summary["retain_point"] == retain_point
+
+
+@pytest.mark.parametrize("name", CASES)
+def test_p_calculation_matches_baseline(name):
+    p1, init_p2, p2, _ = EXPECTED[name]
+    assert p_calculation(CASES[name]()) == (p1, init_p2, p2)
+
+
+@pytest.mark.parametrize("name", CASES)
+def test_online_state_matches_analyse_run(name):
+    rows = CASES[name]()
+    run = parse_run(rows)
+    state = OnlineTuningState(run.zones)
+    for i in range(run.n_samples):
+        state.update(run.ptc[i], run.ctc[i], run.sp[i])
+
+    expected = analyse_run(rows)
+    summary = state.summary()
+    for key in ("p1", "init_p2", "p2", "retain_point"):
+        assert summary[key] == expected[key], key
+
+
+@pytest.mark.parametrize("name", CASES)
+def test_sweep_run_defaults_match_analyse_run(name):
+    rows = CASES[name]()
+    expected = analyse_run(rows)
+    result = sweep_run(rows)
+    assert result["p1"][0, 0, 0].tolist() == expected["p1"]
+    assert result["init_p2"][0, 0].tolist() == expected["init_p2"]
+    assert result["p2"][0, 0].tolist() == expected["p2"]
+    assert int(result["retain_point"][0]) == expected["retain_point"]
+
+
+def drop_signal(rows, name):
+    """name1 ~ nameN 컬럼을 뺀 rows"""
+    keep = [i for i, column in enumerate(rows[0]) if not column.startswith(name)]
+    return [[row[i] for i in keep] for row in rows]
+
+
+# 컬럼이 없는 signal → baseline *_scrap은 빈 리스트 (값 0.0으로 계산)
+EXPECTED_MISSING = {
+    "CTC": ([9, 10, 10, 11], [508, 518, 528, 538], [2, 3, 4, 5], 60),
+    "PTC": ([0, 0, 0, 0], [23, 20, 17, 14], [-505, -515, -525, -535], 60),
+    "SP": ([514, 525, 535, 546], [-2, -15, -28, -41], [253, 263, 273, 283], 0),
+}
+
+
+@pytest.mark.parametrize("name", EXPECTED_MISSING)
+def test_analyse_run_missing_signal_matches_baseline(name):
+    p1, init_p2, p2, retain_point = EXPECTED_MISSING[name]
+    summary = analyse_run(drop_signal(make_rows(400), name), 4)
+    assert (summary["p1"], summary["init_p2"], summary["p2"]) == (p1, init_p2, p2)
+    assert summary["retain_point"] == retain_point